@@ -0,0 +1,161 @@
+"""LLM response caches keyed by (model, settings, prompt hash).
+
+The same prompt can legitimately be sent more than once (e.g. a committee of
+identical rewrite jobs, or a ranker retry), so responses are stored per
+occurrence of their key. An occurrence is only used up by a hit or by storing
+a successful response, so a failed call leaves the sequence untouched and a
+rerun with the same seed sees the same responses per prompt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import threading
+from collections import defaultdict, deque
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Protocol
+
+log_cache = logging.getLogger("llm.cache")
+
+
+class ReplayMissError(RuntimeError):
+    """The replayed run never sent this prompt (or sent it fewer times)."""
+
+
+class ReplayedCallError(RuntimeError):
+    """The recorded call failed; replay fails it the same way."""
+
+
+class ResponseCache(Protocol):
+    def claim(self, key: str) -> str: ...
+
+    def get(self, slot: str) -> Mapping[str, Any] | None: ...
+
+    def put(self, slot: str, output: Mapping[str, Any]) -> None: ...
+
+
+def response_key(
+    *, model: str, model_settings: Mapping[str, Any] | None, prompt: str
+) -> str:
+    payload = json.dumps(
+        {
+            "model": model,
+            "model_settings": dict(model_settings or {}),
+            "prompt_sha256": hashlib.sha256(prompt.encode("utf-8")).hexdigest(),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskResponseCache:
+    """One JSON file per (key, occurrence) under `root`, shared across runs."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+        self._used: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def claim(self, key: str) -> str:
+        # The occurrence is picked by `get`/`put`, once the outcome is known.
+        return key
+
+    def get(self, slot: str) -> Mapping[str, Any] | None:
+        with self._lock:
+            path = self._path(slot, self._used[slot])
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self.misses += 1
+                return None
+            except Exception:
+                log_cache.exception("Ignoring unreadable cache entry %s.", path)
+                self.misses += 1
+                return None
+            self._used[slot] += 1
+            self.hits += 1
+            return data
+
+    def put(self, slot: str, output: Mapping[str, Any]) -> None:
+        with self._lock:
+            occurrence = self._used[slot]
+            self._used[slot] = occurrence + 1
+        path = self._path(slot, occurrence)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(output, ensure_ascii=False), encoding="utf-8")
+            tmp.replace(path)
+        except Exception:
+            log_cache.exception("Failed to write cache entry %s.", path)
+
+    def _path(self, key: str, occurrence: int) -> Path:
+        return self.root / key[:2] / f"{key}-{occurrence}.json"
+
+
+class ReplayResponseCache:
+    """Serve responses recorded in a run's `llm.jsonl`; never calls out."""
+
+    def __init__(self, entries: Mapping[str, list[Mapping[str, Any] | None]]) -> None:
+        self._entries = {key: deque(items) for key, items in entries.items()}
+        self._slots: dict[str, Mapping[str, Any] | None] = {}
+        self._slot_ids = itertools.count()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_run_dir(cls, run_dir: Path) -> "ReplayResponseCache":
+        entries: dict[str, list[Mapping[str, Any] | None]] = defaultdict(list)
+        index = run_dir / "llm.jsonl"
+        with index.open("r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                    prompt = (run_dir / item["prompt_file"]).read_text(encoding="utf-8")
+                    output = None
+                    if item.get("output_file"):
+                        output = json.loads(
+                            (run_dir / item["output_file"]).read_text(encoding="utf-8")
+                        )
+                except Exception:
+                    log_cache.warning("Skipping unreadable llm.jsonl entry.")
+                    continue
+                key = response_key(
+                    model=item["model"],
+                    model_settings=item.get("model_settings"),
+                    prompt=prompt,
+                )
+                entries[key].append(output)
+        return cls(entries)
+
+    def claim(self, key: str) -> str:
+        with self._lock:
+            queue = self._entries.get(key)
+            slot = f"{key}-{next(self._slot_ids)}"
+            if not queue:
+                self.misses += 1
+                raise ReplayMissError("Prompt not found in the recorded run.")
+            self._slots[slot] = queue.popleft()
+            self.hits += 1
+            return slot
+
+    def get(self, slot: str) -> Mapping[str, Any] | None:
+        with self._lock:
+            output = self._slots.pop(slot)
+        if output is None:
+            raise ReplayedCallError("Recorded call failed.")
+        return output
+
+    def put(self, slot: str, output: Mapping[str, Any]) -> None:
+        """Replay is read-only; `get` never reports a miss to fill."""
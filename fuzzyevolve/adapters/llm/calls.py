@@ -0,0 +1,83 @@
+"""Single entry point for agent calls, so caching applies to every adapter."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_ai import Agent
+
+from fuzzyevolve.adapters.llm import fake
+from fuzzyevolve.adapters.llm.cache import ResponseCache, response_key
+
+
+def run_agent_sync(
+    agent: Agent,
+    prompt: str,
+    *,
+    model: str,
+    model_settings: Mapping[str, Any] | None,
+    cache: ResponseCache | None = None,
+    fake_llm: fake.FakeLLM | None = None,
+) -> Any:
+    """Return the agent's structured output, consulting `cache` first."""
+    slot, cached = _lookup(agent, prompt, model, model_settings, cache)
+    if cached is not None:
+        return cached
+    out = agent.run_sync(
+        prompt, model=_resolve(model, fake_llm), model_settings=model_settings
+    ).output
+    _store(cache, slot, out)
+    return out
+
+
+async def run_agent(
+    agent: Agent,
+    prompt: str,
+    *,
+    model: str,
+    model_settings: Mapping[str, Any] | None,
+    cache: ResponseCache | None = None,
+    fake_llm: fake.FakeLLM | None = None,
+) -> Any:
+    """Async `run_agent_sync`."""
+    slot, cached = _lookup(agent, prompt, model, model_settings, cache)
+    if cached is not None:
+        return cached
+    rsp = await agent.run(
+        prompt, model=_resolve(model, fake_llm), model_settings=model_settings
+    )
+    out = rsp.output
+    _store(cache, slot, out)
+    return out
+
+
+def _resolve(model: str, fake_llm: fake.FakeLLM | None) -> Any:
+    if fake.is_fake_model(model):
+        return fake.fake_model(model, fake_llm)
+    return model
+
+
+def _lookup(
+    agent: Agent,
+    prompt: str,
+    model: str,
+    model_settings: Mapping[str, Any] | None,
+    cache: ResponseCache | None,
+) -> tuple[str | None, Any | None]:
+    if cache is None:
+        return None, None
+    slot = cache.claim(
+        response_key(model=model, model_settings=model_settings, prompt=prompt)
+    )
+    data = cache.get(slot)
+    if data is None:
+        return slot, None
+    return slot, agent.output_type.model_validate(data)
+
+
+def _store(cache: ResponseCache | None, slot: str | None, out: Any) -> None:
+    if cache is None or slot is None or not isinstance(out, BaseModel):
+        return
+    cache.put(slot, out.model_dump(mode="json"))
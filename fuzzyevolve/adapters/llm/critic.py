@@ -8,6 +8,9 @@ from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 from pydantic_ai.settings import ModelSettings
 
+from fuzzyevolve.adapters.llm.cache import ResponseCache
+from fuzzyevolve.adapters.llm.calls import run_agent, run_agent_sync
+from fuzzyevolve.adapters.llm.fake import FakeLLM
 from fuzzyevolve.adapters.llm.prompts import build_critique_prompt
 from fuzzyevolve.core.critique import Critique
 from fuzzyevolve.core.models import Elite
@@ -52,6 +55,8 @@ class LLMCritic:
         show_metric_stats: bool,
         score_lcb_c: float,
         store: Recorder | None = None,
+        response_cache: ResponseCache | None = None,
+        fake_llm: FakeLLM | None = None,
     ) -> None:
         self.model = model
         self.model_settings = model_settings or {"temperature": 0.2}
@@ -63,6 +68,8 @@ class LLMCritic:
         self.show_metric_stats = show_metric_stats
         self.score_lcb_c = score_lcb_c
         self.store = store
+        self.response_cache = response_cache
+        self.fake_llm = fake_llm
 
         self.agent = Agent(
             output_type=CritiqueOutput,
@@ -81,15 +88,52 @@ class LLMCritic:
         *,
         parent: Elite,
     ) -> Critique | None:
-        parent_text_id: str | None = None
-        if self.store:
-            try:
-                parent_text_id = getattr(self.store, "put_text", lambda _t: None)(
-                    parent.text
-                )
-            except Exception:
-                parent_text_id = None
+        parent_text_id = self._parent_text_id(parent)
+        prompt = self._build_prompt(parent)
+        try:
+            out = run_agent_sync(
+                self.agent,
+                prompt,
+                model=self.model,
+                model_settings=self.model_settings,
+                cache=self.response_cache,
+                fake_llm=self.fake_llm,
+            )
+        except Exception:
+            self._on_call_failed(prompt, parent_text_id)
+            return None
+        return self._on_output(out, prompt, parent_text_id)
+
+    async def acritique(
+        self,
+        *,
+        parent: Elite,
+    ) -> Critique | None:
+        parent_text_id = self._parent_text_id(parent)
+        prompt = self._build_prompt(parent)
+        try:
+            out = await run_agent(
+                self.agent,
+                prompt,
+                model=self.model,
+                model_settings=self.model_settings,
+                cache=self.response_cache,
+                fake_llm=self.fake_llm,
+            )
+        except Exception:
+            self._on_call_failed(prompt, parent_text_id)
+            return None
+        return self._on_output(out, prompt, parent_text_id)
 
+    def _parent_text_id(self, parent: Elite) -> str | None:
+        if not self.store:
+            return None
+        try:
+            return getattr(self.store, "put_text", lambda _t: None)(parent.text)
+        except Exception:
+            return None
+
+    def _build_prompt(self, parent: Elite) -> str:
         prompt = build_critique_prompt(
             parent=parent,
             goal=self.goal,
@@ -100,31 +144,27 @@ class LLMCritic:
             score_lcb_c=self.score_lcb_c,
         )
         log_llm.debug("Critic prompt:\n%s", prompt)
+        return prompt
 
-        try:
-            rsp = self.agent.run_sync(
-                prompt,
-                model=self.model,
-                model_settings=self.model_settings,
-            )
-        except Exception:
-            log_llm.exception("Critic call failed; continuing without critique.")
-            if self.store:
-                try:
-                    self.store.record_llm_call(
-                        name="critic",
-                        model=self.model,
-                        model_settings=self.model_settings,
-                        prompt=prompt,
-                        output=None,
-                        error="critic_call_failed",
-                        extra={"parent_text_id": parent_text_id},
-                    )
-                except Exception:
-                    log_llm.exception("Failed to record critic call.")
-            return None
+    def _on_call_failed(self, prompt: str, parent_text_id: str | None) -> None:
+        log_llm.exception("Critic call failed; continuing without critique.")
+        if self.store:
+            try:
+                self.store.record_llm_call(
+                    name="critic",
+                    model=self.model,
+                    model_settings=self.model_settings,
+                    prompt=prompt,
+                    output=None,
+                    error="critic_call_failed",
+                    extra={"parent_text_id": parent_text_id},
+                )
+            except Exception:
+                log_llm.exception("Failed to record critic call.")
 
-        out = rsp.output
+    def _on_output(
+        self, out: CritiqueOutput, prompt: str, parent_text_id: str | None
+    ) -> Critique:
         if self.store:
             try:
                 self.store.record_llm_call(
@@ -0,0 +1,204 @@
+"""Offline stand-in for real models: any `fake:*` model name resolves here.
+
+Responses are schema-valid `RewriteOutput`, `CritiqueOutput` and
+`RankerOutput` objects produced through pydantic-ai's `FunctionModel`, so the
+agent, validation and recording paths run exactly as with a real provider.
+Latency, failure rate and output size come from `[llm.fake]`.
+
+Each response is seeded from (seed, model, prompt, occurrence), so a run is
+reproducible even when calls complete out of order. Settings and occurrence
+counters live on a `FakeLLM` instance; `build_engine` gives every engine its
+own, so engines built in one process never share or reset each other's
+streams.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+import re
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic_ai.messages import ModelMessage, ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+FAKE_PREFIX = "fake:"
+
+_WORDS = (
+    "amber", "lantern", "harbor", "quiet", "signal", "drift", "ember", "north",
+    "paper", "salt", "window", "engine", "river", "static", "glass", "orchard",
+    "thread", "copper", "hollow", "meridian", "ash", "tide", "velvet", "frost",
+)  # fmt: skip
+
+
+class FakeLLMError(RuntimeError):
+    """Injected failure from a fake model."""
+
+
+@dataclass(frozen=True, slots=True)
+class FakeLLMSettings:
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    latency_distribution: str = "fixed"
+    failure_rate: float = 0.0
+    output_chars: int = 800
+    seed: int = 0
+
+
+class FakeLLM:
+    """Fake models for one engine, with their own settings and counters."""
+
+    def __init__(self, settings: FakeLLMSettings | None = None) -> None:
+        self.settings = settings or FakeLLMSettings()
+        self._models: dict[str, FunctionModel] = {}
+        self._occurrences: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def model(self, name: str) -> FunctionModel:
+        with self._lock:
+            model = self._models.get(name)
+            if model is None:
+                model = FunctionModel(self._respond_for(name), model_name=name)
+                self._models[name] = model
+            return model
+
+    def _respond_for(self, name: str):
+        async def respond(
+            messages: list[ModelMessage], info: AgentInfo
+        ) -> ModelResponse:
+            prompt = _last_prompt(messages)
+            settings = self.settings
+            key = f"{name}:{hashlib.sha256(prompt.encode('utf-8')).hexdigest()}"
+            with self._lock:
+                occurrence = self._occurrences[key]
+                self._occurrences[key] = occurrence + 1
+            rng = random.Random(f"{settings.seed}:{key}:{occurrence}")
+
+            delay = sample_latency_s(settings, rng)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if settings.failure_rate > 0 and rng.random() < settings.failure_rate:
+                raise FakeLLMError(f"Injected failure from {name}.")
+
+            if not info.output_tools:
+                raise FakeLLMError("Fake models only support structured output.")
+            tool = info.output_tools[0]
+            schema = tool.parameters_json_schema or {}
+            args = fake_output_args(
+                str(schema.get("title", "")), prompt, rng=rng, settings=settings
+            )
+            return ModelResponse(parts=[ToolCallPart(tool_name=tool.name, args=args)])
+
+        return respond
+
+
+# Used by adapters built without an engine (e.g. directly in tests).
+_default = FakeLLM()
+
+
+def is_fake_model(model: Any) -> bool:
+    return isinstance(model, str) and model.startswith(FAKE_PREFIX)
+
+
+def fake_model(name: str, fake_llm: FakeLLM | None = None) -> FunctionModel:
+    return (fake_llm or _default).model(name)
+
+
+def sample_latency_s(settings: FakeLLMSettings, rng: random.Random) -> float:
+    mean = max(0.0, settings.latency_ms)
+    jitter = max(0.0, settings.latency_jitter_ms)
+    kind = settings.latency_distribution
+    if kind == "fixed" or mean <= 0.0:
+        ms = mean
+    elif kind == "uniform":
+        ms = rng.uniform(mean - jitter, mean + jitter)
+    elif kind == "exponential":
+        ms = rng.expovariate(1.0 / mean)
+    elif kind == "lognormal":
+        # Parameterized so the median is `mean` and `jitter` widens the tail.
+        sigma = jitter / mean if jitter > 0 else 0.5
+        ms = mean * rng.lognormvariate(0.0, sigma)
+    else:
+        raise ValueError(f"Unknown latency distribution '{kind}'.")
+    return max(0.0, ms) / 1000.0
+
+
+def fake_output_args(
+    kind: str, prompt: str, *, rng: random.Random, settings: FakeLLMSettings
+) -> dict[str, Any]:
+    if kind == "RewriteOutput":
+        return {"text": _prose(rng, settings.output_chars)}
+    if kind == "CritiqueOutput":
+        return {
+            "summary": _prose(rng, min(200, settings.output_chars)),
+            "preserve": [_phrase(rng) for _ in range(2)],
+            "issues": [_phrase(rng) for _ in range(3)],
+            "routes": [_phrase(rng) for _ in range(_requested_routes(prompt))],
+            "constraints": [_phrase(rng)],
+        }
+    if kind == "RankerOutput":
+        n, metrics = _rank_request(prompt)
+        return {
+            "rankings": [
+                {"metric": metric, "ranked_tiers": _random_tiers(rng, n)}
+                for metric in metrics
+            ]
+        }
+    raise FakeLLMError(f"No fake output for '{kind or 'unknown'}'.")
+
+
+def _last_prompt(messages: list[ModelMessage]) -> str:
+    for message in reversed(messages):
+        for part in reversed(getattr(message, "parts", [])):
+            content = getattr(part, "content", None)
+            if isinstance(content, str) and part.part_kind == "user-prompt":
+                return content
+    return ""
+
+
+def _rank_request(prompt: str) -> tuple[int, list[str]]:
+    n_match = re.search(r"You are judging (\d+) candidate", prompt)
+    metrics_match = re.search(r"^Metrics: (.+)$", prompt, flags=re.MULTILINE)
+    n = int(n_match.group(1)) if n_match else 0
+    metrics = (
+        [m.strip() for m in metrics_match.group(1).split(",") if m.strip()]
+        if metrics_match
+        else []
+    )
+    return n, metrics
+
+
+def _requested_routes(prompt: str) -> int:
+    match = re.search(r"(\d+) (?:distinct )?(?:rewrite )?routes", prompt)
+    return max(1, min(16, int(match.group(1)))) if match else 3
+
+
+def _random_tiers(rng: random.Random, n: int) -> list[list[int]]:
+    ids = list(range(n))
+    rng.shuffle(ids)
+    tiers: list[list[int]] = []
+    for idx in ids:
+        if tiers and rng.random() < 0.15:
+            tiers[-1].append(idx)
+        else:
+            tiers.append([idx])
+    return tiers
+
+
+def _phrase(rng: random.Random) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 7)))
+
+
+def _prose(rng: random.Random, chars: int) -> str:
+    words: list[str] = []
+    size = 0
+    target = max(1, int(chars))
+    while size < target:
+        word = rng.choice(_WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)[:target].strip()
@@ -9,7 +9,10 @@ from typing import Any, Protocol
 from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 
+from fuzzyevolve.adapters.llm.cache import ResponseCache
+from fuzzyevolve.adapters.llm.calls import run_agent, run_agent_sync
 from fuzzyevolve.adapters.llm.ensemble import ModelEnsemble
+from fuzzyevolve.adapters.llm.fake import FakeLLM
 from fuzzyevolve.adapters.llm.prompts import build_rewrite_prompt
 from fuzzyevolve.config import ModelSpec
 from fuzzyevolve.core.critique import Critique
@@ -55,6 +58,8 @@ class LLMRewriteOperator:
         score_lcb_c: float,
         rng: random.Random | None = None,
         store: Recorder | None = None,
+        response_cache: ResponseCache | None = None,
+        fake_llm: FakeLLM | None = None,
     ) -> None:
         self.name = name
         self.role = role
@@ -67,6 +72,8 @@ class LLMRewriteOperator:
         self.show_metric_stats = show_metric_stats
         self.score_lcb_c = score_lcb_c
         self.store = store
+        self.response_cache = response_cache
+        self.fake_llm = fake_llm
         self._agent_local = threading.local()
         self._agent_instructions = (
             "Generate exactly one rewritten child text.\n"
@@ -93,6 +100,57 @@ class LLMRewriteOperator:
         critique: Critique | None,
         focus: str | None = None,
     ) -> Sequence[str]:
+        prompt = self._build_prompt(parent, partners, critique, focus)
+        model, model_settings = self._pick_model()
+        agent = self._get_agent()
+        try:
+            out = run_agent_sync(
+                agent,
+                prompt,
+                model=model,
+                model_settings=model_settings,
+                cache=self.response_cache,
+                fake_llm=self.fake_llm,
+            )
+        except Exception:
+            return self._on_call_failed(prompt, model, model_settings, focus)
+        return self._on_output(
+            out, prompt, model, model_settings, parent, partners, focus
+        )
+
+    async def apropose(
+        self,
+        *,
+        parent: Elite,
+        partners: Sequence[Elite] | None = None,
+        critique: Critique | None,
+        focus: str | None = None,
+    ) -> Sequence[str]:
+        prompt = self._build_prompt(parent, partners, critique, focus)
+        model, model_settings = self._pick_model()
+        agent = self._get_agent()
+        try:
+            out = await run_agent(
+                agent,
+                prompt,
+                model=model,
+                model_settings=model_settings,
+                cache=self.response_cache,
+                fake_llm=self.fake_llm,
+            )
+        except Exception:
+            return self._on_call_failed(prompt, model, model_settings, focus)
+        return self._on_output(
+            out, prompt, model, model_settings, parent, partners, focus
+        )
+
+    def _build_prompt(
+        self,
+        parent: Elite,
+        partners: Sequence[Elite] | None,
+        critique: Critique | None,
+        focus: str | None,
+    ) -> str:
         prompt = build_rewrite_prompt(
             parent=parent,
             partners=partners,
@@ -108,39 +166,54 @@ class LLMRewriteOperator:
             score_lcb_c=self.score_lcb_c,
         )
         log_llm.debug("Operator '%s' prompt:\n%s", self.name, prompt)
+        return prompt
 
+    def _pick_model(self) -> tuple[str, Mapping[str, Any]]:
         model, model_settings = self.ensemble.pick()
         if self.temperature is not None:
             model_settings = dict(model_settings)
             model_settings["temperature"] = self.temperature
+        return model, model_settings
 
-        agent = self._get_agent()
-        try:
-            rsp = agent.run_sync(prompt, model=model, model_settings=model_settings)
-        except Exception:
-            log_llm.exception(
-                "Operator '%s' call failed; returning no candidates.", self.name
-            )
-            if self.store:
-                try:
-                    self.store.record_llm_call(
-                        name=f"operator.{self.name}",
-                        model=model,
-                        model_settings=model_settings,
-                        prompt=prompt,
-                        output=None,
-                        error="operator_call_failed",
-                        extra={
-                            "operator": self.name,
-                            "role": self.role,
-                            "focus": focus,
-                        },
-                    )
-                except Exception:
-                    log_llm.exception("Failed to record operator call.")
-            return []
+    def _on_call_failed(
+        self,
+        prompt: str,
+        model: str,
+        model_settings: Mapping[str, Any],
+        focus: str | None,
+    ) -> list[str]:
+        log_llm.exception(
+            "Operator '%s' call failed; returning no candidates.", self.name
+        )
+        if self.store:
+            try:
+                self.store.record_llm_call(
+                    name=f"operator.{self.name}",
+                    model=model,
+                    model_settings=model_settings,
+                    prompt=prompt,
+                    output=None,
+                    error="operator_call_failed",
+                    extra={
+                        "operator": self.name,
+                        "role": self.role,
+                        "focus": focus,
+                    },
+                )
+            except Exception:
+                log_llm.exception("Failed to record operator call.")
+        return []
 
-        out = rsp.output
+    def _on_output(
+        self,
+        out: RewriteOutput,
+        prompt: str,
+        model: str,
+        model_settings: Mapping[str, Any],
+        parent: Elite,
+        partners: Sequence[Elite] | None,
+        focus: str | None,
+    ) -> list[str]:
         text = out.text.strip()
         output_text_id: str | None = None
         parent_text_id: str | None = None
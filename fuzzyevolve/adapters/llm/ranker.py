@@ -9,6 +9,9 @@ from pydantic import BaseModel, Field
 from pydantic_ai import Agent
 from pydantic_ai.settings import ModelSettings
 
+from fuzzyevolve.adapters.llm.cache import ResponseCache
+from fuzzyevolve.adapters.llm.calls import run_agent, run_agent_sync
+from fuzzyevolve.adapters.llm.fake import FakeLLM
 from fuzzyevolve.adapters.llm.prompts import build_rank_prompt
 from fuzzyevolve.core.battle import Battle
 from fuzzyevolve.core.ratings import BattleRanking
@@ -58,6 +61,8 @@ class LLMRanker:
         max_attempts: int = 2,
         repair_enabled: bool = True,
         store: Recorder | None = None,
+        response_cache: ResponseCache | None = None,
+        fake_llm: FakeLLM | None = None,
     ) -> None:
         self.model = model
         self.goal = goal or ""
@@ -66,6 +71,8 @@ class LLMRanker:
         self.max_attempts = max(1, max_attempts)
         self.repair_enabled = repair_enabled
         self.store = store
+        self.response_cache = response_cache
+        self.fake_llm = fake_llm
         self.agent = Agent(
             output_type=RankerOutput,
             name="ranker",
@@ -85,6 +92,83 @@ class LLMRanker:
         battle: Battle,
         metric_descriptions: Mapping[str, str] | None = None,
     ) -> BattleRanking:
+        prompt, prompt_id_to_original = self._build_prompt(
+            metrics, battle, metric_descriptions
+        )
+        last_error: str | None = None
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                out = run_agent_sync(
+                    self.agent,
+                    prompt,
+                    model=self.model,
+                    model_settings=self.model_settings,
+                    cache=self.response_cache,
+                    fake_llm=self.fake_llm,
+                )
+            except Exception:
+                last_error = self._on_call_failed(prompt, attempt)
+                continue
+            ranking, prompt, last_error = self._on_output(
+                out,
+                prompt,
+                attempt,
+                metrics=metrics,
+                total_players=len(battle.participants),
+                prompt_id_to_original=prompt_id_to_original,
+            )
+            if ranking is not None:
+                return ranking
+
+        raise RuntimeError(
+            f"Ranker failed after {self.max_attempts} attempts ({last_error or 'unknown error'})."
+        )
+
+    async def arank(
+        self,
+        *,
+        metrics: Sequence[str],
+        battle: Battle,
+        metric_descriptions: Mapping[str, str] | None = None,
+    ) -> BattleRanking:
+        prompt, prompt_id_to_original = self._build_prompt(
+            metrics, battle, metric_descriptions
+        )
+        last_error: str | None = None
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                out = await run_agent(
+                    self.agent,
+                    prompt,
+                    model=self.model,
+                    model_settings=self.model_settings,
+                    cache=self.response_cache,
+                    fake_llm=self.fake_llm,
+                )
+            except Exception:
+                last_error = self._on_call_failed(prompt, attempt)
+                continue
+            ranking, prompt, last_error = self._on_output(
+                out,
+                prompt,
+                attempt,
+                metrics=metrics,
+                total_players=len(battle.participants),
+                prompt_id_to_original=prompt_id_to_original,
+            )
+            if ranking is not None:
+                return ranking
+
+        raise RuntimeError(
+            f"Ranker failed after {self.max_attempts} attempts ({last_error or 'unknown error'})."
+        )
+
+    def _build_prompt(
+        self,
+        metrics: Sequence[str],
+        battle: Battle,
+        metric_descriptions: Mapping[str, str] | None,
+    ) -> tuple[str, dict[int, int]]:
         if len(battle.participants) < 2:
             raise ValueError("Battle must contain at least 2 participants.")
 
@@ -104,85 +188,81 @@ class LLMRanker:
             metric_descriptions=metric_descriptions,
         )
         log_llm.debug("Ranker prompt:\n%s", prompt)
+        return prompt, prompt_id_to_original
 
-        last_error: str | None = None
-        for attempt in range(1, self.max_attempts + 1):
+    def _on_call_failed(self, prompt: str, attempt: int) -> str:
+        """Record a failed call; raise once attempts are exhausted."""
+        log_llm.error(
+            "Ranker call failed outright — attempt %d/%d.",
+            attempt,
+            self.max_attempts,
+        )
+        last_error = "ranker_call_failed"
+        if self.store:
             try:
-                rsp = self.agent.run_sync(
-                    prompt,
+                self.store.record_llm_call(
+                    name="ranker",
                     model=self.model,
                     model_settings=self.model_settings,
+                    prompt=prompt,
+                    output=None,
+                    error="ranker_call_failed",
+                    extra={"attempt": attempt},
                 )
             except Exception:
-                log_llm.error(
-                    "Ranker call failed outright — attempt %d/%d.",
-                    attempt,
-                    self.max_attempts,
-                )
-                last_error = "ranker_call_failed"
-                if self.store:
-                    try:
-                        self.store.record_llm_call(
-                            name="ranker",
-                            model=self.model,
-                            model_settings=self.model_settings,
-                            prompt=prompt,
-                            output=None,
-                            error="ranker_call_failed",
-                            extra={"attempt": attempt},
-                        )
-                    except Exception:
-                        log_llm.exception("Failed to record ranker call.")
-                if attempt >= self.max_attempts:
-                    raise RuntimeError(
-                        f"Ranker failed after {self.max_attempts} attempts ({last_error})."
-                    )
-                continue
+                log_llm.exception("Failed to record ranker call.")
+        if attempt >= self.max_attempts:
+            raise RuntimeError(
+                f"Ranker failed after {self.max_attempts} attempts ({last_error})."
+            )
+        return last_error
 
-            out = rsp.output
-            parsed = out.rankings
-            ranked_map, error = _validate_rankings(
-                parsed, metrics, len(battle.participants)
+    def _on_output(
+        self,
+        out: RankerOutput,
+        prompt: str,
+        attempt: int,
+        *,
+        metrics: Sequence[str],
+        total_players: int,
+        prompt_id_to_original: Mapping[int, int],
+    ) -> tuple[BattleRanking | None, str, str | None]:
+        """Validate one attempt; returns (ranking, next prompt, error)."""
+        parsed = out.rankings
+        ranked_map, error = _validate_rankings(parsed, metrics, total_players)
+        if self.store:
+            try:
+                self.store.record_llm_call(
+                    name="ranker",
+                    model=self.model,
+                    model_settings=self.model_settings,
+                    prompt=prompt,
+                    output=out,
+                    error=error,
+                    extra={"attempt": attempt},
+                )
+            except Exception:
+                log_llm.exception("Failed to record ranker call.")
+        if ranked_map is None:
+            log_llm.warning(
+                "Ranker returned invalid rankings (%s) — attempt %d/%d.",
+                error,
+                attempt,
+                self.max_attempts,
             )
-            last_error = error
-            if self.store:
-                try:
-                    self.store.record_llm_call(
-                        name="ranker",
-                        model=self.model,
-                        model_settings=self.model_settings,
-                        prompt=prompt,
-                        output=out,
-                        error=error,
-                        extra={"attempt": attempt},
-                    )
-                except Exception:
-                    log_llm.exception("Failed to record ranker call.")
-            if ranked_map is None:
-                log_llm.warning(
-                    "Ranker returned invalid rankings (%s) — attempt %d/%d.",
-                    error,
-                    attempt,
-                    self.max_attempts,
+            if not self.repair_enabled or attempt >= self.max_attempts:
+                raise RuntimeError(
+                    f"Ranker returned invalid rankings after {self.max_attempts} attempts ({error})."
                 )
-                if not self.repair_enabled or attempt >= self.max_attempts:
-                    raise RuntimeError(
-                        f"Ranker returned invalid rankings after {self.max_attempts} attempts ({error})."
-                    )
-                prompt = _build_repair_prompt(prompt, error or "invalid output")
-                continue
-
-            tiers_by_metric: dict[str, list[list[int]]] = {}
-            for metric in metrics:
-                tiers_by_metric[metric] = [
-                    [prompt_id_to_original[prompt_id] for prompt_id in tier]
-                    for tier in ranked_map[metric]
-                ]
-            return BattleRanking(tiers_by_metric=tiers_by_metric)
+            return None, _build_repair_prompt(prompt, error or "invalid output"), error
 
-        raise RuntimeError(
-            f"Ranker failed after {self.max_attempts} attempts ({last_error or 'unknown error'})."
-        )
+        tiers_by_metric: dict[str, list[list[int]]] = {}
+        for metric in metrics:
+            tiers_by_metric[metric] = [
+                [prompt_id_to_original[prompt_id] for prompt_id in tier]
+                for tier in ranked_map[metric]
+            ]
+        return BattleRanking(tiers_by_metric=tiers_by_metric), prompt, None
 
 
 def _validate_rankings(
@@ -0,0 +1,543 @@
+"""Micro/macro benchmarks for the engine hot paths (`fuzzyevolve bench`).
+
+Every case reports min/median/mean wall time over `repeat` samples. Cases in
+a size sweep are skipped once a smaller size exceeds `budget_s`, so slow
+strategies do not stall the whole suite. Output is plain JSON so results can
+be diffed between releases.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import itertools
+import platform
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import trueskill as ts
+
+from fuzzyevolve.config import Config, ModelSpec
+from fuzzyevolve.core.models import Elite
+from fuzzyevolve.core.multiobjective import (
+    nondominated_fronts,
+    nondominated_indices,
+)
+from fuzzyevolve.core.pool import CrowdedPool
+from fuzzyevolve.core.ratings import BattleRanking, RatingSystem
+
+BENCH_SCHEMA = 1
+EMBED_DIM = 384
+
+POOL_SIZES = (64, 256, 1024, 4096, 10000)
+NONDOMINATED_SIZES = (64, 256, 1024, 4096, 10000)
+BATTLE_SIZES = (2, 4, 8, 16, 32)
+CHECKPOINT_SIZES = (256, 1024)
+
+QUICK_POOL_SIZES = (64, 256)
+QUICK_NONDOMINATED_SIZES = (64, 256)
+QUICK_BATTLE_SIZES = (2, 8, 32)
+QUICK_CHECKPOINT_SIZES = (64,)
+
+
+def hash_embed(text: str, dim: int = EMBED_DIM) -> np.ndarray:
+    """Deterministic unit vector per text; stands in for a real model."""
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+    vec = np.random.default_rng(seed).standard_normal(dim)
+    return vec / np.linalg.norm(vec)
+
+
+def run_benchmarks(
+    *,
+    micro: bool = True,
+    macro: bool = True,
+    quick: bool = False,
+    repeat: int = 3,
+    budget_s: float = 30.0,
+    embeddings_model: str | None = None,
+    macro_iterations: int | None = None,
+) -> dict[str, Any]:
+    repeat = max(1, int(repeat))
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="fuzzyevolve-bench-") as tmp:
+        scratch = Path(tmp)
+        if micro:
+            results.extend(
+                _micro(quick=quick, repeat=repeat, budget_s=budget_s, scratch=scratch)
+            )
+            results.extend(_bench_embed(embeddings_model, repeat=repeat))
+        if macro:
+            iterations = macro_iterations or (5 if quick else 50)
+            for concurrency in ("threads", "asyncio"):
+                params = {
+                    "concurrency": concurrency,
+                    "iterations": iterations,
+                    "pool_size": 64,
+                }
+                for entry in _sweep(
+                    "engine.run",
+                    [params],
+                    functools.partial(_bench_engine, scratch=scratch),
+                    repeat=1,
+                    budget_s=budget_s,
+                ):
+                    if "median_s" in entry:
+                        entry["iterations_per_s"] = iterations / entry["median_s"]
+                    results.append(entry)
+    return {
+        "schema": BENCH_SCHEMA,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "fuzzyevolve": _version("fuzzyevolve"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "quick": bool(quick),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def _micro(
+    *, quick: bool, repeat: int, budget_s: float, scratch: Path
+) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    pool_sizes = QUICK_POOL_SIZES if quick else POOL_SIZES
+    for strategy, knn_index in (
+        ("closest_pair", "exact"),
+        ("knn_local_competition", "exact"),
+        ("knn_local_competition", "lsh"),
+        ("pareto_front", "exact"),
+    ):
+        results.extend(
+            _sweep(
+                "pool.add_many",
+                [
+                    {"strategy": strategy, "knn_index": knn_index, "pool_size": n}
+                    for n in pool_sizes
+                ],
+                _bench_add_many,
+                repeat=repeat,
+                budget_s=budget_s,
+            )
+        )
+    results.extend(
+        _sweep(
+            "nondominated_indices",
+            [
+                {"n": n, "metrics": 3}
+                for n in (QUICK_NONDOMINATED_SIZES if quick else NONDOMINATED_SIZES)
+            ],
+            _bench_nondominated,
+            repeat=repeat,
+            budget_s=budget_s,
+        )
+    )
+    results.extend(
+        _sweep(
+            "nondominated_fronts",
+            [
+                {"n": n, "metrics": 3}
+                for n in (QUICK_NONDOMINATED_SIZES if quick else NONDOMINATED_SIZES)
+            ],
+            _bench_nondominated_fronts,
+            repeat=repeat,
+            budget_s=budget_s,
+        )
+    )
+    for backend in ("trueskill", "numpy"):
+        results.extend(
+            _sweep(
+                "rating.apply_ranking",
+                [
+                    {"backend": backend, "players": n, "metrics": 3}
+                    for n in (QUICK_BATTLE_SIZES if quick else BATTLE_SIZES)
+                ],
+                _bench_apply_ranking,
+                repeat=repeat,
+                budget_s=budget_s,
+            )
+        )
+    results.extend(
+        _sweep(
+            "run_store.save_checkpoint",
+            [
+                {"mode": mode, "pool_size": n}
+                for mode in ("snapshot", "delta")
+                for n in (QUICK_CHECKPOINT_SIZES if quick else CHECKPOINT_SIZES)
+            ],
+            functools.partial(_bench_save_checkpoint, scratch=scratch),
+            repeat=repeat,
+            budget_s=budget_s,
+        )
+    )
+    results.extend(
+        _sweep(
+            "run_store.load_checkpoint",
+            [
+                {"format": fmt, "pool_size": n}
+                for fmt in ("json", "binary")
+                for n in (QUICK_CHECKPOINT_SIZES if quick else CHECKPOINT_SIZES)
+            ],
+            functools.partial(_bench_load_checkpoint, scratch=scratch),
+            repeat=repeat,
+            budget_s=budget_s,
+        )
+    )
+    results.extend(
+        _sweep(
+            "tui.load_run_state",
+            [
+                {"pool_size": n, "iterations": 200 if quick else 2000}
+                for n in (QUICK_CHECKPOINT_SIZES if quick else CHECKPOINT_SIZES)
+            ],
+            functools.partial(_bench_load_run_state, scratch=scratch),
+            repeat=repeat,
+            budget_s=budget_s,
+        )
+    )
+    return results
+
+
+def _version(dist: str) -> str | None:
+    try:
+        return metadata.version(dist)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _sweep(
+    name: str,
+    cases: Sequence[dict[str, Any]],
+    bench: Callable[..., Callable[[], None]],
+    *,
+    repeat: int,
+    budget_s: float,
+) -> list[dict[str, Any]]:
+    """Time each case; skip the rest of the sweep once one exceeds the budget."""
+    out: list[dict[str, Any]] = []
+    over_budget = False
+    for params in cases:
+        if over_budget:
+            out.append({"name": name, "params": params, "skipped": "over budget"})
+            continue
+        samples = _measure(bench, params, repeat=repeat)
+        out.append(_summarize(name, params, samples))
+        over_budget = samples[0] > budget_s
+    return out
+
+
+def _measure(
+    bench: Callable[..., Callable[[], None]], params: dict[str, Any], *, repeat: int
+) -> list[float]:
+    """`bench(**params)` does the setup and returns the timed callable."""
+    samples: list[float] = []
+    for sample in range(repeat):
+        run = bench(seed=sample, **params)
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _summarize(
+    name: str, params: dict[str, Any], samples: Sequence[float]
+) -> dict[str, Any]:
+    return {
+        "name": name,
+        "params": params,
+        "runs": len(samples),
+        "min_s": min(samples),
+        "median_s": statistics.median(samples),
+        "mean_s": statistics.fmean(samples),
+    }
+
+
+def _random_elite(rng: random.Random, idx: int, metrics: Sequence[str]) -> Elite:
+    text = f"elite-{idx}-{rng.random():.12f}"
+    return Elite(
+        text=text,
+        embedding=hash_embed(text),
+        ratings={
+            m: ts.Rating(mu=rng.gauss(25.0, 3.0), sigma=rng.uniform(1.0, 8.0))
+            for m in metrics
+        },
+        age=idx,
+    )
+
+
+def _make_pool(
+    *,
+    size: int,
+    strategy: str,
+    seed: int,
+    metrics: Sequence[str],
+    knn_index: str = "exact",
+) -> tuple[CrowdedPool, RatingSystem, random.Random]:
+    rng = random.Random(seed)
+    rating = RatingSystem(list(metrics))
+    pool = CrowdedPool(
+        max_size=size,
+        rng=random.Random(seed),
+        score_fn=rating.score,
+        pruning_strategy=strategy,
+        knn_k=4,
+        knn_index=knn_index,
+        metrics=metrics,
+        pareto=True,
+    )
+    pool.add_many([_random_elite(rng, i, metrics) for i in range(size)])
+    return pool, rating, rng
+
+
+def _bench_add_many(
+    *, seed: int, strategy: str, knn_index: str, pool_size: int
+) -> Callable[[], None]:
+    metrics = ("m1", "m2", "m3")
+    pool, _rating, rng = _make_pool(
+        size=pool_size,
+        strategy=strategy,
+        seed=seed,
+        metrics=metrics,
+        knn_index=knn_index,
+    )
+    batch = [_random_elite(rng, pool_size + i, metrics) for i in range(8)]
+    return lambda: pool.add_many(batch)
+
+
+def _bench_nondominated(*, seed: int, n: int, metrics: int) -> Callable[[], None]:
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(n, metrics)).tolist()
+    return lambda: nondominated_indices(vectors)
+
+
+def _bench_nondominated_fronts(
+    *, seed: int, n: int, metrics: int
+) -> Callable[[], None]:
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(n, metrics))
+    return lambda: nondominated_fronts(vectors)
+
+
+def _bench_apply_ranking(
+    *, seed: int, players: int, metrics: int, backend: str = "trueskill"
+) -> Callable[[], None]:
+    names = [f"m{i}" for i in range(metrics)]
+    rng = random.Random(seed)
+    rating = RatingSystem(names, backend=backend)
+    battles = []
+    for b in range(10):
+        elites = [_random_elite(rng, b * players + i, names) for i in range(players)]
+        tiers: dict[str, list[list[int]]] = {}
+        for name in names:
+            order = list(range(players))
+            rng.shuffle(order)
+            tiers[name] = [[i] for i in order]
+        battles.append((elites, BattleRanking(tiers_by_metric=tiers)))
+
+    def run() -> None:
+        for elites, ranking in battles:
+            rating.apply_ranking(elites, ranking)
+
+    return run
+
+
+def _bench_embed(model: str | None, *, repeat: int) -> list[dict[str, Any]]:
+    """Sequential `embed` calls vs one `embed_many` batch over the same count."""
+    params = {"model": model, "texts": 32}
+    names = ("embeddings.embed", "embeddings.embed_many")
+    if not model:
+        return [
+            {"name": name, "params": params, "skipped": "no model"} for name in names
+        ]
+    try:
+        from fuzzyevolve.core.embeddings import SentenceTransformerProvider
+
+        provider = SentenceTransformerProvider(model)
+    except Exception as exc:
+        return [
+            {
+                "name": name,
+                "params": params,
+                "skipped": f"{type(exc).__name__}: {exc}",
+            }
+            for name in names
+        ]
+
+    def bench_each(*, seed: int, **_: Any) -> Callable[[], None]:
+        # Fresh texts per sample so the provider's cache never answers.
+        texts = [f"benchmark text {seed} {i} " * 20 for i in range(32)]
+
+        def run() -> None:
+            for text in texts:
+                provider.embed(text)
+
+        return run
+
+    def bench_many(*, seed: int, **_: Any) -> Callable[[], None]:
+        texts = [f"batched benchmark text {seed} {i} " * 20 for i in range(32)]
+        return lambda: provider.embed_many(texts)
+
+    return [
+        _summarize(names[0], params, _measure(bench_each, params, repeat=repeat)),
+        _summarize(names[1], params, _measure(bench_many, params, repeat=repeat)),
+    ]
+
+
+def _bench_save_checkpoint(
+    *, seed: int, mode: str, pool_size: int, scratch: Path
+) -> Callable[[], None]:
+    """`snapshot` writes the full pool; `delta` journals a typical iteration
+    (a few rating updates) after an initial snapshot."""
+    from fuzzyevolve.run_store import RunStore
+
+    pool, _rating, rng = _make_pool(
+        size=pool_size, strategy="closest_pair", seed=seed, metrics=("m1", "m2")
+    )
+    store = RunStore(Path(tempfile.mkdtemp(dir=scratch)))
+    if mode == "snapshot":
+        return lambda: store.save_checkpoint(
+            iteration=1, pool=pool, anchor_manager=None, keep=True
+        )
+
+    members = list(pool.iter_elites())
+    iteration = itertools.count(1)
+    store.save_checkpoint(
+        iteration=next(iteration), pool=pool, anchor_manager=None, keep=False
+    )
+
+    def run() -> None:
+        for elite in rng.sample(members, min(3, len(members))):
+            old = elite.ratings["m1"]
+            elite.ratings["m1"] = ts.Rating(old.mu + 0.1, old.sigma * 0.99)
+        store.save_checkpoint(
+            iteration=next(iteration),
+            pool=pool,
+            anchor_manager=None,
+            keep=False,
+            snapshot_interval=10**9,
+        )
+
+    return run
+
+
+def _bench_load_checkpoint(
+    *, seed: int, format: str, pool_size: int, scratch: Path
+) -> Callable[[], None]:
+    """Resume a saved pool; embedding (the JSON path's fallback) is a cheap
+    stand-in, so `json` measures parsing, text reads and re-insertion."""
+    from fuzzyevolve.run_store import RunStore
+
+    pool, rating, _rng = _make_pool(
+        size=pool_size, strategy="closest_pair", seed=seed, metrics=("m1", "m2")
+    )
+    dim = pool.embedding_matrix().shape[1]
+    store = RunStore(Path(tempfile.mkdtemp(dir=scratch)))
+    store.save_checkpoint(
+        iteration=1,
+        pool=pool,
+        anchor_manager=None,
+        keep=False,
+        binary=format == "binary",
+    )
+    cfg = Config()
+
+    def embed_many(texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), dim), dtype=np.float32)
+        vectors[:, 0] = 1.0
+        return vectors
+
+    def run() -> None:
+        RunStore.open(store.run_dir).load_checkpoint(
+            cfg=cfg,
+            embed=lambda text: embed_many([text])[0],
+            embed_many=embed_many,
+            pool_factory=lambda: CrowdedPool(
+                max_size=pool_size, score_fn=rating.score, metrics=["m1", "m2"]
+            ),
+            anchor_factory=lambda _cfg: None,
+        )
+
+    return run
+
+
+def _bench_load_run_state(
+    *, seed: int, pool_size: int, iterations: int, scratch: Path
+) -> Callable[[], None]:
+    from fuzzyevolve.run_store import RunStore
+    from fuzzyevolve.tui.run_data import load_run_state
+
+    cfg = Config()
+    cfg.metrics.names = ["m1", "m2"]
+    pool, _rating, _rng = _make_pool(
+        size=pool_size, strategy="closest_pair", seed=seed, metrics=("m1", "m2")
+    )
+    store = RunStore.create(
+        data_dir=Path(tempfile.mkdtemp(dir=scratch)),
+        cfg=cfg,
+        seed_text="seed",
+        config_path=None,
+    )
+    best = pool.best
+    best_id = store.put_text(best.text)
+    for it in range(1, iterations + 1):
+        store.record_stats(
+            iteration=it,
+            best_score=float(it),
+            pool_size=len(pool),
+            extra={"best_text_id": best_id},
+        )
+        store.record_event("iteration", {"best_text_id": best_id}, iteration=it)
+    store.save_checkpoint(
+        iteration=iterations, pool=pool, anchor_manager=None, keep=False
+    )
+    store.close()
+    return lambda: load_run_state(store.run_dir)
+
+
+def macro_config(*, iterations: int, pool_size: int, concurrency: str) -> Config:
+    """A small run wired to `fake:*` models."""
+    cfg = Config()
+    cfg.run.iterations = iterations
+    cfg.run.random_seed = 0
+    cfg.run.concurrency = concurrency
+    cfg.population.size = pool_size
+    cfg.llm.judge_model = "fake:judge"
+    cfg.llm.critic_model = "fake:critic"
+    cfg.llm.ensemble = [ModelSpec(model="fake:writer", weight=1.0)]
+    for op in cfg.mutation.operators:
+        op.ensemble = None
+    return cfg
+
+
+def _bench_engine(
+    *, seed: int, concurrency: str, iterations: int, pool_size: int, scratch: Path
+) -> Callable[[], None]:
+    from fuzzyevolve.builder import build_engine, run_engine
+    from fuzzyevolve.run_store import RunStore
+
+    cfg = macro_config(
+        iterations=iterations, pool_size=pool_size, concurrency=concurrency
+    )
+    store = RunStore.create(
+        data_dir=Path(tempfile.mkdtemp(dir=scratch)),
+        cfg=cfg,
+        seed_text="seed",
+        config_path=None,
+    )
+    built = build_engine(cfg, seed=seed, embed=hash_embed, recorder=store)
+
+    def run() -> None:
+        run_engine(built, seed_text="Once upon a time.", resume=False)
+        # Recording is part of the cost, and nothing may land in the scratch
+        # directory after the sweep removes it.
+        store.flush()
+
+    return run
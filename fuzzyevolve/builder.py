@@ -0,0 +1,364 @@
+"""Wire a configured `EvolutionEngine` from a `Config`.
+
+Shared by the CLI and by island worker processes so both derive RNG streams
+from the seed in exactly the same order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from fuzzyevolve.adapters.llm.cache import DiskResponseCache, ResponseCache
+from fuzzyevolve.config import Config
+from fuzzyevolve.core.anchors import AnchorManager
+from fuzzyevolve.core.critique_cache import CachedCritic, CritiqueCache
+from fuzzyevolve.core.embedding_store import StoredEmbedder
+from fuzzyevolve.core.embeddings import (
+    EmbeddingProvider,
+    SentenceTransformerProvider,
+    WorkerEmbeddingProvider,
+)
+from fuzzyevolve.core.engine import EvolutionEngine, build_anchor_manager
+from fuzzyevolve.core.models import EvolutionResult, IterationSnapshot
+from fuzzyevolve.core.multiobjective import Scalarizer
+from fuzzyevolve.core.mutation import OperatorMutator, OperatorSpec
+from fuzzyevolve.core.pool import CrowdedPool
+from fuzzyevolve.core.ratings import RatingSystem
+from fuzzyevolve.core.selection import MixedParentSelector
+from fuzzyevolve.run_store import RunStore
+
+if TYPE_CHECKING:
+    from pydantic_ai.settings import ModelSettings
+
+
+@dataclass(frozen=True, slots=True)
+class BuiltEngine:
+    engine: EvolutionEngine
+    pool: CrowdedPool
+    rating: RatingSystem
+    anchor_manager: AnchorManager | None
+    start_iteration: int
+
+
+def build_rating(cfg: Config) -> RatingSystem:
+    return RatingSystem(
+        cfg.metrics.names,
+        mu=cfg.rating.mu,
+        sigma=cfg.rating.sigma,
+        beta=cfg.rating.beta,
+        tau=cfg.rating.tau,
+        draw_probability=cfg.rating.draw_probability,
+        score_lcb_c=cfg.rating.score_lcb_c,
+        child_prior_tau=cfg.rating.child_prior_tau,
+        backend=cfg.rating.backend,
+    )
+
+
+def build_pool(
+    cfg: Config,
+    *,
+    rating: RatingSystem,
+    max_size: int | None = None,
+    rng: random.Random | None = None,
+    scalarizer: Scalarizer | None = None,
+) -> CrowdedPool:
+    """An empty pool with the configured metrics, pruning and pareto settings."""
+    return CrowdedPool(
+        max_size=max_size if max_size is not None else cfg.population.size,
+        rng=rng,
+        score_fn=rating.score,
+        pruning_strategy=cfg.population.pruning,
+        knn_k=cfg.population.knn_k,
+        knn_index=cfg.population.knn_index,
+        lsh_tables=cfg.population.lsh_tables,
+        lsh_bits=cfg.population.lsh_bits,
+        metrics=cfg.metrics.names,
+        score_lcb_c=cfg.rating.score_lcb_c,
+        scalarizer=scalarizer,
+        pareto=bool(cfg.multiobjective.enabled and cfg.multiobjective.pareto),
+        score_rows=rating.score_rows,
+    )
+
+
+def build_embedding_provider(
+    cfg: Config,
+) -> SentenceTransformerProvider | WorkerEmbeddingProvider:
+    if cfg.embeddings.worker_socket:
+        return WorkerEmbeddingProvider(
+            cfg.embeddings.worker_socket,
+            model=cfg.embeddings.model,
+            cache_max_entries=cfg.embeddings.cache_max_entries,
+            cache_max_bytes=cfg.embeddings.cache_max_bytes,
+        )
+    return SentenceTransformerProvider(
+        cfg.embeddings.model,
+        cache_max_entries=cfg.embeddings.cache_max_entries,
+        cache_max_bytes=cfg.embeddings.cache_max_bytes,
+        background=cfg.embeddings.background_load,
+    )
+
+
+def build_embedder(
+    cfg: Config,
+    provider: EmbeddingProvider,
+    store: RunStore | None,
+    *,
+    read_only: bool = False,
+) -> EmbeddingProvider:
+    """Wrap `provider` with the run's persistent embedding store, if enabled."""
+    if store is None or not cfg.embeddings.persist:
+        return provider
+    model = cfg.embeddings.model
+    # An existing store knows its dimension, so a resume reads saved vectors
+    # without waiting for a background-loading model; a new store is opened
+    # on first use, once the model can report it.
+    known_dim = store.stored_embedding_dim(model)
+    return StoredEmbedder(
+        lambda: store.embedding_store(
+            model=model, dim=known_dim or int(provider.dim), read_only=read_only
+        ),
+        provider.embed_many,
+    )
+
+
+def build_response_cache(cfg: Config, *, data_dir: Path) -> DiskResponseCache | None:
+    if not cfg.llm.response_cache:
+        return None
+    root = (
+        Path(cfg.llm.response_cache_dir)
+        if cfg.llm.response_cache_dir
+        else data_dir / "llm_cache"
+    )
+    return DiskResponseCache(root)
+
+
+def build_engine(
+    cfg: Config,
+    *,
+    seed: int,
+    embed: Callable[[str], np.ndarray],
+    embed_many: Callable[[Sequence[str]], np.ndarray] | None = None,
+    embedding_stats: Callable[[], Mapping[str, int]] | None = None,
+    recorder: RunStore | None = None,
+    checkpoint_store: RunStore | None = None,
+    checkpoint_path: Path | None = None,
+    response_cache: ResponseCache | None = None,
+) -> BuiltEngine:
+    """Build every component of a run.
+
+    If `checkpoint_store` is given, the pool and anchors are restored from its
+    checkpoint (`checkpoint_path`, or latest) and the run continues from there.
+    """
+    # pydantic-ai is slow to import; only code that builds an engine pays for it.
+    from fuzzyevolve.adapters.llm import fake
+    from fuzzyevolve.adapters.llm.critic import LLMCritic
+    from fuzzyevolve.adapters.llm.operators import LLMRewriteOperator
+    from fuzzyevolve.adapters.llm.ranker import LLMRanker
+
+    fake_cfg = cfg.llm.fake
+    # Per engine, so several engines in one process keep independent streams.
+    fake_llm = fake.FakeLLM(
+        fake.FakeLLMSettings(
+            latency_ms=fake_cfg.latency_ms,
+            latency_jitter_ms=fake_cfg.latency_jitter_ms,
+            latency_distribution=fake_cfg.latency_distribution,
+            failure_rate=fake_cfg.failure_rate,
+            output_chars=fake_cfg.output_chars,
+            seed=fake_cfg.seed if fake_cfg.seed is not None else seed,
+        )
+    )
+
+    master_rng = random.Random(seed)
+    rng_engine = random.Random(master_rng.randrange(2**32))
+    rng_selection = random.Random(master_rng.randrange(2**32))
+    rng_ranker = random.Random(master_rng.randrange(2**32))
+    rng_mutation = random.Random(master_rng.randrange(2**32))
+    rng_pool = random.Random(master_rng.randrange(2**32))
+    rng_anchors = random.Random(master_rng.randrange(2**32))
+    rng_scalarizer = random.Random(master_rng.randrange(2**32))
+
+    rating = build_rating(cfg)
+
+    scalarizer: Scalarizer | None = None
+    pareto_enabled = bool(cfg.multiobjective.enabled and cfg.multiobjective.pareto)
+    if cfg.multiobjective.enabled:
+        scalarizer = Scalarizer(
+            cfg.metrics.names,
+            rng=rng_scalarizer,
+            dirichlet_alpha=cfg.multiobjective.dirichlet_alpha,
+            balanced_probability=cfg.multiobjective.balanced_probability,
+            enabled=True,
+        )
+
+    pool = build_pool(cfg, rating=rating, rng=rng_pool, scalarizer=scalarizer)
+
+    anchor_manager = None
+    start_iteration = 0
+    if checkpoint_store is not None:
+        loaded = checkpoint_store.load_checkpoint(
+            cfg=cfg,
+            checkpoint_path=checkpoint_path,
+            embed=embed,
+            embed_many=embed_many,
+            pool_factory=lambda: pool,
+            anchor_factory=lambda _cfg: build_anchor_manager(cfg=cfg, rng=rng_anchors),
+        )
+        pool = loaded.pool
+        anchor_manager = loaded.anchors
+        start_iteration = loaded.next_iteration
+    else:
+        anchor_manager = build_anchor_manager(cfg=cfg, rng=rng_anchors)
+
+    selector = MixedParentSelector(
+        uniform_probability=cfg.selection.uniform_probability,
+        tournament_size=cfg.selection.tournament_size,
+        optimistic_beta=cfg.selection.optimistic_beta,
+        rng=rng_selection,
+        metrics=cfg.metrics.names,
+        scalarizer=scalarizer,
+        pareto=pareto_enabled,
+    )
+
+    critic = None
+    if cfg.critic.enabled:
+        critic_model = cfg.llm.critic_model or cfg.llm.judge_model
+        critic_settings: ModelSettings = {"temperature": cfg.llm.critic_temperature}
+        critic = LLMCritic(
+            model=critic_model,
+            model_settings=critic_settings,
+            goal=cfg.task.goal,
+            metrics=cfg.metrics.names,
+            metric_descriptions=cfg.metrics.descriptions,
+            routes=cfg.critic.routes,
+            instructions=cfg.critic.instructions,
+            show_metric_stats=cfg.prompts.show_metric_stats,
+            score_lcb_c=cfg.rating.score_lcb_c,
+            store=recorder,
+            response_cache=response_cache,
+            fake_llm=fake_llm,
+        )
+        cache_cfg = cfg.critic.cache
+        if cache_cfg.enabled:
+            cache_path = None
+            if cache_cfg.persist and recorder is not None:
+                cache_path = recorder.critique_cache_path
+            critic = CachedCritic(
+                critic,
+                cache=CritiqueCache(
+                    max_entries=cache_cfg.max_entries,
+                    ttl_s=cache_cfg.ttl_s,
+                    path=cache_path,
+                ),
+                metrics=cfg.metrics.names,
+                mu_step=cache_cfg.mu_step,
+                sigma_step=cache_cfg.sigma_step,
+            )
+
+    operators = {}
+    specs: list[OperatorSpec] = []
+    for op_cfg in [op for op in cfg.mutation.operators if op.enabled]:
+        op_rng = random.Random(master_rng.randrange(2**32))
+        ensemble = op_cfg.ensemble or cfg.llm.ensemble
+        operators[op_cfg.name] = LLMRewriteOperator(
+            name=op_cfg.name,
+            role=op_cfg.role,
+            ensemble=ensemble,
+            temperature=op_cfg.temperature,
+            goal=cfg.task.goal,
+            metrics=cfg.metrics.names,
+            metric_descriptions=cfg.metrics.descriptions,
+            instructions=op_cfg.instructions,
+            show_metric_stats=cfg.prompts.show_metric_stats,
+            score_lcb_c=cfg.rating.score_lcb_c,
+            rng=op_rng,
+            store=recorder,
+            response_cache=response_cache,
+            fake_llm=fake_llm,
+        )
+        specs.append(
+            OperatorSpec(
+                name=op_cfg.name,
+                role=op_cfg.role,
+                min_jobs=op_cfg.min_jobs,
+                weight=op_cfg.weight,
+                uncertainty_scale=op_cfg.uncertainty_scale,
+                committee_size=int(op_cfg.committee_size or 1),
+                partner_selection=str(op_cfg.partner_selection),
+                partner_farthest_k=int(op_cfg.partner_farthest_k),
+            )
+        )
+
+    mutator = OperatorMutator(
+        pool=pool,
+        operators=operators,
+        specs=specs,
+        jobs_per_iteration=cfg.mutation.jobs_per_iteration,
+        rng=rng_mutation,
+    )
+    ranker = LLMRanker(
+        model=cfg.llm.judge_model,
+        goal=cfg.task.goal,
+        rng=rng_ranker,
+        max_attempts=cfg.judging.max_attempts,
+        repair_enabled=cfg.judging.repair_enabled,
+        store=recorder,
+        response_cache=response_cache,
+        fake_llm=fake_llm,
+    )
+
+    engine = EvolutionEngine(
+        cfg=cfg,
+        pool=pool,
+        embed=embed,
+        rating=rating,
+        selector=selector.select_parent,
+        critic=critic,
+        mutator=mutator,
+        ranker=ranker,
+        anchor_manager=anchor_manager,
+        rng=rng_engine,
+        store=recorder,
+        scalarizer=scalarizer,
+        embed_many=embed_many,
+        embedding_stats=embedding_stats,
+    )
+    return BuiltEngine(
+        engine=engine,
+        pool=pool,
+        rating=rating,
+        anchor_manager=anchor_manager,
+        start_iteration=start_iteration,
+    )
+
+
+def run_engine(
+    built: BuiltEngine,
+    *,
+    seed_text: str | None,
+    resume: bool,
+    on_iteration: Callable[[IterationSnapshot], None] | None = None,
+) -> EvolutionResult:
+    """Drive `built.engine` with the configured concurrency mode."""
+    engine = built.engine
+    if engine.cfg.run.concurrency == "asyncio":
+        if resume:
+            return asyncio.run(
+                engine.aresume(
+                    start_iteration=built.start_iteration,
+                    on_iteration=on_iteration,
+                )
+            )
+        return asyncio.run(engine.arun(seed_text or "", on_iteration=on_iteration))
+    if resume:
+        return engine.resume(
+            start_iteration=built.start_iteration,
+            on_iteration=on_iteration,
+        )
+    return engine.run(seed_text or "", on_iteration=on_iteration)
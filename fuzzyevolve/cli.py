@@ -5,44 +5,27 @@ Design goals:
 - Subcommands like `fuzzyevolve tui` should remain intuitive.
 - Keep parsing predictable: a real `run` command owns its options; we don't
   rely on Click's "extra args" escape hatches.
+- Stay cheap to start: each command imports what it needs (pydantic-ai,
+  rich, textual, sentence-transformers) inside its body, so `--help` and
+  `tui` never pay for the LLM or embedding stacks.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import random
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.progress import (
-    BarColumn,
-    Progress,
-    TaskProgressColumn,
-    TextColumn,
-    TimeElapsedColumn,
-)
 from typer.core import TyperGroup
 
-from pydantic_ai.settings import ModelSettings
-
-from fuzzyevolve.adapters.llm.critic import LLMCritic
-from fuzzyevolve.adapters.llm.operators import LLMRewriteOperator
-from fuzzyevolve.adapters.llm.ranker import LLMRanker
-from fuzzyevolve.config import load_config
-from fuzzyevolve.console.logging import setup_logging
-from fuzzyevolve.core.embeddings import (
-    SentenceTransformerProvider,
-)
-from fuzzyevolve.core.engine import EvolutionEngine, build_anchor_manager
-from fuzzyevolve.core.multiobjective import Scalarizer
-from fuzzyevolve.core.mutation import OperatorMutator, OperatorSpec
-from fuzzyevolve.core.pool import CrowdedPool
-from fuzzyevolve.core.ratings import RatingSystem
-from fuzzyevolve.core.selection import MixedParentSelector
-from fuzzyevolve.reporting import render_top_by_fitness_markdown
-from fuzzyevolve.run_store import RunStore
+if TYPE_CHECKING:
+    from fuzzyevolve.adapters.llm.cache import ResponseCache
+    from fuzzyevolve.config import Config
+    from fuzzyevolve.run_store import RunStore
 
 _HELP_FLAG = {"-h", "--help"}
 
@@ -124,18 +107,47 @@ def _execute_run(
     quiet: bool,
     resume: Path | None,
     store: bool,
+    islands: int | None = None,
+    migration_interval: int | None = None,
+    replay: Path | None = None,
 ) -> None:
     if top < 0:
         raise typer.BadParameter("--top must be >= 0 (use 0 for no limit).")
 
+    from fuzzyevolve.adapters.llm.cache import ReplayResponseCache
+    from fuzzyevolve.builder import (
+        build_embedder,
+        build_embedding_provider,
+        build_engine,
+        build_response_cache,
+        run_engine,
+    )
+    from fuzzyevolve.config import load_config
+    from fuzzyevolve.console.logging import setup_logging
+    from fuzzyevolve.run_store import RunStore
+
     setup_logging(level=_parse_log_level(log_level), quiet=quiet, log_file=log_file)
 
     run_store: RunStore | None = None
     seed_text: str | None = None
     checkpoint_path: Path | None = None
     config_path: Path | None = None
-
-    if resume is not None:
+    response_cache: ResponseCache | None = None
+
+    if replay is not None:
+        source = RunStore.open(replay)
+        cfg = source.load_config()
+        seed_path = source.run_dir / "seed.txt"
+        if not seed_path.is_file():
+            raise typer.BadParameter(f"No seed.txt in {source.run_dir}; cannot replay.")
+        if cfg.islands.count > 1:
+            raise typer.BadParameter("Replaying island runs is not supported.")
+        seed_text = seed_path.read_text(encoding="utf-8")
+        response_cache = ReplayResponseCache.from_run_dir(source.run_dir)
+        cfg.run.iterations = _recorded_iterations(source) or cfg.run.iterations
+        source.close()
+        logging.info("Replaying run from %s", source.run_dir)
+    elif resume is not None:
         if config is not None:
             raise typer.BadParameter("Do not use --config when resuming.")
         if seed_parts:
@@ -156,6 +168,16 @@ def _execute_run(
         cfg.task.goal = goal
     if metric:
         cfg.metrics.names = metric
+    if islands is not None:
+        if islands < 1:
+            raise typer.BadParameter("--islands must be >= 1.")
+        cfg.islands.count = islands
+    if migration_interval is not None:
+        if migration_interval < 1:
+            raise typer.BadParameter("--migration-interval must be >= 1.")
+        cfg.islands.migration_interval = migration_interval
+    if cfg.islands.count > 1 and resume is not None:
+        raise typer.BadParameter("--resume is not supported with --islands.")
 
     seed = cfg.run.random_seed
     if seed is None:
@@ -163,44 +185,31 @@ def _execute_run(
         logging.info("Generated random seed: %d", seed)
         cfg.run.random_seed = seed
 
-    master_rng = random.Random(seed)
-    rng_engine = random.Random(master_rng.randrange(2**32))
-    rng_selection = random.Random(master_rng.randrange(2**32))
-    rng_ranker = random.Random(master_rng.randrange(2**32))
-    rng_mutation = random.Random(master_rng.randrange(2**32))
-    rng_pool = random.Random(master_rng.randrange(2**32))
-    rng_anchors = random.Random(master_rng.randrange(2**32))
-    rng_scalarizer = random.Random(master_rng.randrange(2**32))
-
-    provider = SentenceTransformerProvider(cfg.embeddings.model)
-
-    def embed(text: str):
-        return provider.embed(text)
-
-    rating = RatingSystem(
-        cfg.metrics.names,
-        mu=cfg.rating.mu,
-        sigma=cfg.rating.sigma,
-        beta=cfg.rating.beta,
-        tau=cfg.rating.tau,
-        draw_probability=cfg.rating.draw_probability,
-        score_lcb_c=cfg.rating.score_lcb_c,
-        child_prior_tau=cfg.rating.child_prior_tau,
-    )
+    if cfg.islands.count > 1:
+        _execute_islands(
+            cfg=cfg,
+            seed=seed,
+            seed_text=seed_text or "",
+            config_path=config_path,
+            output=output,
+            top=top,
+            log_level=_parse_log_level(log_level),
+            log_file=log_file,
+            quiet=quiet,
+            store=store,
+        )
+        return
 
-    recorder = run_store if (store and run_store is not None) else None
+    # Loads in the background (by default) while the engine is built.
+    provider = build_embedding_provider(cfg)
 
-    scalarizer: Scalarizer | None = None
-    pareto_enabled = bool(cfg.multiobjective.enabled and cfg.multiobjective.pareto)
-    if cfg.multiobjective.enabled:
-        scalarizer = Scalarizer(
-            cfg.metrics.names,
-            rng=rng_scalarizer,
-            dirichlet_alpha=cfg.multiobjective.dirichlet_alpha,
-            balanced_probability=cfg.multiobjective.balanced_probability,
-            enabled=True,
+    if response_cache is None:
+        response_cache = build_response_cache(
+            cfg, data_dir=RunStore.default_data_dir(cwd=Path.cwd())
         )
 
+    recorder = run_store if (store and run_store is not None) else None
+
     if run_store is None and store:
         data_dir = RunStore.default_data_dir(cwd=Path.cwd())
         run_store = RunStore.create(
@@ -212,123 +221,31 @@ def _execute_run(
         recorder = run_store
         logging.info("Recording run to %s", run_store.run_dir)
 
-    pool = CrowdedPool(
-        max_size=cfg.population.size,
-        rng=rng_pool,
-        score_fn=rating.score,
-        pruning_strategy=cfg.population.pruning,
-        knn_k=cfg.population.knn_k,
-        metrics=cfg.metrics.names,
-        score_lcb_c=cfg.rating.score_lcb_c,
-        scalarizer=scalarizer,
-        pareto=pareto_enabled,
-    )
-
-    anchor_manager = None
-    start_iteration = 0
-    if resume is not None:
-        loaded = run_store.load_checkpoint(
-            cfg=cfg,
-            checkpoint_path=checkpoint_path,
-            embed=embed,
-            pool_factory=lambda: pool,
-            anchor_factory=lambda _cfg: build_anchor_manager(cfg=cfg, rng=rng_anchors),
-        )
-        pool = loaded.pool
-        anchor_manager = loaded.anchors
-        start_iteration = loaded.next_iteration
-    else:
-        anchor_manager = build_anchor_manager(cfg=cfg, rng=rng_anchors)
-
-    selector = MixedParentSelector(
-        uniform_probability=cfg.selection.uniform_probability,
-        tournament_size=cfg.selection.tournament_size,
-        optimistic_beta=cfg.selection.optimistic_beta,
-        rng=rng_selection,
-        metrics=cfg.metrics.names,
-        scalarizer=scalarizer,
-        pareto=pareto_enabled,
-    )
-
-    critic = None
-    if cfg.critic.enabled:
-        critic_model = cfg.llm.critic_model or cfg.llm.judge_model
-        critic_settings: ModelSettings = {"temperature": cfg.llm.critic_temperature}
-        critic = LLMCritic(
-            model=critic_model,
-            model_settings=critic_settings,
-            goal=cfg.task.goal,
-            metrics=cfg.metrics.names,
-            metric_descriptions=cfg.metrics.descriptions,
-            routes=cfg.critic.routes,
-            instructions=cfg.critic.instructions,
-            show_metric_stats=cfg.prompts.show_metric_stats,
-            score_lcb_c=cfg.rating.score_lcb_c,
-            store=recorder,
-        )
-
-    operators = {}
-    specs: list[OperatorSpec] = []
-    for op_cfg in [op for op in cfg.mutation.operators if op.enabled]:
-        op_rng = random.Random(master_rng.randrange(2**32))
-        ensemble = op_cfg.ensemble or cfg.llm.ensemble
-        operators[op_cfg.name] = LLMRewriteOperator(
-            name=op_cfg.name,
-            role=op_cfg.role,
-            ensemble=ensemble,
-            temperature=op_cfg.temperature,
-            goal=cfg.task.goal,
-            metrics=cfg.metrics.names,
-            metric_descriptions=cfg.metrics.descriptions,
-            instructions=op_cfg.instructions,
-            show_metric_stats=cfg.prompts.show_metric_stats,
-            score_lcb_c=cfg.rating.score_lcb_c,
-            rng=op_rng,
-            store=recorder,
-        )
-        specs.append(
-            OperatorSpec(
-                name=op_cfg.name,
-                role=op_cfg.role,
-                min_jobs=op_cfg.min_jobs,
-                weight=op_cfg.weight,
-                uncertainty_scale=op_cfg.uncertainty_scale,
-                committee_size=int(op_cfg.committee_size or 1),
-                partner_selection=str(op_cfg.partner_selection),
-                partner_farthest_k=int(op_cfg.partner_farthest_k),
-            )
-        )
-
-    mutator = OperatorMutator(
-        pool=pool,
-        operators=operators,
-        specs=specs,
-        jobs_per_iteration=cfg.mutation.jobs_per_iteration,
-        rng=rng_mutation,
+    # Resuming with --no-store reads the run's saved vectors but adds none.
+    embedder = build_embedder(cfg, provider, run_store, read_only=recorder is None)
+    built = build_engine(
+        cfg,
+        seed=seed,
+        embed=embedder.embed,
+        embed_many=embedder.embed_many,
+        embedding_stats=provider.cache_stats,
+        recorder=recorder,
+        checkpoint_store=run_store if resume is not None else None,
+        checkpoint_path=checkpoint_path,
+        response_cache=response_cache,
     )
-    ranker = LLMRanker(
-        model=cfg.llm.judge_model,
-        goal=cfg.task.goal,
-        rng=rng_ranker,
-        max_attempts=cfg.judging.max_attempts,
-        repair_enabled=cfg.judging.repair_enabled,
-        store=recorder,
+    pool = built.pool
+    rating = built.rating
+
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
     )
 
-    engine = EvolutionEngine(
-        cfg=cfg,
-        pool=pool,
-        embed=embed,
-        rating=rating,
-        selector=selector.select_parent,
-        critic=critic,
-        mutator=mutator,
-        ranker=ranker,
-        anchor_manager=anchor_manager,
-        rng=rng_engine,
-        store=recorder,
-        scalarizer=scalarizer,
-    )
+    from fuzzyevolve.reporting import render_top_by_fitness_markdown
 
     progress = Progress(
         TextColumn("[progress.description]{task.description}"),
@@ -367,13 +284,12 @@ def _execute_run(
                 pool=snapshot.pool_size,
             )
 
-        if resume is not None:
-            result = engine.resume(
-                start_iteration=start_iteration,
-                on_iteration=on_iteration,
-            )
-        else:
-            result = engine.run(seed_text or "", on_iteration=on_iteration)
+        result = run_engine(
+            built,
+            seed_text=seed_text,
+            resume=resume is not None,
+            on_iteration=on_iteration,
+        )
 
     report = render_top_by_fitness_markdown(
         cfg=cfg,
@@ -384,9 +300,108 @@ def _execute_run(
     output.write_text(report)
     if run_store and store:
         (run_store.run_dir / "best.md").write_text(report)
+        run_store.close()
     logging.info(
         "DONE – report saved to %s (best score %.3f)", output, result.best_score
     )
+    if response_cache is not None:
+        logging.info(
+            "LLM response cache: %d hits, %d misses.",
+            getattr(response_cache, "hits", 0),
+            getattr(response_cache, "misses", 0),
+        )
+
+
+def _execute_islands(
+    *,
+    cfg: Config,
+    seed: int,
+    seed_text: str,
+    config_path: Path | None,
+    output: Path,
+    top: int,
+    log_level: int,
+    log_file: Path | None,
+    quiet: bool,
+    store: bool,
+) -> None:
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        TaskProgressColumn,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    from fuzzyevolve.builder import build_pool, build_rating
+    from fuzzyevolve.islands import run_islands
+    from fuzzyevolve.reporting import render_top_by_fitness_markdown
+    from fuzzyevolve.run_store import RunStore
+
+    run_store: RunStore | None = None
+    if store:
+        run_store = RunStore.create(
+            data_dir=RunStore.default_data_dir(cwd=Path.cwd()),
+            cfg=cfg,
+            seed_text=seed_text,
+            config_path=config_path,
+        )
+        logging.info("Recording run to %s", run_store.run_dir)
+
+    count = cfg.islands.count
+    logging.info(
+        "Running %d islands (migration every %d iterations).",
+        count,
+        cfg.islands.migration_interval,
+    )
+    progress = Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TextColumn("• best {task.fields[best]:.3f}"),
+        TimeElapsedColumn(),
+        transient=quiet,
+    )
+    with progress:
+        task = progress.add_task(
+            f"evolving ({count} islands)",
+            total=cfg.run.iterations * count,
+            best=0.0,
+        )
+        best_by_island: dict[int, float] = {}
+
+        def on_progress(update):
+            best_by_island[update.island] = update.best_score
+            progress.update(task, advance=1, best=max(best_by_island.values()))
+
+        finals = run_islands(
+            cfg,
+            seed=seed,
+            seed_text=seed_text,
+            run_dir=run_store.run_dir if run_store else None,
+            log_level=log_level,
+            log_file=log_file,
+            on_progress=on_progress,
+        )
+
+    rating = build_rating(cfg)
+    # Same metrics and pareto settings as the islands; big enough to keep all.
+    pool = build_pool(
+        cfg, rating=rating, max_size=max(1, sum(len(elites) for elites in finals))
+    )
+    for elites in finals:
+        pool.add_many(elites)
+
+    report = render_top_by_fitness_markdown(cfg=cfg, pool=pool, rating=rating, top=top)
+    output.write_text(report)
+    if run_store:
+        (run_store.run_dir / "best.md").write_text(report)
+        run_store.close()
+    logging.info(
+        "DONE – report saved to %s (best score %.3f)",
+        output,
+        rating.score(pool.best.ratings),
+    )
 
 
 @app.command()
@@ -448,6 +463,16 @@ def run(
         "--store/--no-store",
         help="Record run state, checkpoints, and LLM I/O under .fuzzyevolve/.",
     ),
+    islands: Optional[int] = typer.Option(
+        None,
+        "--islands",
+        help="Run K islands in separate processes with periodic migration.",
+    ),
+    migration_interval: Optional[int] = typer.Option(
+        None,
+        "--migration-interval",
+        help="Override islands.migration_interval (iterations between migrations).",
+    ),
 ) -> None:
     """Evolve text with LLM-backed mutation + ranking."""
     if resume is None and not seed and sys.stdin.isatty():
@@ -466,6 +491,67 @@ def run(
         quiet=quiet,
         resume=resume,
         store=store,
+        islands=islands,
+        migration_interval=migration_interval,
+    )
+
+
+@app.command()
+def replay(
+    run_dir: Path = typer.Argument(
+        ..., help="Recorded run directory whose llm.jsonl answers every LLM call."
+    ),
+    output: Path = typer.Option(
+        Path("replay.md"),
+        "-o",
+        "--output",
+        help="Path to save the final Markdown report (top by fitness).",
+    ),
+    top: int = typer.Option(
+        20,
+        "--top",
+        help="How many top individuals to include in the report (0 = all).",
+    ),
+    iterations: Optional[int] = typer.Option(
+        None,
+        "-i",
+        "--iterations",
+        help="Override iterations (defaults to the number the run completed).",
+    ),
+    log_level: str = typer.Option(
+        "info",
+        "-l",
+        "--log-level",
+        help="Logging level (debug, info, warning, error, critical) or a number.",
+    ),
+    log_file: Optional[Path] = typer.Option(None, help="Path to write detailed logs."),
+    quiet: bool = typer.Option(
+        False,
+        "-q",
+        "--quiet",
+        help="Suppress the progress bar and non-essential logging.",
+    ),
+    store: bool = typer.Option(
+        False,
+        "--store/--no-store",
+        help="Record the replay as a new run under .fuzzyevolve/.",
+    ),
+) -> None:
+    """Re-run a recorded run offline, answering LLM calls from its llm.jsonl."""
+    _execute_run(
+        seed_parts=None,
+        config=None,
+        output=output,
+        top=top,
+        iterations=iterations,
+        goal=None,
+        metric=None,
+        log_level=log_level,
+        log_file=log_file,
+        quiet=quiet,
+        resume=None,
+        store=store,
+        replay=run_dir,
     )
 
 
@@ -493,6 +579,147 @@ def tui(
     run_tui(data_dir=data_dir, run_dir=run, attach=attach)
 
 
+@app.command()
+def bench(
+    suite: str = typer.Option(
+        "all",
+        "--suite",
+        help="Which benchmarks to run: micro, macro or all.",
+    ),
+    quick: bool = typer.Option(
+        False, "--quick", help="Small sizes only (smoke test, CI)."
+    ),
+    repeat: int = typer.Option(3, "--repeat", min=1, help="Samples per case."),
+    budget: float = typer.Option(
+        30.0,
+        "--budget",
+        help="Skip larger sizes of a sweep once one case takes longer (seconds).",
+    ),
+    embeddings_model: Optional[str] = typer.Option(
+        None,
+        "--embeddings-model",
+        help="Sentence-transformers model to time (embedding case skipped if unset).",
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "-o", "--output", help="Write JSON results here instead of stdout."
+    ),
+) -> None:
+    """Time pool, rating, storage and engine hot paths; prints JSON."""
+    from fuzzyevolve.bench import run_benchmarks
+
+    if suite not in {"micro", "macro", "all"}:
+        raise typer.BadParameter("--suite must be micro, macro or all.")
+    results = run_benchmarks(
+        micro=suite in {"micro", "all"},
+        macro=suite in {"macro", "all"},
+        quick=quick,
+        repeat=repeat,
+        budget_s=budget,
+        embeddings_model=embeddings_model,
+    )
+    payload = json.dumps(results, indent=2)
+    if output is None:
+        typer.echo(payload)
+    else:
+        output.write_text(payload + "\n", encoding="utf-8")
+        typer.echo(f"Wrote {output}", err=True)
+
+
+@app.command("embed-worker")
+def embed_worker(
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket to listen on (defaults to [embeddings].worker_socket).",
+    ),
+    config: Optional[Path] = typer.Option(
+        None, "-c", "--config", help="Path to a TOML or JSON config file."
+    ),
+    model: Optional[str] = typer.Option(
+        None, "--model", help="Override [embeddings].model."
+    ),
+    max_batch: int = typer.Option(
+        256, "--max-batch", min=1, help="Most texts encoded in one model call."
+    ),
+    max_wait_ms: float = typer.Option(
+        5.0,
+        "--max-wait-ms",
+        min=0.0,
+        help="How long a request waits for others to join its batch.",
+    ),
+    log_level: str = typer.Option(
+        "info",
+        "-l",
+        "--log-level",
+        help="Logging level (debug, info, warning, error, critical) or a number.",
+    ),
+) -> None:
+    """Serve one embedding model to every run on this machine."""
+    from fuzzyevolve.config import load_config
+    from fuzzyevolve.console.logging import setup_logging
+    from fuzzyevolve.core.embeddings import SentenceTransformerProvider
+    from fuzzyevolve.embedding_worker import EmbeddingWorker
+
+    setup_logging(level=_parse_log_level(log_level))
+    config_path, config_message = _resolve_config_path(config)
+    cfg = load_config(str(config_path) if config_path else None)
+    logging.info("%s", config_message)
+    path = socket_path or cfg.embeddings.worker_socket
+    if path is None:
+        raise typer.BadParameter(
+            "Pass --socket or set [embeddings].worker_socket in the config."
+        )
+    model_name = model or cfg.embeddings.model
+    provider = SentenceTransformerProvider(
+        model_name,
+        cache_max_entries=cfg.embeddings.cache_max_entries,
+        cache_max_bytes=cfg.embeddings.cache_max_bytes,
+    )
+    worker = EmbeddingWorker(
+        path,
+        provider.embed_many,
+        model=model_name,
+        dim=provider.dim,
+        max_batch=max_batch,
+        max_wait_ms=max_wait_ms,
+    )
+    try:
+        worker.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.close()
+        logging.info("Embedding worker stopped (%s).", worker.stats())
+
+
+@app.command("migrate-texts")
+def migrate_texts(
+    run: Path = typer.Argument(..., help="Run directory (or checkpoint file)."),
+    keep_files: bool = typer.Option(
+        False, "--keep-files", help="Leave the old texts/<id>.txt files in place."
+    ),
+) -> None:
+    """Fold an older run's one-file-per-text texts/ into the text pack."""
+    from fuzzyevolve.run_store import RunStore
+
+    store = RunStore.open(run)
+    moved = store.migrate_text_files(remove=not keep_files)
+    store.text_store.close()
+    typer.echo(f"Packed {moved} texts into {store.text_store.data_path}")
+
+
+def _recorded_iterations(store: RunStore) -> int | None:
+    last: int | None = None
+    try:
+        with store.stats_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    last = int(json.loads(line)["iteration"])
+    except (OSError, ValueError, KeyError):
+        return last
+    return last
+
+
 def _read_seed_text(user_input: str | None) -> str:
     if user_input == "-":
         seed_text = sys.stdin.read()
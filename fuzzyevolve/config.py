@@ -16,24 +16,95 @@ class RunConfig(BaseModel):
     iterations: int = Field(10, ge=1)
     log_interval: int = Field(1, ge=0)
     checkpoint_interval: int = Field(
-        1,
+        50,
+        ge=0,
+        description=(
+            "Keep a full checkpoint (checkpoints/itNNNNNN.json) every N iterations "
+            "(0 disables periodic checkpoints; latest is still written)."
+        ),
+    )
+    snapshot_interval: int = Field(
+        25,
+        ge=1,
+        description=(
+            "Rewrite checkpoints/latest.json in full every N iterations; in between "
+            "each iteration appends only its changes to checkpoints/journal.jsonl."
+        ),
+    )
+    binary_checkpoints: bool = Field(
+        True,
+        description=(
+            "Also write checkpoints/latest.npz (embeddings, ratings, ages and packed "
+            "texts as arrays) at each snapshot, so resume rebuilds the pool from it "
+            "without reading text files or re-embedding."
+        ),
+    )
+    text_compression: Literal["none", "zlib"] = Field(
+        "none",
+        description=(
+            "Codec for new records in the texts/ pack (zlib is kept per record only "
+            "when it is smaller). Fixed when the run is created; resume keeps it."
+        ),
+    )
+    record_queue_size: int = Field(
+        10_000,
+        ge=1,
+        description=(
+            "Events, stats and LLM call records buffered for the background writer; "
+            "recording blocks only if the disk falls this far behind."
+        ),
+    )
+    record_flush_interval_s: float = Field(
+        0.5,
         ge=0,
+        description="Longest a recorded line waits before it is appended to disk.",
+    )
+    record_fsync: Literal["never", "batch"] = Field(
+        "never",
         description=(
-            "Save a checkpoint every N iterations (0 disables periodic checkpoints; "
-            "latest is still written)."
+            "`batch` fsyncs each JSONL file after every write batch (durable "
+            "against power loss); `never` leaves it to the OS."
         ),
     )
     random_seed: int | None = None
+    concurrency: Literal["threads", "asyncio"] = Field(
+        "threads",
+        description=(
+            "How LLM calls are driven. 'threads' blocks per call and fans mutation "
+            "jobs out over a thread pool (mutation.max_workers). 'asyncio' awaits "
+            "all calls on a single event loop."
+        ),
+    )
+    pipeline_depth: int = Field(
+        1,
+        ge=1,
+        description=(
+            "Number of iterations kept in flight (asyncio only). Values > 1 run a "
+            "steady-state pipeline: later iterations critique and mutate while "
+            "earlier ones are being judged. Pool updates are applied in iteration "
+            "order, so results stay reproducible for a given seed."
+        ),
+    )
+
+    @model_validator(mode="after")
+    def _validate_pipeline(self) -> "RunConfig":
+        if self.pipeline_depth > 1 and self.concurrency != "asyncio":
+            raise ValueError(
+                "run.pipeline_depth > 1 requires run.concurrency='asyncio'."
+            )
+        return self
 
 
 class PopulationConfig(BaseModel):
     size: int = Field(256, ge=1, description="Fixed population size.")
-    pruning: Literal["closest_pair", "knn_local_competition"] = Field(
+    pruning: Literal["closest_pair", "knn_local_competition", "pareto_front"] = Field(
         "closest_pair",
         description=(
             "Population pruning strategy. 'closest_pair' repeatedly removes the weaker "
             "of the closest pair in embedding space. 'knn_local_competition' uses kNN "
-            "local competition on insertion (default)."
+            "local competition on insertion (default). 'pareto_front' drops the worst "
+            "non-dominated fronts of per-metric LCB vectors, then the most crowded "
+            "members of the last front kept (NSGA-II)."
         ),
     )
     knn_k: int = Field(
@@ -41,6 +112,50 @@ class PopulationConfig(BaseModel):
         ge=1,
         description="k for 'knn_local_competition' pruning (number of nearest neighbors).",
     )
+    knn_index: Literal["exact", "lsh"] = Field(
+        "exact",
+        description=(
+            "Neighbour search for 'knn_local_competition'. 'exact' scans every "
+            "member; 'lsh' only ranks members sharing a random-hyperplane bucket "
+            "with the child (approximate, for pools of tens of thousands)."
+        ),
+    )
+    lsh_tables: int = Field(8, ge=1, description="Hash tables for knn_index='lsh'.")
+    lsh_bits: int = Field(
+        12, ge=1, le=62, description="Hyperplanes per hash table for knn_index='lsh'."
+    )
+
+
+class IslandsConfig(BaseModel):
+    count: int = Field(
+        1,
+        ge=1,
+        description=(
+            "Number of islands. Values > 1 run one engine per process, each with "
+            "its own pool and RNG streams derived from run.random_seed."
+        ),
+    )
+    migration_interval: int = Field(
+        10,
+        ge=1,
+        description="Exchange migrants between islands every N iterations.",
+    )
+    migrants: int = Field(
+        2, ge=1, description="Elites each island sends per migration."
+    )
+    selection: Literal["best", "diverse"] = Field(
+        "best",
+        description=(
+            "Which elites migrate. 'best' sends the top by score; 'diverse' starts "
+            "from the best and greedily adds the elites farthest (in embedding "
+            "space) from those already chosen."
+        ),
+    )
+    timeout_s: float = Field(
+        600.0,
+        gt=0.0,
+        description="Give up if a neighbouring island sends nothing for this long.",
+    )
 
 
 class MetricsConfig(BaseModel):
@@ -65,6 +180,13 @@ class RatingConfig(BaseModel):
 
     score_lcb_c: float = Field(2.0, ge=0.0)
     child_prior_tau: float = Field(4.0, ge=0.0)
+    backend: Literal["trueskill", "numpy"] = Field(
+        "trueskill",
+        description=(
+            "TrueSkill implementation: 'trueskill' rates each metric with the "
+            "trueskill package; 'numpy' rates all metrics in one vectorized pass."
+        ),
+    )
 
 
 class EmbeddingsConfig(BaseModel):
@@ -72,6 +194,37 @@ class EmbeddingsConfig(BaseModel):
         "sentence-transformers/all-MiniLM-L6-v2",
         description=("Embedding model name (a sentence-transformers model name)."),
     )
+    persist: bool = Field(
+        True,
+        description=(
+            "Save embeddings under the run directory (embeddings/, keyed by text "
+            "hash) so resumes and islands reuse them instead of re-encoding."
+        ),
+    )
+    cache_max_entries: int = Field(
+        4096,
+        ge=0,
+        description="In-memory LRU size for embeddings (0 disables the cache).",
+    )
+    cache_max_bytes: int = Field(
+        64 * 1024 * 1024,
+        ge=0,
+        description="Upper bound on vector bytes held by the in-memory LRU.",
+    )
+    background_load: bool = Field(
+        True,
+        description=(
+            "Load the embedding model on a background thread so startup and the "
+            "first LLM calls don't wait for it; the first embed blocks until ready."
+        ),
+    )
+    worker_socket: str | None = Field(
+        None,
+        description=(
+            "Unix socket of a shared `fuzzyevolve embed-worker`. When set, runs "
+            "embed through that process instead of loading their own model."
+        ),
+    )
 
     @model_validator(mode="after")
     def _validate_model(self) -> "EmbeddingsConfig":
@@ -132,6 +285,36 @@ class PromptConfig(BaseModel):
     show_metric_stats: bool = True
 
 
+class CritiqueCacheConfig(BaseModel):
+    enabled: bool = Field(
+        False,
+        description=(
+            "Reuse critiques for parents whose text and quantized ratings were seen "
+            "recently instead of calling the critic again."
+        ),
+    )
+    max_entries: int = Field(1024, ge=1, description="LRU capacity.")
+    ttl_s: float | None = Field(
+        None,
+        gt=0.0,
+        description="Expire entries after this many seconds (None = never).",
+    )
+    mu_step: float = Field(
+        1.0,
+        ge=0.0,
+        description="Bucket width for μ in the cache key (0 ignores μ).",
+    )
+    sigma_step: float = Field(
+        1.0,
+        ge=0.0,
+        description="Bucket width for σ in the cache key (0 ignores σ).",
+    )
+    persist: bool = Field(
+        True,
+        description="Keep the cache in the run directory so resumed runs start warm.",
+    )
+
+
 class CriticConfig(BaseModel):
     enabled: bool = True
     routes: int = Field(
@@ -139,6 +322,17 @@ class CriticConfig(BaseModel):
         ge=1,
         description="How many distinct rewrite routes to generate per critique.",
     )
+    prefetch: bool = Field(
+        False,
+        description=(
+            "Pick the next parent while the current battle is judged and start its "
+            "critique early. The pick is made before the battle's rating update and "
+            "is discarded if that parent took part in the battle or got pruned. "
+            "Ignored when "
+            "run.pipeline_depth > 1, which already overlaps critiques."
+        ),
+    )
+    cache: CritiqueCacheConfig = Field(default_factory=CritiqueCacheConfig)
     instructions: str = (
         "You are a critique agent helping an evolutionary text system.\n"
         "Analyze the PARENT text and propose actionable guidance.\n"
@@ -310,6 +504,27 @@ class AnchorsConfig(BaseModel):
     ghost_interval: int = Field(10, ge=0)
 
 
+class FakeLLMConfig(BaseModel):
+    """Behaviour of `fake:*` models (offline stand-ins for load tests)."""
+
+    latency_ms: float = Field(0.0, ge=0.0, description="Mean latency per call.")
+    latency_jitter_ms: float = Field(
+        0.0,
+        ge=0.0,
+        description="Spread for 'uniform' (±) and tail width for 'lognormal'.",
+    )
+    latency_distribution: Literal["fixed", "uniform", "exponential", "lognormal"] = (
+        "fixed"
+    )
+    failure_rate: float = Field(
+        0.0, ge=0.0, le=1.0, description="Probability a call raises."
+    )
+    output_chars: int = Field(800, ge=1, description="Length of rewritten texts.")
+    seed: int | None = Field(
+        None, description="Seed for fake outputs (defaults to run.random_seed)."
+    )
+
+
 class LLMConfig(BaseModel):
     ensemble: list[ModelSpec] = Field(
         default_factory=lambda: [
@@ -328,6 +543,18 @@ class LLMConfig(BaseModel):
     judge_model: str = "google-gla:gemini-3-pro-preview"
     critic_model: str | None = None
     critic_temperature: float = Field(0.2, ge=0.0)
+    response_cache: bool = Field(
+        False,
+        description=(
+            "Cache LLM responses on disk keyed by (model, settings, prompt hash). "
+            "Reruns with the same seed then replay cached answers for free."
+        ),
+    )
+    response_cache_dir: str | None = Field(
+        None,
+        description="Cache directory (defaults to .fuzzyevolve/llm_cache).",
+    )
+    fake: FakeLLMConfig = Field(default_factory=FakeLLMConfig)
 
     @model_validator(mode="after")
     def _validate_ensemble(self) -> "LLMConfig":
@@ -339,6 +566,7 @@ class LLMConfig(BaseModel):
 class Config(BaseModel):
     run: RunConfig = Field(default_factory=RunConfig)
     population: PopulationConfig = Field(default_factory=PopulationConfig)
+    islands: IslandsConfig = Field(default_factory=IslandsConfig)
     task: TaskConfig = Field(default_factory=TaskConfig)
     metrics: MetricsConfig = Field(default_factory=MetricsConfig)
     prompts: PromptConfig = Field(default_factory=PromptConfig)
@@ -62,6 +62,7 @@ class AnchorPool:
             },
             age=elite.age if age is None else age,
             label="GHOST",
+            text_id=elite.text_id,
         )
         return self._add_anchor(anchor)
 
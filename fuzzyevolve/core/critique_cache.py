@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import asdict
+from pathlib import Path
+
+from fuzzyevolve.core.critique import Critique
+from fuzzyevolve.core.models import Elite, Ratings
+from fuzzyevolve.core.ports import Critic, acall
+
+log_cache = logging.getLogger("critique_cache")
+
+
+def rating_signature(
+    ratings: Ratings,
+    *,
+    metrics: Sequence[str],
+    mu_step: float,
+    sigma_step: float,
+) -> str:
+    """Quantize μ/σ per metric so small rating drift maps to the same key.
+
+    A step <= 0 drops that component from the signature entirely.
+    """
+    parts: list[str] = []
+    for metric in metrics:
+        rating = ratings.get(metric)
+        if rating is None:
+            parts.append(f"{metric}:-")
+            continue
+        mu = round(float(rating.mu) / mu_step) if mu_step > 0 else "*"
+        sigma = round(float(rating.sigma) / sigma_step) if sigma_step > 0 else "*"
+        parts.append(f"{metric}:{mu}:{sigma}")
+    return ",".join(parts)
+
+
+def critique_cache_key(
+    text: str,
+    ratings: Ratings,
+    *,
+    metrics: Sequence[str],
+    mu_step: float,
+    sigma_step: float,
+) -> str:
+    text_id = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    signature = rating_signature(
+        ratings, metrics=metrics, mu_step=mu_step, sigma_step=sigma_step
+    )
+    return f"{text_id}|{signature}"
+
+
+class CritiqueCache:
+    """LRU + TTL cache of critiques, optionally persisted as JSONL.
+
+    Persisted entries are appended as they are stored and replayed on startup,
+    so a resumed run starts warm. Expiry uses wall-clock time for that reason.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_s: float | None = None,
+        path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer.")
+        if ttl_s is not None and ttl_s <= 0:
+            raise ValueError("ttl_s must be > 0 (or None for no expiry).")
+        self.max_entries = int(max_entries)
+        self.ttl_s = ttl_s
+        self.path = path
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, Critique]] = OrderedDict()
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Critique | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0]):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, critique: Critique) -> None:
+        stored_at = self.clock()
+        with self._lock:
+            self._insert(key, stored_at, critique)
+            if self.path is not None:
+                self._append(key, stored_at, critique)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_s is not None and self.clock() - stored_at > self.ttl_s
+
+    def _insert(self, key: str, stored_at: float, critique: Critique) -> None:
+        self._entries[key] = (stored_at, critique)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _append(self, key: str, stored_at: float, critique: Critique) -> None:
+        line = {"key": key, "ts": stored_at, "critique": asdict(critique)}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+        except Exception:
+            log_cache.exception("Failed to persist critique cache entry.")
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        lines = 0
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                for raw in f:
+                    if not raw.strip():
+                        continue
+                    lines += 1
+                    try:
+                        item = json.loads(raw)
+                        data = item["critique"]
+                        critique = Critique(
+                            summary=str(data.get("summary", "")),
+                            preserve=tuple(data.get("preserve", ())),
+                            issues=tuple(data.get("issues", ())),
+                            routes=tuple(data.get("routes", ())),
+                            constraints=tuple(data.get("constraints", ())),
+                        )
+                        stored_at = float(item["ts"])
+                    except Exception:
+                        # A torn trailing line from an interrupted run.
+                        continue
+                    if self._expired(stored_at):
+                        continue
+                    self._insert(str(item["key"]), stored_at, critique)
+        except Exception:
+            log_cache.exception("Failed to load critique cache; starting empty.")
+            return
+        self.evictions = 0
+        if lines > 2 * len(self._entries):
+            self._compact()
+
+    def _compact(self) -> None:
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        try:
+            with tmp.open("w", encoding="utf-8") as f:
+                for key, (stored_at, critique) in self._entries.items():
+                    line = {"key": key, "ts": stored_at, "critique": asdict(critique)}
+                    f.write(json.dumps(line, ensure_ascii=False) + "\n")
+            tmp.replace(self.path)
+        except Exception:
+            log_cache.exception("Failed to compact critique cache.")
+
+
+class CachedCritic:
+    """Critic wrapper that reuses critiques for recently seen parents.
+
+    Failed critiques (None) are not cached so they are retried next time.
+    """
+
+    def __init__(
+        self,
+        critic: Critic,
+        *,
+        cache: CritiqueCache,
+        metrics: Sequence[str],
+        mu_step: float,
+        sigma_step: float,
+    ) -> None:
+        self.critic = critic
+        self.cache = cache
+        self.metrics = list(metrics)
+        self.mu_step = float(mu_step)
+        self.sigma_step = float(sigma_step)
+
+    def critique(self, *, parent: Elite) -> Critique | None:
+        key = self._key(parent)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        critique = self.critic.critique(parent=parent)
+        if critique is not None:
+            self.cache.put(key, critique)
+        return critique
+
+    async def acritique(self, *, parent: Elite) -> Critique | None:
+        key = self._key(parent)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        critique = await acall(self.critic, "acritique", "critique", parent=parent)
+        if critique is not None:
+            self.cache.put(key, critique)
+        return critique
+
+    def cache_stats(self) -> dict[str, int]:
+        return self.cache.stats()
+
+    def _key(self, parent: Elite) -> str:
+        return critique_cache_key(
+            parent.text,
+            parent.ratings,
+            metrics=self.metrics,
+            mu_step=self.mu_step,
+            sigma_step=self.sigma_step,
+        )
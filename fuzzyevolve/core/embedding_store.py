@@ -0,0 +1,207 @@
+"""Persistent embedding cache keyed by sha256 text id.
+
+Vectors live in one append-only float32 file per (model, dim) tag, read back
+through a memory map, with a parallel `ids.txt` (one text id per line, in row
+order). A row only counts once its id line is written, so a crash between the
+two appends leaves at most an orphan vector that is truncated on next open.
+
+    embeddings/<model-slug>-<dim>/meta.json
+    embeddings/<model-slug>-<dim>/vectors.f32
+    embeddings/<model-slug>-<dim>/ids.txt
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import numpy as np
+
+log_embed = logging.getLogger("embeddings")
+
+
+def text_id(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def store_tag(model: str, dim: int) -> str:
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", model).strip("_") or "model"
+    return f"{slug}-{int(dim)}"
+
+
+class EmbeddingStore:
+    def __init__(
+        self, root: Path, *, model: str, dim: int, read_only: bool = False
+    ) -> None:
+        if dim <= 0:
+            raise ValueError("dim must be a positive integer.")
+        self.root = root
+        self.model = model
+        self.dim = int(dim)
+        self.read_only = read_only
+        self.vectors_path = root / "vectors.f32"
+        self.ids_path = root / "ids.txt"
+        self.meta_path = root / "meta.json"
+        self._row_bytes = self.dim * 4
+        self._rows: dict[str, int] = {}
+        self._mmap: np.memmap | None = None
+        self._lock = threading.Lock()
+        self._open()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def get_many(self, text_ids: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """(vectors, found) for `text_ids`; missing rows are zero."""
+        out = np.zeros((len(text_ids), self.dim), dtype=np.float32)
+        found = np.zeros(len(text_ids), dtype=bool)
+        with self._lock:
+            rows = [self._rows.get(key, -1) for key in text_ids]
+            positions = [i for i, row in enumerate(rows) if row >= 0]
+            if positions:
+                matrix = self._mapped()
+                out[positions] = matrix[[rows[i] for i in positions]]
+                found[positions] = True
+        return out, found
+
+    def put_many(self, text_ids: Sequence[str], vectors: np.ndarray) -> None:
+        if self.read_only:
+            return
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(text_ids), -1)
+        if vectors.shape[1] != self.dim:
+            raise ValueError(
+                f"Expected {self.dim}-dim vectors, got {vectors.shape[1]}."
+            )
+        with self._lock:
+            fresh: dict[str, int] = {}
+            for i, key in enumerate(text_ids):
+                if key not in self._rows and key not in fresh:
+                    fresh[key] = i
+            if not fresh:
+                return
+            block = np.ascontiguousarray(vectors[list(fresh.values())])
+            with self.vectors_path.open("ab") as f:
+                f.write(block.tobytes())
+            with self.ids_path.open("a", encoding="utf-8") as f:
+                f.write("".join(f"{key}\n" for key in fresh))
+            start = len(self._rows)
+            for offset, key in enumerate(fresh):
+                self._rows[key] = start + offset
+
+    def _open(self) -> None:
+        if not self.root.exists():
+            if self.read_only:
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+        if self.meta_path.exists():
+            meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+            if meta.get("model") != self.model or int(meta.get("dim", 0)) != self.dim:
+                raise ValueError(
+                    f"Embedding store at {self.root} holds {meta.get('model')!r} "
+                    f"({meta.get('dim')}-dim) vectors, not {self.model!r} ({self.dim}-dim)."
+                )
+        elif not self.read_only:
+            self.meta_path.write_text(
+                json.dumps({"model": self.model, "dim": self.dim}) + "\n",
+                encoding="utf-8",
+            )
+
+        ids: list[str] = []
+        if self.ids_path.exists():
+            ids = self.ids_path.read_text(encoding="utf-8").split("\n")
+            # A torn final line (no newline) was never committed.
+            ids = ids[:-1]
+        stored_rows = (
+            self.vectors_path.stat().st_size // self._row_bytes
+            if self.vectors_path.exists()
+            else 0
+        )
+        if len(ids) > stored_rows:
+            log_embed.warning(
+                "Embedding store %s lists %d ids but has %d vectors; ignoring the rest.",
+                self.root,
+                len(ids),
+                stored_rows,
+            )
+            ids = ids[:stored_rows]
+        if not self.read_only:
+            self._truncate(len(ids))
+        self._rows = {key: row for row, key in enumerate(ids)}
+
+    def _truncate(self, rows: int) -> None:
+        if self.vectors_path.exists():
+            with self.vectors_path.open("r+b") as f:
+                f.truncate(rows * self._row_bytes)
+        if self.ids_path.exists():
+            with self.ids_path.open("r+b") as f:
+                data = f.read()
+                keep = len(b"".join(data.split(b"\n")[:rows])) + rows
+                f.truncate(keep)
+
+    def _mapped(self) -> np.memmap:
+        rows = len(self._rows)
+        if self._mmap is None or self._mmap.shape[0] < rows:
+            self._mmap = np.memmap(
+                self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dim)
+            )
+        return self._mmap
+
+
+class StoredEmbedder:
+    """Read-through `embed`/`embed_many` over an `EmbeddingStore`.
+
+    Only texts missing from the store reach the wrapped embedder (in one
+    batch); their vectors are appended for the next process to reuse.
+    `store` may be a zero-argument factory, opened on first use (e.g. when
+    the dimension is only known once a background-loaded model is ready).
+    """
+
+    def __init__(
+        self,
+        store: EmbeddingStore | Callable[[], EmbeddingStore],
+        embed_many: Callable[[Sequence[str]], np.ndarray],
+    ) -> None:
+        self._store = store if isinstance(store, EmbeddingStore) else None
+        self._open_store = None if self._store is not None else store
+        self._open_lock = threading.Lock()
+        self._embed_many = embed_many
+
+    @property
+    def store(self) -> EmbeddingStore:
+        if self._store is None:
+            with self._open_lock:
+                if self._store is None:
+                    self._store = self._open_store()
+        return self._store
+
+    @property
+    def dim(self) -> int:
+        return self.store.dim
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        texts = list(texts)
+        keys = [text_id(text) for text in texts]
+        vectors, found = self.store.get_many(keys)
+        missing = np.flatnonzero(~found)
+        if missing.size:
+            unique = list(dict.fromkeys(texts[i] for i in missing))
+            computed = np.asarray(self._embed_many(unique), dtype=np.float32)
+            by_text = dict(zip(unique, computed))
+            for i in missing:
+                vectors[i] = by_text[texts[i]]
+            try:
+                self.store.put_many([text_id(t) for t in unique], computed)
+            except Exception:
+                log_embed.exception("Failed to persist embeddings.")
+        return vectors
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from typing import Protocol
+import hashlib
+import json
+import socket
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+from typing import Any, Protocol
 
 import numpy as np
 
@@ -10,32 +18,369 @@ class EmbeddingProvider(Protocol):
 
     def embed(self, text: str) -> np.ndarray: ...
 
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        """Unit vectors for `texts` as a (len(texts), dim) array."""
+        ...
+
+
+def embed_each(
+    embed: Callable[[str], np.ndarray],
+) -> Callable[[Sequence[str]], np.ndarray]:
+    """Adapt a single-text embedder to the `embed_many` signature."""
+
+    def embed_many(texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, 0))
+        return np.stack([np.asarray(embed(text)).reshape(-1) for text in texts])
+
+    return embed_many
+
+
+class EmbeddingCache:
+    """Bounded LRU of embeddings keyed by the sha256 digest of the text.
+
+    Holds 32-byte digests rather than the texts themselves; evicts least
+    recently used entries past `max_entries` or `max_bytes` (vector bytes).
+    A limit of 0 disables caching.
+    """
+
+    def __init__(self, *, max_entries: int, max_bytes: int) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries must be >= 0.")
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0.")
+        self.max_entries = int(max_entries)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, text: str) -> np.ndarray | None:
+        key = _digest(text)
+        with self._lock:
+            vec = self._entries.get(key)
+            if vec is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vec
+
+    def put(self, text: str, vec: np.ndarray) -> None:
+        if self.max_entries == 0 or vec.nbytes > self.max_bytes:
+            return
+        key = _digest(text)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old.nbytes
+            self._entries[key] = vec
+            self.nbytes += vec.nbytes
+            while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+                _key, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def _import_sentence_transformer():
+    try:
+        from sentence_transformers import SentenceTransformer
+    except Exception as exc:
+        raise ImportError(
+            "sentence-transformers is required for embeddings. "
+            "Install with `pip install sentence-transformers`."
+        ) from exc
+    return SentenceTransformer
+
 
 class SentenceTransformerProvider:
-    def __init__(self, model_name: str, device: str | None = None) -> None:
+    """sentence-transformers embeddings with a bounded in-memory cache.
+
+    With `background=True` the model (and torch) loads on a daemon thread
+    started by the constructor, so callers can keep working until the first
+    `embed`/`dim` access, which waits for it. Load errors surface there.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        device: str | None = None,
+        *,
+        cache_max_entries: int = 4096,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+        background: bool = False,
+    ) -> None:
+        self.model_name = model_name
+        self.device = device
+        self.cache = EmbeddingCache(
+            max_entries=cache_max_entries, max_bytes=cache_max_bytes
+        )
+        self._model = None
+        self._dim: int | None = None
+        self._load_error: BaseException | None = None
+        self._load_lock = threading.Lock()
+        if background:
+            threading.Thread(
+                target=self._load_quietly, name="embedding-model-load", daemon=True
+            ).start()
+        else:
+            self.load()
+
+    @property
+    def model(self):
+        self.load()
+        return self._model
+
+    @property
+    def dim(self) -> int:
+        self.load()
+        assert self._dim is not None
+        return self._dim
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    def load(self) -> None:
+        """Load the model now (or wait for the background load to finish)."""
+        if self._model is not None:
+            return
+        with self._load_lock:
+            if self._load_error is not None:
+                raise self._load_error
+            if self._model is not None:
+                return
+            try:
+                SentenceTransformer = _import_sentence_transformer()
+                model = SentenceTransformer(self.model_name, device=self.device)
+                self._dim = int(model.get_sentence_embedding_dimension())
+            except Exception as exc:
+                self._load_error = exc
+                raise
+            self._model = model
+
+    def _load_quietly(self) -> None:
         try:
-            from sentence_transformers import SentenceTransformer
-        except Exception as exc:
-            raise ImportError(
-                "sentence-transformers is required for embeddings. "
-                "Install with `pip install sentence-transformers`."
-            ) from exc
-        self.model = SentenceTransformer(model_name, device=device)
-        self.dim = self.model.get_sentence_embedding_dimension()
-        self._cache: dict[str, np.ndarray] = {}
+            self.load()
+        except Exception:
+            # Re-raised from `load()` on first use, on the caller's thread.
+            pass
 
     def embed(self, text: str) -> np.ndarray:
-        cached = self._cache.get(text)
-        if cached is not None:
-            return cached
-        vec = self.model.encode(
-            [text],
-            convert_to_numpy=True,
-            normalize_embeddings=True,
-        )[0]
-        if vec.ndim != 1:
-            vec = np.asarray(vec).reshape(-1)
-        norm = np.linalg.norm(vec) or 1.0
-        vec = vec / norm
-        self._cache[text] = vec
-        return vec
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        found: dict[str, np.ndarray] = {}
+        for text in dict.fromkeys(texts):
+            vec = self.cache.get(text)
+            if vec is not None:
+                found[text] = vec
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if missing:
+            # One encode call so the model batches every uncached text.
+            vecs = self.model.encode(
+                missing,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
+            vecs = np.asarray(vecs).reshape(len(missing), -1)
+            norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            for text, vec in zip(missing, vecs / norms):
+                # Copy so a cached row does not pin the whole batch array.
+                vec = vec.copy()
+                found[text] = vec
+                self.cache.put(text, vec)
+        return np.stack([found[text] for text in texts])
+
+    def cache_stats(self) -> dict[str, int]:
+        return self.cache.stats()
+
+
+# Framing shared with `fuzzyevolve.embedding_worker`: a 4-byte big-endian
+# length, then a JSON header; `embed` replies are followed by n*dim
+# little-endian float32 values.
+_FRAME = struct.Struct(">I")
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+
+def write_frame(
+    sock: socket.socket, header: Mapping[str, Any], body: bytes = b""
+) -> None:
+    data = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    sock.sendall(_FRAME.pack(len(data)) + data + body)
+
+
+def read_frame(sock: socket.socket) -> dict[str, Any] | None:
+    """Next JSON header, or None if the peer closed the connection cleanly."""
+    raw = read_exact(sock, _FRAME.size, eof_ok=True)
+    if raw is None:
+        return None
+    (size,) = _FRAME.unpack(raw)
+    if size > MAX_FRAME_BYTES:
+        raise ValueError(f"Embedding worker frame too large ({size} bytes).")
+    return json.loads(read_exact(sock, size).decode("utf-8"))
+
+
+def read_exact(sock: socket.socket, size: int, *, eof_ok: bool = False) -> bytes | None:
+    buf = bytearray(size)
+    view = memoryview(buf)
+    got = 0
+    while got < size:
+        n = sock.recv_into(view[got:])
+        if n == 0:
+            if eof_ok and got == 0:
+                return None
+            raise ConnectionError("Embedding worker connection closed mid-message.")
+        got += n
+    return bytes(buf)
+
+
+class WorkerEmbeddingProvider:
+    """Embeddings served by a shared `fuzzyevolve embed-worker` process.
+
+    Many runs share one loaded model; the worker batches their requests
+    together. Each thread keeps its own connection, so concurrent embeds from
+    one run batch too. Keeps the same local LRU as the in-process provider.
+    """
+
+    def __init__(
+        self,
+        socket_path: str | Path,
+        *,
+        model: str | None = None,
+        timeout_s: float = 120.0,
+        cache_max_entries: int = 4096,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.socket_path = str(socket_path)
+        self.model_name = model
+        self.timeout_s = timeout_s
+        self.cache = EmbeddingCache(
+            max_entries=cache_max_entries, max_bytes=cache_max_bytes
+        )
+        self._dim: int | None = None
+        self._local = threading.local()
+        # Every thread's connection, so close() can reach them all.
+        self._conns: list[socket.socket] = []
+        self._conns_lock = threading.Lock()
+
+    @property
+    def dim(self) -> int:
+        if self._dim is None:
+            info = self._request({"op": "info"})
+            if self.model_name is not None and info.get("model") != self.model_name:
+                raise ValueError(
+                    f"Embedding worker at {self.socket_path} serves "
+                    f"{info.get('model')!r}, not {self.model_name!r}."
+                )
+            self._dim = int(info["dim"])
+        return self._dim
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.embed_many([text])[0]
+
+    def embed_many(self, texts: Sequence[str]) -> np.ndarray:
+        texts = list(texts)
+        dim = self.dim
+        if not texts:
+            return np.zeros((0, dim), dtype=np.float32)
+        found: dict[str, np.ndarray] = {}
+        for text in dict.fromkeys(texts):
+            vec = self.cache.get(text)
+            if vec is not None:
+                found[text] = vec
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if missing:
+            header, body = self._request_vectors({"op": "embed", "texts": missing})
+            vecs = np.frombuffer(body, dtype="<f4").reshape(int(header["n"]), dim)
+            for text, vec in zip(missing, vecs):
+                vec = vec.astype(np.float32)
+                found[text] = vec
+                self.cache.put(text, vec)
+        return np.stack([found[text] for text in texts])
+
+    def cache_stats(self) -> dict[str, int]:
+        return self.cache.stats()
+
+    def close(self) -> None:
+        """Close the connections of every thread that used this provider."""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local.conn = None
+
+    def _request(self, header: Mapping[str, Any]) -> dict[str, Any]:
+        return self._request_vectors(header)[0]
+
+    def _request_vectors(
+        self, header: Mapping[str, Any]
+    ) -> tuple[dict[str, Any], bytes]:
+        # One reconnect covers a worker restart between requests.
+        for attempt in (0, 1):
+            conn = self._connection()
+            try:
+                write_frame(conn, header)
+                reply = read_frame(conn)
+                if reply is None:
+                    raise ConnectionError("Embedding worker closed the connection.")
+                body = b""
+                if "error" not in reply and header.get("op") == "embed":
+                    body = read_exact(conn, int(reply["n"]) * int(reply["dim"]) * 4)
+            except OSError:
+                self._drop_connection(conn)
+                if attempt:
+                    raise
+                continue
+            if "error" in reply:
+                raise RuntimeError(f"Embedding worker failed: {reply['error']}")
+            return reply, body
+        raise AssertionError("unreachable")
+
+    def _connection(self) -> socket.socket:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            conn.settimeout(self.timeout_s)
+            try:
+                conn.connect(self.socket_path)
+            except OSError as exc:
+                conn.close()
+                raise ConnectionError(
+                    f"No embedding worker at {self.socket_path} "
+                    "(start one with `fuzzyevolve embed-worker`)."
+                ) from exc
+            with self._conns_lock:
+                self._conns.append(conn)
+            self._local.conn = conn
+        return conn
+
+    def _drop_connection(self, conn: socket.socket) -> None:
+        with self._conns_lock:
+            if conn in self._conns:
+                self._conns.remove(conn)
+        conn.close()
+        self._local.conn = None
@@ -1,24 +1,37 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
 import random
-from collections.abc import Callable, Mapping, Sequence
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any, Protocol
 
 import numpy as np
 
 from fuzzyevolve.config import Config
 from fuzzyevolve.core.anchors import AnchorManager, AnchorPolicy
-from fuzzyevolve.core.battle import build_battle
+from fuzzyevolve.core.battle import Battle, build_battle
 from fuzzyevolve.core.critique import Critique
+from fuzzyevolve.core.embeddings import embed_each
 from fuzzyevolve.core.models import Anchor, Elite, EvolutionResult, IterationSnapshot
 from fuzzyevolve.core.models import MutationCandidate
 from fuzzyevolve.core.multiobjective import Scalarizer
 from fuzzyevolve.core.pool import CrowdedPool
 from fuzzyevolve.core.pool import cosine_distance
-from fuzzyevolve.core.ports import Critic, Mutator, Ranker
-from fuzzyevolve.core.ratings import RatingSystem
+from fuzzyevolve.core.ports import Critic, Mutator, Ranker, accepts_kwarg, acall
+from fuzzyevolve.core.ratings import BattleRanking, RatingSystem
 
 log_evo = logging.getLogger("evolution")
 
@@ -48,9 +61,39 @@ class Recorder(Protocol):
         pool: CrowdedPool,
         anchor_manager: AnchorManager | None,
         keep: bool,
+        snapshot_interval: int = 1,
+        binary: bool = False,
     ) -> None: ...
 
 
+@dataclass(slots=True)
+class _Prefetch:
+    """Next parent picked while the current battle is judged, plus its critique."""
+
+    parent: Elite
+    scalarization: dict[str, float] | None
+    scalarization_source: str | None
+    weights: list[float] | None
+    critique: Future[Critique | None] | asyncio.Task[Critique | None]
+    # The parent also played in the battle being judged, so its ratings (and
+    # any critique prompt or cache key built from them) are about to change.
+    in_battle: bool
+
+
+class _EarlyEmbeddings:
+    """Children embedded while the rest of a step's mutation jobs still run."""
+
+    def __init__(self) -> None:
+        self.vectors: dict[str, np.ndarray] = {}
+        self._claimed: set[str] = set()
+
+    def claim(self, texts: Iterable[str]) -> list[str]:
+        """Texts not yet embedded or in flight; marks them as in flight."""
+        fresh = [t for t in dict.fromkeys(texts) if t not in self._claimed]
+        self._claimed.update(fresh)
+        return fresh
+
+
 class EvolutionEngine:
     def __init__(
         self,
@@ -67,10 +110,14 @@ class EvolutionEngine:
         rng: random.Random,
         store: Recorder | None = None,
         scalarizer: Scalarizer | None = None,
+        embed_many: Callable[[Sequence[str]], np.ndarray] | None = None,
+        embedding_stats: Callable[[], Mapping[str, int]] | None = None,
     ) -> None:
         self.cfg = cfg
         self.pool = pool
         self.embed = embed
+        self.embed_many = embed_many or embed_each(embed)
+        self.embedding_stats = embedding_stats
         self.rating = rating
         self.selector = selector
         self.critic = critic
@@ -80,6 +127,11 @@ class EvolutionEngine:
         self.rng = rng
         self.store = store
         self.scalarizer = scalarizer
+        self._prefetched: _Prefetch | None = None
+        # Children are embedded from mutation threads, `to_thread` workers of
+        # several pipelined iterations and the loop itself; one lock keeps
+        # `embed_many` single-threaded so embedders need not be thread-safe.
+        self._embed_lock = threading.Lock()
 
     def run(
         self,
@@ -102,6 +154,28 @@ class EvolutionEngine:
             start_iteration=start_iteration, on_iteration=on_iteration
         )
 
+    async def arun(
+        self,
+        seed_text: str,
+        *,
+        on_iteration: Callable[[IterationSnapshot], None] | None = None,
+    ) -> EvolutionResult:
+        """Async `run`: LLM calls are awaited on the running event loop."""
+        self._seed(seed_text)
+        return await self._arun_loop(start_iteration=0, on_iteration=on_iteration)
+
+    async def aresume(
+        self,
+        *,
+        start_iteration: int,
+        on_iteration: Callable[[IterationSnapshot], None] | None = None,
+    ) -> EvolutionResult:
+        if start_iteration < 0:
+            raise ValueError("start_iteration must be >= 0.")
+        return await self._arun_loop(
+            start_iteration=start_iteration, on_iteration=on_iteration
+        )
+
     def _run_loop(
         self,
         *,
@@ -115,125 +189,249 @@ class EvolutionEngine:
                 self.cfg.mutation.max_workers,
             )
             mutation_executor = ThreadPoolExecutor(max_workers=max_workers)
+        prefetch_executor: ThreadPoolExecutor | None = None
+        if self._prefetch_enabled():
+            prefetch_executor = ThreadPoolExecutor(max_workers=1)
 
         try:
             end_iteration = start_iteration + self.cfg.run.iterations
             for iteration in range(start_iteration, end_iteration):
                 if self.store:
                     self.store.set_iteration(iteration + 1)
-                self.step(iteration, mutation_executor=mutation_executor)
-
-                best = self.best_elite()
-                snapshot = IterationSnapshot(
-                    iteration=iteration + 1,
-                    best_score=self.rating.score(best.ratings),
-                    pool_size=len(self.pool),
-                    best_elite=best,
+                self.step(
+                    iteration,
+                    mutation_executor=mutation_executor,
+                    prefetch_executor=(
+                        prefetch_executor if iteration + 1 < end_iteration else None
+                    ),
                 )
-                if on_iteration:
-                    on_iteration(snapshot)
+                self._end_iteration(iteration, on_iteration=on_iteration)
+        finally:
+            self._drop_prefetch()
+            if mutation_executor is not None:
+                mutation_executor.shutdown(wait=True)
+            if prefetch_executor is not None:
+                prefetch_executor.shutdown(wait=True, cancel_futures=True)
+
+        return self._result()
 
-                if self.anchors and self.anchors.maybe_add_ghost(
-                    best, iteration=iteration + 1
-                ):
-                    log_evo.info("Added ghost anchor at iteration %d.", iteration + 1)
+    async def _arun_loop(
+        self,
+        *,
+        start_iteration: int,
+        on_iteration: Callable[[IterationSnapshot], None] | None,
+    ) -> EvolutionResult:
+        end_iteration = start_iteration + self.cfg.run.iterations
+        depth = int(getattr(self.cfg.run, "pipeline_depth", 1))
+        if depth > 1:
+            await self._arun_pipelined(
+                start_iteration=start_iteration,
+                end_iteration=end_iteration,
+                depth=depth,
+                on_iteration=on_iteration,
+            )
+            return self._result()
 
+        prefetch = self._prefetch_enabled()
+        try:
+            for iteration in range(start_iteration, end_iteration):
                 if self.store:
-                    try:
-                        pool_elites = list(self.pool.iter_elites())
-                        scores = np.array(
-                            [self.rating.score(e.ratings) for e in pool_elites],
-                            dtype=float,
-                        )
-                        extra: dict[str, Any] = {
-                            "best_text_id": self.store.put_text(best.text),
-                        }
-                        if scores.size:
-                            extra.update(
-                                {
-                                    "mean_score": float(scores.mean()),
-                                    "p50_score": float(np.percentile(scores, 50)),
-                                    "p90_score": float(np.percentile(scores, 90)),
-                                    "min_score": float(scores.min()),
-                                    "max_score": float(scores.max()),
-                                    "std_score": float(scores.std()),
-                                }
-                            )
-
-                        if len(pool_elites) >= 2:
-                            embeddings = np.stack([e.embedding for e in pool_elites])
-                            sims = embeddings @ embeddings.T
-                            np.fill_diagonal(sims, -np.inf)
-                            nn_sim = sims.max(axis=1)
-                            nn_dist = 1.0 - nn_sim
-                            extra.update(
-                                {
-                                    "diversity_nn_mean": float(nn_dist.mean()),
-                                    "diversity_nn_p10": float(
-                                        np.percentile(nn_dist, 10)
-                                    ),
-                                    "diversity_nn_p50": float(
-                                        np.percentile(nn_dist, 50)
-                                    ),
-                                }
-                            )
-
-                        sigmas: list[float] = []
-                        for elite in pool_elites:
-                            for metric in self.cfg.metrics.names:
-                                r = elite.ratings.get(metric)
-                                if r is None:
-                                    continue
-                                sigmas.append(float(r.sigma))
-                        if sigmas:
-                            extra["mean_sigma"] = float(np.mean(sigmas))
-
-                        self.store.record_stats(
-                            iteration=snapshot.iteration,
-                            best_score=snapshot.best_score,
-                            pool_size=snapshot.pool_size,
-                            extra=extra,
-                        )
-                        checkpoint_interval = getattr(
-                            self.cfg.run, "checkpoint_interval", 1
-                        )
-                        keep = checkpoint_interval > 0 and (
-                            snapshot.iteration % checkpoint_interval == 0
-                        )
-                        self.store.save_checkpoint(
-                            iteration=snapshot.iteration,
-                            pool=self.pool,
-                            anchor_manager=self.anchors,
-                            keep=keep,
-                        )
-                        self.store.record_event(
-                            "iteration",
-                            {
-                                "best_text_id": self.store.put_text(best.text),
-                                "best_score": snapshot.best_score,
-                                "pool_size": snapshot.pool_size,
-                            },
-                            iteration=snapshot.iteration,
-                        )
-                    except Exception:
-                        log_evo.exception("Failed to record iteration state.")
+                    self.store.set_iteration(iteration + 1)
+                await self.astep(
+                    iteration, prefetch=prefetch and iteration + 1 < end_iteration
+                )
+                self._end_iteration(iteration, on_iteration=on_iteration)
+        finally:
+            self._drop_prefetch()
+        return self._result()
+
+    async def _arun_pipelined(
+        self,
+        *,
+        start_iteration: int,
+        end_iteration: int,
+        depth: int,
+        on_iteration: Callable[[IterationSnapshot], None] | None,
+    ) -> None:
+        """Steady-state loop with up to `depth` iterations in flight.
 
+        Sections that touch shared state (RNG streams, pool, ratings, events)
+        are handed out by a sequencer in a fixed order, so the result does not
+        depend on which LLM call returns first.
+        """
+        turns = _StageSequencer(
+            _pipeline_schedule(start_iteration, end_iteration, depth)
+        )
+        in_flight: set[asyncio.Task[None]] = set()
+        try:
+            for iteration in range(start_iteration, end_iteration):
+                while len(in_flight) >= depth:
+                    done, in_flight = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        task.result()
+                in_flight.add(
+                    asyncio.create_task(
+                        self._apipelined_iteration(
+                            iteration, turns=turns, on_iteration=on_iteration
+                        )
+                    )
+                )
+            while in_flight:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    task.result()
         finally:
-            if mutation_executor is not None:
-                mutation_executor.shutdown(wait=True)
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _apipelined_iteration(
+        self,
+        iteration: int,
+        *,
+        turns: _StageSequencer,
+        on_iteration: Callable[[IterationSnapshot], None] | None,
+    ) -> None:
+        # Each iteration runs in its own task, so this only tags this task's
+        # LLM calls.
+        if self.store:
+            self.store.set_iteration(iteration + 1)
+
+        async with turns.turn("start", iteration):
+            parent = self._begin_step(iteration)
+
+        critique = None
+        if self.critic:
+            critique = await acall(self.critic, "acritique", "critique", parent=parent)
+
+        # Mutation planning consumes the mutator RNG before its first await, so
+        # the call is started right as the turn is handed on.
+        async with turns.turn("mutate", iteration):
+            self._record_critique(critique, iteration)
+        early = _EarlyEmbeddings()
+        raw = await self._amutate(parent, critique=critique, early=early)
+
+        async with turns.turn("judge", iteration):
+            candidates = self._filter_candidates(raw)
+            battle = self._prepare_battle(
+                parent, candidates, iteration, embeddings=early.vectors
+            )
+        ranking = None
+        if battle is not None:
+            ranking = await acall(
+                self.ranker,
+                "arank",
+                "rank",
+                metrics=self.cfg.metrics.names,
+                battle=battle,
+                metric_descriptions=self.cfg.metrics.descriptions,
+            )
 
+        async with turns.turn("finish", iteration):
+            if battle is not None:
+                self._finish_step(battle, ranking, iteration)
+            self._end_iteration(iteration, on_iteration=on_iteration)
+
+    def _result(self) -> EvolutionResult:
         best = self.best_elite()
         return EvolutionResult(
             best_elite=best, best_score=self.rating.score(best.ratings)
         )
 
+    def _end_iteration(
+        self,
+        iteration: int,
+        *,
+        on_iteration: Callable[[IterationSnapshot], None] | None,
+    ) -> None:
+        best = self.best_elite()
+        snapshot = IterationSnapshot(
+            iteration=iteration + 1,
+            best_score=self.rating.score(best.ratings),
+            pool_size=len(self.pool),
+            best_elite=best,
+        )
+        if on_iteration:
+            on_iteration(snapshot)
+
+        if self.anchors and self.anchors.maybe_add_ghost(best, iteration=iteration + 1):
+            log_evo.info("Added ghost anchor at iteration %d.", iteration + 1)
+
+        if self.store:
+            try:
+                pool_elites = list(self.pool.iter_elites())
+                extra: dict[str, Any] = {
+                    "best_text_id": self._text_id(best),
+                }
+                extra.update(self.pool.score_summary())
+
+                if len(pool_elites) >= 2:
+                    embeddings = np.stack([e.embedding for e in pool_elites])
+                    sims = embeddings @ embeddings.T
+                    np.fill_diagonal(sims, -np.inf)
+                    nn_sim = sims.max(axis=1)
+                    nn_dist = 1.0 - nn_sim
+                    extra.update(
+                        {
+                            "diversity_nn_mean": float(nn_dist.mean()),
+                            "diversity_nn_p10": float(np.percentile(nn_dist, 10)),
+                            "diversity_nn_p50": float(np.percentile(nn_dist, 50)),
+                        }
+                    )
+
+                _mu, sigma = self.pool.rating_matrix(self.cfg.metrics.names)
+                sigmas = sigma[~np.isnan(sigma)]
+                if sigmas.size:
+                    extra["mean_sigma"] = float(sigmas.mean())
+
+                cache_stats = getattr(self.critic, "cache_stats", None)
+                if callable(cache_stats):
+                    extra["critique_cache"] = cache_stats()
+                if self.embedding_stats is not None:
+                    extra["embedding_cache"] = dict(self.embedding_stats())
+
+                self.store.record_stats(
+                    iteration=snapshot.iteration,
+                    best_score=snapshot.best_score,
+                    pool_size=snapshot.pool_size,
+                    extra=extra,
+                )
+                checkpoint_interval = getattr(self.cfg.run, "checkpoint_interval", 1)
+                keep = checkpoint_interval > 0 and (
+                    snapshot.iteration % checkpoint_interval == 0
+                )
+                self.store.save_checkpoint(
+                    iteration=snapshot.iteration,
+                    pool=self.pool,
+                    anchor_manager=self.anchors,
+                    keep=keep,
+                    snapshot_interval=getattr(self.cfg.run, "snapshot_interval", 1),
+                    binary=getattr(self.cfg.run, "binary_checkpoints", False),
+                )
+                self.store.record_event(
+                    "iteration",
+                    {
+                        "best_text_id": self._text_id(best),
+                        "best_score": snapshot.best_score,
+                        "pool_size": snapshot.pool_size,
+                    },
+                    iteration=snapshot.iteration,
+                )
+            except Exception:
+                log_evo.exception("Failed to record iteration state.")
+
     def best_elite(self) -> Elite:
         return self.pool.best
 
     def _seed(self, seed_text: str) -> None:
         seed = Elite(
             text=seed_text,
-            embedding=self.embed(seed_text),
+            embedding=self._embed([seed_text])[0],
             ratings=self.rating.new_ratings(),
             age=0,
         )
@@ -247,7 +445,190 @@ class EvolutionEngine:
         iteration: int,
         *,
         mutation_executor: ThreadPoolExecutor | None = None,
+        prefetch_executor: ThreadPoolExecutor | None = None,
     ) -> None:
+        prefetched = self._take_prefetch(iteration)
+        if prefetched is not None:
+            parent = prefetched.parent
+            critique = prefetched.critique.result()
+            self._record_critique(critique, iteration)
+        else:
+            parent = self._begin_step(iteration)
+            critique = None
+            if self.critic:
+                critique = self.critic.critique(parent=parent)
+                self._record_critique(critique, iteration)
+
+        early = _EarlyEmbeddings()
+        candidates = self._propose_children(
+            parent,
+            critique=critique,
+            mutation_executor=mutation_executor,
+            early=early,
+        )
+        battle = self._prepare_battle(
+            parent, candidates, iteration, embeddings=early.vectors
+        )
+        if battle is None:
+            return
+
+        if prefetch_executor is not None and self.critic:
+            critic = self.critic
+            self._start_prefetch(
+                battle,
+                lambda next_parent: prefetch_executor.submit(
+                    critic.critique, parent=next_parent
+                ),
+            )
+        ranking = self.ranker.rank(
+            metrics=self.cfg.metrics.names,
+            battle=battle,
+            metric_descriptions=self.cfg.metrics.descriptions,
+        )
+        self._finish_step(battle, ranking, iteration)
+
+    async def astep(self, iteration: int, *, prefetch: bool = False) -> None:
+        """Async `step`; sync-only critic/mutator/ranker run in worker threads."""
+        prefetched = self._take_prefetch(iteration)
+        if prefetched is not None:
+            parent = prefetched.parent
+            critique = await prefetched.critique
+            self._record_critique(critique, iteration)
+        else:
+            parent = self._begin_step(iteration)
+            critique = None
+            if self.critic:
+                critique = await acall(
+                    self.critic, "acritique", "critique", parent=parent
+                )
+                self._record_critique(critique, iteration)
+
+        early = _EarlyEmbeddings()
+        candidates = await self._apropose_children(
+            parent, critique=critique, early=early
+        )
+        battle = self._prepare_battle(
+            parent, candidates, iteration, embeddings=early.vectors
+        )
+        if battle is None:
+            return
+
+        if prefetch and self.critic:
+            critic = self.critic
+            self._start_prefetch(
+                battle,
+                lambda next_parent: asyncio.create_task(
+                    acall(critic, "acritique", "critique", parent=next_parent)
+                ),
+            )
+        ranking = await acall(
+            self.ranker,
+            "arank",
+            "rank",
+            metrics=self.cfg.metrics.names,
+            battle=battle,
+            metric_descriptions=self.cfg.metrics.descriptions,
+        )
+        self._finish_step(battle, ranking, iteration)
+
+    def _prefetch_enabled(self) -> bool:
+        return bool(self.critic and getattr(self.cfg.critic, "prefetch", False))
+
+    def _start_prefetch(
+        self,
+        battle: Battle,
+        submit: Callable[
+            [Elite], Future[Critique | None] | asyncio.Task[Critique | None]
+        ],
+    ) -> None:
+        """Pick the next parent now and start critiquing it in the background.
+
+        The scalarizer weights drawn for the next parent are set aside so the
+        current battle's pruning still uses this iteration's weights. The
+        critique runs on a clone, so it never reads ratings while this
+        battle's update rewrites them.
+        """
+        current_weights = None
+        current_source = None
+        if self.scalarizer is not None:
+            current_weights = list(self.scalarizer.weights)
+            current_source = self.scalarizer.last_source
+
+        parent, scalarization, scalarization_source = self._select_parent()
+
+        weights = None
+        if self.scalarizer is not None:
+            weights = list(self.scalarizer.weights)
+            self.scalarizer.weights = current_weights
+            self.scalarizer.last_source = current_source
+
+        self._prefetched = _Prefetch(
+            parent=parent,
+            scalarization=scalarization,
+            scalarization_source=scalarization_source,
+            weights=weights,
+            critique=submit(parent.clone()),
+            in_battle=any(p.text == parent.text for p in battle.participants),
+        )
+
+    def _take_prefetch(self, iteration: int) -> _Prefetch | None:
+        """Return the prefetched parent if the last battle left it untouched."""
+        prefetched = self._prefetched
+        self._prefetched = None
+        if prefetched is None:
+            return None
+        reason = None
+        if not self.pool.contains_text(prefetched.parent.text):
+            reason = "pruned"
+        elif prefetched.in_battle:
+            # Critiqued with pre-battle ratings; a fresh pick keeps the
+            # prompt (and the response cache key) independent of timing.
+            reason = "judged"
+        if reason is not None:
+            log_evo.debug("Prefetched parent was %s; discarding its critique.", reason)
+            prefetched.critique.cancel()
+            if self.store:
+                try:
+                    self.store.record_event(
+                        "prefetch_discarded",
+                        {
+                            "parent_text_id": self._text_id(prefetched.parent),
+                            "reason": reason,
+                        },
+                        iteration=iteration + 1,
+                    )
+                except Exception:
+                    log_evo.exception("Failed to record prefetch_discarded.")
+            return None
+
+        if self.scalarizer is not None and prefetched.weights is not None:
+            self.scalarizer.weights = prefetched.weights
+            self.scalarizer.last_source = prefetched.scalarization_source or ""
+        self._record_step_start(
+            prefetched.parent,
+            iteration,
+            scalarization=prefetched.scalarization,
+            scalarization_source=prefetched.scalarization_source,
+            prefetched=True,
+        )
+        return prefetched
+
+    def _drop_prefetch(self) -> None:
+        if self._prefetched is not None:
+            self._prefetched.critique.cancel()
+            self._prefetched = None
+
+    def _begin_step(self, iteration: int) -> Elite:
+        parent, scalarization, scalarization_source = self._select_parent()
+        self._record_step_start(
+            parent,
+            iteration,
+            scalarization=scalarization,
+            scalarization_source=scalarization_source,
+        )
+        return parent
+
+    def _select_parent(self) -> tuple[Elite, dict[str, float] | None, str | None]:
         scalarization: dict[str, float] | None = None
         scalarization_source: str | None = None
         if self.scalarizer is not None:
@@ -256,7 +637,18 @@ class EvolutionEngine:
 
         parent = self.selector(self.pool)
         self.rating.ensure_ratings(parent)
+        self.pool.invalidate_scores([parent])
+        return parent, scalarization, scalarization_source
 
+    def _record_step_start(
+        self,
+        parent: Elite,
+        iteration: int,
+        *,
+        scalarization: dict[str, float] | None,
+        scalarization_source: str | None,
+        prefetched: bool = False,
+    ) -> None:
         if self.store:
             try:
                 parent_metrics = {
@@ -270,45 +662,56 @@ class EvolutionEngine:
                 self.store.record_event(
                     "step_start",
                     {
-                        "parent_text_id": self.store.put_text(parent.text),
+                        "parent_text_id": self._text_id(parent),
                         "pool_size": len(self.pool),
                         "scalarization": scalarization,
                         "scalarization_source": scalarization_source,
                         "parent_age": int(parent.age),
                         "parent_score": float(self.rating.score(parent.ratings)),
                         "parent_ratings": parent_metrics,
+                        "prefetched": prefetched,
                     },
                     iteration=iteration + 1,
                 )
             except Exception:
                 log_evo.exception("Failed to record step_start.")
 
-        critique = None
-        if self.critic:
-            critique = self.critic.critique(parent=parent)
-            if critique and self.store:
-                try:
-                    self.store.record_event(
-                        "critique",
-                        {
-                            "summary": critique.summary,
-                            "preserve": list(critique.preserve),
-                            "issues": list(critique.issues),
-                            "routes": list(critique.routes),
-                            "constraints": list(critique.constraints),
-                        },
-                        iteration=iteration + 1,
-                    )
-                except Exception:
-                    log_evo.exception("Failed to record critique.")
+    def _text_id(self, item: Elite | Anchor) -> str:
+        # Stores that can remember the id on the elite/anchor hash it once.
+        text_id_of = getattr(self.store, "text_id_of", None)
+        if text_id_of is not None:
+            return text_id_of(item)
+        return self.store.put_text(item.text)
 
-        candidates = self._propose_children(
-            parent,
-            critique=critique,
-            mutation_executor=mutation_executor,
-        )
-        if not candidates:
+    def _record_critique(self, critique: Critique | None, iteration: int) -> None:
+        if not critique or not self.store:
             return
+        try:
+            self.store.record_event(
+                "critique",
+                {
+                    "summary": critique.summary,
+                    "preserve": list(critique.preserve),
+                    "issues": list(critique.issues),
+                    "routes": list(critique.routes),
+                    "constraints": list(critique.constraints),
+                },
+                iteration=iteration + 1,
+            )
+        except Exception:
+            log_evo.exception("Failed to record critique.")
+
+    def _prepare_battle(
+        self,
+        parent: Elite,
+        candidates: Sequence[MutationCandidate],
+        iteration: int,
+        *,
+        embeddings: Mapping[str, np.ndarray] | None = None,
+    ) -> Battle | None:
+        """Record candidates, build children, and assemble the battle to judge."""
+        if not candidates:
+            return None
 
         if self.store:
             try:
@@ -333,13 +736,15 @@ class EvolutionEngine:
             except Exception:
                 log_evo.exception("Failed to record candidates.")
 
-        children = self._make_children(parent, candidates, age=iteration)
+        children = self._make_children(
+            parent, candidates, age=iteration, embeddings=embeddings
+        )
         if not children:
-            return
+            return None
 
         if self.store:
             try:
-                parent_text_id = self.store.put_text(parent.text)
+                parent_text_id = self._text_id(parent)
                 operator_roles = {
                     op.name: op.role
                     for op in getattr(self.cfg.mutation, "operators", [])
@@ -347,7 +752,7 @@ class EvolutionEngine:
                 }
                 edges = []
                 for cand, child in zip(candidates, children):
-                    child_text_id = self.store.put_text(child.text)
+                    child_text_id = self._text_id(child)
                     partner_text_ids = [
                         self.store.put_text(t) for t in cand.partner_texts
                     ]
@@ -387,7 +792,7 @@ class EvolutionEngine:
             opponent=opponent,
         )
         if battle.size < 2:
-            return
+            return None
 
         if self.store:
             try:
@@ -410,7 +815,7 @@ class EvolutionEngine:
                         {
                             "idx": idx,
                             "role": role,
-                            "text_id": self.store.put_text(p.text),
+                            "text_id": self._text_id(p),
                             "frozen": idx in battle.frozen_indices,
                             "is_anchor": id(p) in anchor_set,
                         }
@@ -422,12 +827,12 @@ class EvolutionEngine:
                 )
             except Exception:
                 log_evo.exception("Failed to record battle.")
+        return battle
 
-        ranking = self.ranker.rank(
-            metrics=self.cfg.metrics.names,
-            battle=battle,
-            metric_descriptions=self.cfg.metrics.descriptions,
-        )
+    def _finish_step(
+        self, battle: Battle, ranking: BattleRanking | None, iteration: int
+    ) -> None:
+        """Apply a ranking to ratings and absorb the judged children."""
         if ranking is None:
             raise RuntimeError(
                 f"Ranker returned no ranking at iteration {iteration + 1}."
@@ -468,6 +873,7 @@ class EvolutionEngine:
             ranking,
             frozen_indices=set(battle.frozen_indices),
         )
+        self.pool.invalidate_scores(battle.participants)
 
         if self.store and ratings_before is not None:
             try:
@@ -484,7 +890,7 @@ class EvolutionEngine:
                     participants.append(
                         {
                             "idx": idx,
-                            "text_id": self.store.put_text(player.text),
+                            "text_id": self._text_id(player),
                             "frozen": idx in battle.frozen_indices,
                             "before": ratings_before[idx],
                             "after": after,
@@ -534,18 +940,104 @@ class EvolutionEngine:
         *,
         critique: Critique | None,
         mutation_executor: ThreadPoolExecutor | None,
+        early: _EarlyEmbeddings | None = None,
     ) -> list[MutationCandidate]:
+        kwargs: dict[str, Any] = {}
+        if early is not None and accepts_kwarg(self.mutator.propose, "on_candidates"):
+
+            def on_candidates(batch: Sequence[MutationCandidate]) -> None:
+                # Runs between job completions, so it overlaps the LLM calls
+                # still in flight on the executor.
+                texts = self._claim_unembedded(early, batch)
+                if texts:
+                    self._embed_early(early, texts)
+
+            kwargs["on_candidates"] = on_candidates
         try:
             raw = self.mutator.propose(
                 parent=parent,
                 critique=critique,
                 max_candidates=self.cfg.mutation.max_children,
                 mutation_executor=mutation_executor,
+                **kwargs,
             )
         except Exception:
             log_evo.exception("Mutation step failed; skipping iteration.")
             raw = []
+        return self._filter_candidates(raw)
+
+    async def _apropose_children(
+        self,
+        parent: Elite,
+        *,
+        critique: Critique | None,
+        early: _EarlyEmbeddings | None = None,
+    ) -> list[MutationCandidate]:
+        return self._filter_candidates(
+            await self._amutate(parent, critique=critique, early=early)
+        )
+
+    async def _amutate(
+        self,
+        parent: Elite,
+        *,
+        critique: Critique | None,
+        early: _EarlyEmbeddings | None = None,
+    ) -> Sequence[MutationCandidate]:
+        kwargs: dict[str, Any] = {}
+        pending: list[asyncio.Task[None]] = []
+        method = getattr(self.mutator, "apropose", None)
+        if (
+            early is not None
+            and inspect.iscoroutinefunction(method)
+            and accepts_kwarg(method, "on_candidates")
+        ):
+
+            async def embed_batch(texts: list[str]) -> None:
+                await asyncio.to_thread(self._embed_early, early, texts)
 
+            def on_candidates(batch: Sequence[MutationCandidate]) -> None:
+                texts = self._claim_unembedded(early, batch)
+                if texts:
+                    pending.append(asyncio.create_task(embed_batch(texts)))
+
+            kwargs["on_candidates"] = on_candidates
+        try:
+            return await acall(
+                self.mutator,
+                "apropose",
+                "propose",
+                parent=parent,
+                critique=critique,
+                max_candidates=self.cfg.mutation.max_children,
+                **kwargs,
+            )
+        except Exception:
+            log_evo.exception("Mutation step failed; skipping iteration.")
+            return []
+        finally:
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _claim_unembedded(
+        self, early: _EarlyEmbeddings, batch: Sequence[MutationCandidate]
+    ) -> list[str]:
+        return early.claim(c.text for c in batch if not self.pool.contains_text(c.text))
+
+    def _embed(self, texts: Sequence[str]) -> np.ndarray:
+        with self._embed_lock:
+            return self.embed_many(texts)
+
+    def _embed_early(self, early: _EarlyEmbeddings, texts: list[str]) -> None:
+        try:
+            early.vectors.update(zip(texts, self._embed(texts)))
+        except Exception:
+            # _make_children embeds whatever is missing and surfaces errors.
+            log_evo.exception("Early child embedding failed; retrying later.")
+
+    def _filter_candidates(
+        self, raw: Sequence[MutationCandidate]
+    ) -> list[MutationCandidate]:
         seen: set[str] = set()
         unique: list[MutationCandidate] = []
         for cand in raw:
@@ -564,13 +1056,20 @@ class EvolutionEngine:
         candidates: Sequence[MutationCandidate],
         *,
         age: int,
+        embeddings: Mapping[str, np.ndarray] | None = None,
     ) -> list[Elite]:
+        vectors = dict(embeddings or {})
+        missing = list(
+            dict.fromkeys(c.text for c in candidates if c.text not in vectors)
+        )
+        if missing:
+            vectors.update(zip(missing, self._embed(missing)))
         children: list[Elite] = []
         for cand in candidates:
             text = cand.text
             child = Elite(
                 text=text,
-                embedding=self.embed(text),
+                embedding=vectors[text],
                 ratings=self.rating.init_child_ratings(
                     parent, uncertainty_scale=cand.uncertainty_scale
                 ),
@@ -626,6 +1125,64 @@ class EvolutionEngine:
         raise ValueError(f"Unknown opponent kind '{opponent_cfg.kind}'.")
 
 
+def _pipeline_schedule(
+    start_iteration: int, end_iteration: int, depth: int
+) -> Iterator[tuple[str, int]]:
+    """Global order of shared-state sections for a pipelined run.
+
+    Iteration i starts at slot i, plans mutations at slot i + p, builds its
+    battle at slot i + d and finishes at slot i + depth, so roughly a third of
+    the in-flight iterations sit in each LLM phase (critique, mutate, judge).
+    Within a slot the finishing iteration goes first to free its place.
+    """
+    depth = max(1, int(depth))
+    mutate_offset = depth // 3
+    judge_offset = mutate_offset + (depth - mutate_offset) // 2
+    offsets = (
+        ("finish", depth),
+        ("start", 0),
+        ("mutate", mutate_offset),
+        ("judge", judge_offset),
+    )
+    for slot in range(start_iteration, end_iteration + depth):
+        for stage, offset in offsets:
+            iteration = slot - offset
+            if start_iteration <= iteration < end_iteration:
+                yield stage, iteration
+
+
+class _StageSequencer:
+    """Grants `(stage, iteration)` turns strictly in schedule order."""
+
+    def __init__(self, schedule: Iterable[tuple[str, int]]) -> None:
+        self._schedule = iter(schedule)
+        self._current = next(self._schedule, None)
+        self._waiters: dict[tuple[str, int], asyncio.Future[None]] = {}
+
+    @asynccontextmanager
+    async def turn(self, stage: str, iteration: int) -> AsyncIterator[None]:
+        key = (stage, iteration)
+        if self._current != key:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters[key] = waiter
+            try:
+                await waiter
+            finally:
+                self._waiters.pop(key, None)
+        try:
+            yield
+        finally:
+            self._advance()
+
+    def _advance(self) -> None:
+        self._current = next(self._schedule, None)
+        if self._current is None:
+            return
+        waiter = self._waiters.get(self._current)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+
 def build_anchor_manager(
     *,
     cfg: Config,
@@ -0,0 +1,199 @@
+"""Background writer for append-only JSONL logs (events, stats, LLM index).
+
+`write` only enqueues a record; one daemon thread drains the queue, groups
+what it collected by file and appends each group with a single write on a
+handle it keeps open. `write_file` queues a whole small file (an LLM prompt
+or output) the same way; files in a batch are written before its lines, so
+a record never points at a file that is not there yet. Records reach the
+disk at most `flush_interval_s` after they were queued. `flush()` waits for everything queued so far, and
+`close()` (also registered to run at interpreter exit) drains the queue
+before returning.
+
+The queue is bounded: if the disk falls `max_queue` records behind, `write`
+blocks until there is room instead of dropping records.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TextIO
+
+FSYNC_POLICIES = ("never", "batch")
+
+log_store = logging.getLogger("run_store")
+
+
+@dataclass(frozen=True, slots=True)
+class _File:
+    path: Path
+    text: str
+
+
+_Item = tuple[Path, Any] | _File | threading.Event | None
+
+
+class JsonlWriter:
+    def __init__(
+        self,
+        *,
+        max_queue: int = 10_000,
+        flush_interval_s: float = 0.5,
+        fsync: str = "never",
+    ) -> None:
+        if max_queue < 1:
+            raise ValueError("max_queue must be >= 1.")
+        if flush_interval_s < 0:
+            raise ValueError("flush_interval_s must be >= 0.")
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(
+                f"Unknown fsync policy {fsync!r}; "
+                f"expected one of {', '.join(FSYNC_POLICIES)}."
+            )
+        self.max_queue = int(max_queue)
+        self.flush_interval_s = float(flush_interval_s)
+        self.fsync = fsync
+        self.records = 0
+        self.batches = 0
+        self.errors = 0
+        self._queue: queue.Queue[_Item] = queue.Queue(maxsize=self.max_queue)
+        self._handles: dict[Path, TextIO] = {}
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._loop, name="jsonl-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, path: Path, obj: Any) -> None:
+        """Queue `obj` (already JSON-safe) as one line of `path`."""
+        if self._closed:
+            raise RuntimeError("JsonlWriter is closed.")
+        self._queue.put((path, obj))
+
+    def write_file(self, path: Path, text: str) -> None:
+        """Queue `text` to be written as the whole of `path`."""
+        if self._closed:
+            raise RuntimeError("JsonlWriter is closed.")
+        self._queue.put(_File(path, text))
+
+    def flush(self) -> None:
+        """Block until every record queued before this call is written."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "records": self.records,
+            "batches": self.batches,
+            "errors": self.errors,
+            "queued": self._queue.qsize(),
+        }
+
+    def _loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: list[tuple[Path, Any] | _File] = []
+            done: threading.Event | None = None
+            stop = False
+            deadline = time.monotonic() + self.flush_interval_s
+            while True:
+                if item is None:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    done = item
+                    break
+                batch.append(item)
+                if len(batch) >= self.max_queue:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        item = self._queue.get(timeout=remaining)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._write_batch(batch)
+            if done is not None:
+                done.set()
+            if stop:
+                for handle in self._handles.values():
+                    handle.close()
+                self._handles.clear()
+                return
+
+    def _write_batch(self, batch: list[tuple[Path, Any] | _File]) -> None:
+        lines: dict[Path, list[str]] = {}
+        for item in batch:
+            if isinstance(item, _File):
+                self._write_file(item)
+                continue
+            path, obj = item
+            try:
+                line = json.dumps(obj, ensure_ascii=False)
+            except (TypeError, ValueError):
+                self.errors += 1
+                log_store.exception("Dropping unserializable record for %s", path)
+                continue
+            lines.setdefault(path, []).append(line)
+        for path, group in lines.items():
+            try:
+                handle = self._handles.get(path)
+                if handle is None:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    handle = self._handles[path] = path.open("a", encoding="utf-8")
+                handle.write("\n".join(group) + "\n")
+                handle.flush()
+                if self.fsync == "batch":
+                    os.fsync(handle.fileno())
+            except Exception:
+                self.errors += 1
+                log_store.exception(
+                    "Failed to append %d records to %s", len(group), path
+                )
+                stale = self._handles.pop(path, None)
+                if stale is not None:
+                    try:
+                        stale.close()
+                    except OSError:
+                        pass
+                continue
+            self.records += len(group)
+        self.batches += 1
+
+    def _write_file(self, item: _File) -> None:
+        try:
+            item.path.parent.mkdir(parents=True, exist_ok=True)
+            with item.path.open("w", encoding="utf-8") as f:
+                f.write(item.text)
+                if self.fsync == "batch":
+                    f.flush()
+                    os.fsync(f.fileno())
+        except Exception:
+            self.errors += 1
+            log_store.exception("Failed to write %s", item.path)
+            return
+        self.records += 1
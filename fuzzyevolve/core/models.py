@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Protocol
 
 import numpy as np
@@ -21,6 +21,8 @@ class Elite:
     embedding: np.ndarray
     ratings: Ratings
     age: int
+    # Content hash once a run store has persisted `text` (see RunStore.text_id_of).
+    text_id: str | None = field(default=None, compare=False)
 
     def clone(self) -> "Elite":
         ratings = {
@@ -32,6 +34,7 @@ class Elite:
             embedding=self.embedding.copy(),
             ratings=ratings,
             age=self.age,
+            text_id=self.text_id,
         )
 
 
@@ -41,6 +44,7 @@ class Anchor:
     ratings: Ratings
     age: int
     label: str = ""
+    text_id: str | None = field(default=None, compare=False)
 
 
 @dataclass(frozen=True, slots=True)
@@ -3,6 +3,8 @@ from __future__ import annotations
 import random
 from collections.abc import Mapping, Sequence
 
+import numpy as np
+
 
 def dominates(a: Sequence[float], b: Sequence[float], *, eps: float = 1e-12) -> bool:
     """Return True if vector `a` Pareto-dominates `b` (with tolerance)."""
@@ -19,25 +21,122 @@ def dominates(a: Sequence[float], b: Sequence[float], *, eps: float = 1e-12) ->
     return ge_all and gt_any
 
 
+# Bound on the (rows, n) comparison masks built per block.
+_DOMINANCE_BLOCK_CELLS = 1 << 22
+
+
+def _as_matrix(vectors: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+    values = np.asarray(vectors, dtype=float)
+    if values.ndim != 2:
+        values = values.reshape(len(values), 1 if values.size else 0)
+    return values
+
+
+def _block_rows(values: np.ndarray) -> int:
+    return max(1, _DOMINANCE_BLOCK_CELLS // max(1, values.shape[0]))
+
+
+def _dominance_rows(
+    values: np.ndarray, rows: np.ndarray | slice, *, eps: float
+) -> np.ndarray:
+    """(len(rows), n) mask: entry [r, j] is True if values[rows][r] dominates j."""
+    block = values[rows]
+    ge_all = np.ones((block.shape[0], values.shape[0]), dtype=bool)
+    gt_any = np.zeros_like(ge_all)
+    # One 2-D comparison per metric keeps temporaries at (rows, n).
+    for col in range(values.shape[1]):
+        a = block[:, col, None]
+        b = values[None, :, col]
+        ge_all &= a >= b - eps
+        gt_any |= a > b + eps
+    return ge_all & gt_any
+
+
+def dominance_matrix(
+    vectors: Sequence[Sequence[float]] | np.ndarray, *, eps: float = 1e-12
+) -> np.ndarray:
+    """(n, n) mask where [i, j] is True if vector i dominates vector j."""
+    values = _as_matrix(vectors)
+    n = values.shape[0]
+    out = np.zeros((n, n), dtype=bool)
+    step = _block_rows(values)
+    for start in range(0, n, step):
+        out[start : start + step] = _dominance_rows(
+            values, slice(start, start + step), eps=eps
+        )
+    return out
+
+
 def nondominated_indices(
-    vectors: Sequence[Sequence[float]], *, eps: float = 1e-12
+    vectors: Sequence[Sequence[float]] | np.ndarray, *, eps: float = 1e-12
 ) -> list[int]:
     """Indices of vectors that are not dominated by any other vector."""
-    n = len(vectors)
+    values = _as_matrix(vectors)
+    n = values.shape[0]
     if n <= 1:
         return list(range(n))
-    out: list[int] = []
-    for i in range(n):
-        dominated = False
-        for j in range(n):
-            if i == j:
-                continue
-            if dominates(vectors[j], vectors[i], eps=eps):
-                dominated = True
-                break
-        if not dominated:
-            out.append(i)
-    return out
+    dominated = np.zeros(n, dtype=bool)
+    step = _block_rows(values)
+    for start in range(0, n, step):
+        dominated |= _dominance_rows(values, slice(start, start + step), eps=eps).any(
+            axis=0
+        )
+    return np.flatnonzero(~dominated).tolist()
+
+
+def nondominated_fronts(
+    vectors: Sequence[Sequence[float]] | np.ndarray, *, eps: float = 1e-12
+) -> list[list[int]]:
+    """Non-dominated sorting: fronts of indices, best (rank 0) first.
+
+    Each front holds the vectors dominated only by members of earlier fronts;
+    indices within a front are ascending.
+    """
+    values = _as_matrix(vectors)
+    n = values.shape[0]
+    if n == 0:
+        return []
+    counts = np.zeros(n, dtype=np.int64)
+    step = _block_rows(values)
+    for start in range(0, n, step):
+        counts += _dominance_rows(values, slice(start, start + step), eps=eps).sum(
+            axis=0
+        )
+    fronts: list[list[int]] = []
+    current = np.flatnonzero(counts == 0)
+    while current.size:
+        fronts.append(current.tolist())
+        counts[current] = -1
+        for start in range(0, current.size, step):
+            rows = current[start : start + step]
+            counts -= _dominance_rows(values, rows, eps=eps).sum(axis=0)
+        current = np.flatnonzero(counts == 0)
+    return fronts
+
+
+def crowding_distance(vectors: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+    """NSGA-II crowding distance of each vector within its set (higher = sparser).
+
+    Boundary vectors on any objective get +inf. Objectives with no finite
+    spread contribute nothing.
+    """
+    values = _as_matrix(vectors)
+    n, m = values.shape
+    distance = np.zeros(n)
+    if n <= 2:
+        distance[:] = np.inf
+        return distance
+    for col in range(m):
+        column = values[:, col]
+        order = np.argsort(column, kind="stable")
+        ordered = column[order]
+        span = ordered[-1] - ordered[0]
+        distance[order[0]] = np.inf
+        distance[order[-1]] = np.inf
+        if not np.isfinite(span) or span <= 0:
+            continue
+        distance[order[1:-1]] += (ordered[2:] - ordered[:-2]) / span
+    return distance
 
 
 class Scalarizer:
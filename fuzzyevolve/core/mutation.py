@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import random
 from dataclasses import dataclass
-from typing import Iterable
-from collections.abc import Sequence
+from typing import Any, Iterable
+from collections.abc import Callable, Sequence
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from fuzzyevolve.core.critique import Critique
 from fuzzyevolve.core.models import Elite, MutationCandidate
-from fuzzyevolve.core.ports import MutationOperator
+from fuzzyevolve.core.ports import MutationOperator, acall
 from fuzzyevolve.core.pool import CrowdedPool, cosine_distance
 
 log_mutation = logging.getLogger("mutation")
@@ -154,60 +155,135 @@ class OperatorMutator:
         critique: Critique | None,
         max_candidates: int,
         mutation_executor: ThreadPoolExecutor | None = None,
+        on_candidates: Callable[[Sequence[MutationCandidate]], None] | None = None,
     ) -> list[MutationCandidate]:
+        """Run the planned jobs; `on_candidates` sees each job's output as it lands.
+
+        The callback runs on the calling thread while later jobs are still in
+        flight (e.g. to embed children early). Its exceptions propagate.
+        """
         if max_candidates <= 0:
             return []
 
-        jobs = self.planner.plan(critique)
+        jobs = self._plan_jobs(parent, critique)
         if not jobs:
             return []
 
-        jobs = self._attach_partners(jobs, parent)
-
         def run_job(job: MutationJob) -> list[MutationCandidate]:
-            spec = self.specs.get(job.operator)
-            job_critique = None if (spec and spec.role == "crossover") else critique
-            job_focus = None if (spec and spec.role == "crossover") else job.focus
-            operator = self.operators[job.operator]
-            partner_texts = tuple(p.text for p in job.partners)
-            texts = operator.propose(
-                parent=parent,
-                partners=(job.partners or None),
-                critique=job_critique,
-                focus=job_focus,
-            )
-            candidates: list[MutationCandidate] = []
-            spec = self.specs[job.operator]
-            for text in texts:
-                cleaned = text.strip()
-                if not cleaned or cleaned == parent.text:
-                    continue
-                candidates.append(
-                    MutationCandidate(
-                        text=cleaned,
-                        operator=spec.name,
-                        uncertainty_scale=spec.uncertainty_scale,
-                        focus=job_focus,
-                        partner_texts=partner_texts,
-                    )
-                )
-            return candidates
+            operator, kwargs = self._job_call(job, parent, critique)
+            texts = operator.propose(**kwargs)
+            return self._to_candidates(job, parent, texts)
 
         results: list[MutationCandidate] = []
         if mutation_executor is None or len(jobs) <= 1:
             for job in jobs:
                 try:
-                    results.extend(run_job(job))
+                    produced = run_job(job)
                 except Exception:
                     log_mutation.exception("Operator '%s' failed.", job.operator)
+                    continue
+                results.extend(produced)
+                if on_candidates is not None and produced:
+                    on_candidates(produced)
         else:
             futures = [mutation_executor.submit(run_job, job) for job in jobs]
             for fut in as_completed(futures):
                 try:
-                    results.extend(fut.result())
+                    produced = fut.result()
                 except Exception:
                     log_mutation.exception("Mutation job failed; skipping.")
+                    continue
+                results.extend(produced)
+                if on_candidates is not None and produced:
+                    on_candidates(produced)
+
+        return self._finalize(results, max_candidates)
+
+    async def apropose(
+        self,
+        *,
+        parent: Elite,
+        critique: Critique | None,
+        max_candidates: int,
+        on_candidates: Callable[[Sequence[MutationCandidate]], None] | None = None,
+    ) -> list[MutationCandidate]:
+        """Async variant of `propose`: all jobs share the running event loop.
+
+        `on_candidates` is called on the loop as each job finishes.
+        """
+        if max_candidates <= 0:
+            return []
 
+        jobs = self._plan_jobs(parent, critique)
+        if not jobs:
+            return []
+
+        async def run_job(job: MutationJob) -> list[MutationCandidate]:
+            operator, kwargs = self._job_call(job, parent, critique)
+            texts = await acall(operator, "apropose", "propose", **kwargs)
+            produced = self._to_candidates(job, parent, texts)
+            if on_candidates is not None and produced:
+                on_candidates(produced)
+            return produced
+
+        outcomes = await asyncio.gather(
+            *(run_job(job) for job in jobs), return_exceptions=True
+        )
+        results: list[MutationCandidate] = []
+        for job, outcome in zip(jobs, outcomes):
+            if isinstance(outcome, BaseException):
+                log_mutation.error(
+                    "Operator '%s' failed.", job.operator, exc_info=outcome
+                )
+                continue
+            results.extend(outcome)
+
+        return self._finalize(results, max_candidates)
+
+    def _plan_jobs(self, parent: Elite, critique: Critique | None) -> list[MutationJob]:
+        jobs = self.planner.plan(critique)
+        if not jobs:
+            return []
+        return self._attach_partners(jobs, parent)
+
+    def _job_call(
+        self, job: MutationJob, parent: Elite, critique: Critique | None
+    ) -> tuple[MutationOperator, dict[str, Any]]:
+        spec = self.specs.get(job.operator)
+        is_crossover = spec is not None and spec.role == "crossover"
+        kwargs: dict[str, Any] = {
+            "parent": parent,
+            "partners": (job.partners or None),
+            "critique": None if is_crossover else critique,
+            "focus": None if is_crossover else job.focus,
+        }
+        return self.operators[job.operator], kwargs
+
+    def _to_candidates(
+        self, job: MutationJob, parent: Elite, texts: Sequence[str]
+    ) -> list[MutationCandidate]:
+        spec = self.specs[job.operator]
+        job_focus = None if spec.role == "crossover" else job.focus
+        partner_texts = tuple(p.text for p in job.partners)
+        candidates: list[MutationCandidate] = []
+        for text in texts:
+            cleaned = text.strip()
+            if not cleaned or cleaned == parent.text:
+                continue
+            candidates.append(
+                MutationCandidate(
+                    text=cleaned,
+                    operator=spec.name,
+                    uncertainty_scale=spec.uncertainty_scale,
+                    focus=job_focus,
+                    partner_texts=partner_texts,
+                )
+            )
+        return candidates
+
+    def _finalize(
+        self, results: Sequence[MutationCandidate], max_candidates: int
+    ) -> list[MutationCandidate]:
         # Dedupe preserving order.
         seen: set[str] = set()
         unique: list[MutationCandidate] = []
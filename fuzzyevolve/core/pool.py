@@ -7,8 +7,20 @@ from typing import Callable
 import numpy as np
 import trueskill as ts
 
-from fuzzyevolve.core.multiobjective import Scalarizer, dominates
+from fuzzyevolve.core.multiobjective import (
+    Scalarizer,
+    crowding_distance,
+    dominates,
+    nondominated_fronts,
+)
 from fuzzyevolve.core.models import Elite
+from fuzzyevolve.core.rating_store import RatingStore
+
+
+# Rows of the similarity matrix computed per BLAS call when (re)building the
+# nearest-neighbour cache; bounds scratch memory to _PAIR_BLOCK_ROWS * pool size
+# floats.
+_PAIR_BLOCK_ROWS = 1024
 
 
 def cosine_distance(a: np.ndarray, b: np.ndarray) -> float:
@@ -16,12 +28,124 @@ def cosine_distance(a: np.ndarray, b: np.ndarray) -> float:
     return 1.0 - float(np.dot(a, b))
 
 
+def _top_k(dists: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k smallest distances, ordered by (distance, position)."""
+    if k >= dists.shape[0]:
+        return np.argsort(dists, kind="stable")
+    part = np.argpartition(dists, k - 1)[:k]
+    return part[np.lexsort((part, dists[part]))]
+
+
+class ExactKnnIndex:
+    """Brute-force top-k: one matrix-vector product plus `argpartition`."""
+
+    def add(self, slot: int, row: np.ndarray) -> None:
+        pass
+
+    def remove(self, slot: int, last: int) -> None:
+        pass
+
+    def query(self, vectors: np.ndarray, row: np.ndarray, *, k: int) -> list[int]:
+        return _top_k(1.0 - vectors @ row, k).tolist()
+
+
+class LshKnnIndex:
+    """Approximate top-k via random-hyperplane LSH (cosine).
+
+    Each of `tables` hash tables buckets rows by the signs of `bits` random
+    projections. A query ranks the exact distances of the members sharing a
+    bucket with it in any table, falling back to a full scan when fewer than
+    k candidates turn up.
+    """
+
+    def __init__(self, *, tables: int, bits: int, seed: int) -> None:
+        if tables <= 0 or bits <= 0:
+            raise ValueError("LSH tables and bits must be positive integers.")
+        if bits > 62:
+            raise ValueError("LSH bits must be <= 62.")
+        self.tables = int(tables)
+        self.bits = int(bits)
+        self._rng = np.random.default_rng(seed)
+        self._planes: np.ndarray | None = None
+        self._weights = np.int64(1) << np.arange(self.bits, dtype=np.int64)
+        self._buckets: list[dict[int, set[int]]] = [{} for _ in range(self.tables)]
+        self._keys: dict[int, np.ndarray] = {}
+
+    def add(self, slot: int, row: np.ndarray) -> None:
+        keys = self._hash(row)
+        self._keys[slot] = keys
+        for table, key in zip(self._buckets, keys.tolist()):
+            table.setdefault(key, set()).add(slot)
+
+    def remove(self, slot: int, last: int) -> None:
+        self._discard(slot)
+        if slot == last:
+            return
+        keys = self._discard(last)
+        self._keys[slot] = keys
+        for table, key in zip(self._buckets, keys.tolist()):
+            table.setdefault(key, set()).add(slot)
+
+    def query(self, vectors: np.ndarray, row: np.ndarray, *, k: int) -> list[int]:
+        candidates: set[int] = set()
+        for table, key in zip(self._buckets, self._hash(row).tolist()):
+            candidates.update(table.get(key, ()))
+        if len(candidates) < k:
+            return _top_k(1.0 - vectors @ row, k).tolist()
+        idx = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        idx.sort()
+        dists = 1.0 - vectors[idx] @ row
+        return idx[_top_k(dists, k)].tolist()
+
+    def _hash(self, row: np.ndarray) -> np.ndarray:
+        if self._planes is None:
+            self._planes = self._rng.standard_normal(
+                (self.tables * self.bits, row.shape[0])
+            ).astype(np.float32)
+        signs = (self._planes @ row > 0).reshape(self.tables, self.bits)
+        return signs.astype(np.int64) @ self._weights
+
+    def _discard(self, slot: int) -> np.ndarray:
+        keys = self._keys.pop(slot)
+        for table, key in zip(self._buckets, keys.tolist()):
+            bucket = table[key]
+            bucket.discard(slot)
+            if not bucket:
+                del table[key]
+        return keys
+
+
+KnnIndex = ExactKnnIndex | LshKnnIndex
+
+
 class CrowdedPool:
     """Fixed-size population with crowding via closest-pair elimination.
 
     Invariant: after insertion, the pool size is <= max_size. If size exceeds
     max_size, repeatedly find the closest pair in embedding space and remove the
     weaker individual by score (with deterministic tie-breaks).
+
+    Embeddings are mirrored into a contiguous float32 matrix whose row i is
+    `_members[i]`; removal swaps the last member into the freed row, so every
+    distance query is a single matrix product over `_matrix[:len(self)]`.
+
+    For closest-pair crowding each row also caches its nearest neighbour
+    (`_nn_index`/`_nn_sim`), updated incrementally on insert and remove, so
+    finding the closest pair is an O(n) argmax rather than an O(n²) scan.
+
+    With `pruning_strategy="pareto_front"` the pool ignores embeddings when
+    pruning and truncates by non-dominated fronts of per-metric LCB vectors,
+    breaking ties in the last front by objective-space crowding distance.
+
+    Scores are cached per row as well. Ratings are mutated in place by
+    `RatingSystem`, so whoever changes a member's ratings must call
+    `invalidate_scores` for it; only those rows are rescored on the next
+    `best` / `ranked` / `score_summary` query.
+
+    Ratings live in a `RatingStore` (μ/σ matrices, one row per member); each
+    member's `ratings` becomes a view onto its row while it is in the pool.
+    `score_rows`, when given, scores many stale rows in one array expression.
+    An elite belongs to at most one pool at a time.
     """
 
     def __init__(
@@ -32,10 +156,14 @@ class CrowdedPool:
         score_fn: Callable[[dict[str, ts.Rating]], float] | None = None,
         pruning_strategy: str = "closest_pair",
         knn_k: int = 8,
+        knn_index: str = "exact",
+        lsh_tables: int = 8,
+        lsh_bits: int = 12,
         metrics: Sequence[str] | None = None,
         score_lcb_c: float = 2.0,
         scalarizer: Scalarizer | None = None,
         pareto: bool = False,
+        score_rows: Callable[[RatingStore, np.ndarray], np.ndarray] | None = None,
     ) -> None:
         if max_size <= 0:
             raise ValueError("max_size must be a positive integer.")
@@ -44,6 +172,7 @@ class CrowdedPool:
         self.max_size = int(max_size)
         self.rng = rng or random.Random()
         self._score = score_fn
+        self._score_rows = score_rows
         self.pruning_strategy = str(pruning_strategy)
         self.knn_k = int(knn_k)
         self.scalarizer = scalarizer
@@ -53,17 +182,43 @@ class CrowdedPool:
         self.score_lcb_c = float(score_lcb_c)
         self.pareto = bool(pareto)
 
-        if self.pruning_strategy not in {"closest_pair", "knn_local_competition"}:
+        if self.pruning_strategy not in {
+            "closest_pair",
+            "knn_local_competition",
+            "pareto_front",
+        }:
             raise ValueError(
-                "pruning_strategy must be 'closest_pair' or 'knn_local_competition'."
+                "pruning_strategy must be 'closest_pair', 'knn_local_competition' "
+                "or 'pareto_front'."
             )
         if self.knn_k <= 0:
             raise ValueError("knn_k must be a positive integer.")
+        self.knn_index = str(knn_index)
+        self._knn: KnnIndex
+        if self.knn_index == "exact":
+            self._knn = ExactKnnIndex()
+        elif self.knn_index == "lsh":
+            self._knn = LshKnnIndex(
+                tables=lsh_tables, bits=lsh_bits, seed=self.rng.getrandbits(64)
+            )
+        else:
+            raise ValueError("knn_index must be 'exact' or 'lsh'.")
         if self.pareto and not self.metrics:
             raise ValueError("pareto=True requires a non-empty metrics list.")
+        if self.pruning_strategy == "pareto_front" and not self.metrics:
+            raise ValueError("pareto_front pruning requires a non-empty metrics list.")
 
         self._members: list[Elite] = []
         self._text_index: dict[str, Elite] = {}
+        self._slots: dict[str, int] = {}
+        self._matrix: np.ndarray | None = None
+        self._nn_index = np.zeros(0, dtype=np.int64)
+        self._nn_sim = np.zeros(0, dtype=np.float32)
+        self._scores = np.zeros(0, dtype=float)
+        self._score_stale = np.zeros(0, dtype=bool)
+        self._ratings = RatingStore(self.metrics)
+        # Built on the first closest-pair query; knn pools never pay for it.
+        self._nn_valid = False
 
     def __len__(self) -> int:
         return len(self._members)
@@ -78,7 +233,45 @@ class CrowdedPool:
     def best(self) -> Elite:
         if not self._members:
             raise ValueError("Pool is empty.")
-        return max(self._members, key=lambda elite: self._score(elite.ratings))
+        # argmax keeps the first of equal scores, like max() over members.
+        return self._members[int(np.argmax(self._fresh_scores()))]
+
+    def ranked(self, k: int | None = None) -> list[tuple[Elite, float]]:
+        """Members with their scores, best first (ties keep member order)."""
+        scores = self._fresh_scores()
+        order = np.argsort(-scores, kind="stable")
+        if k is not None:
+            order = order[: max(0, int(k))]
+        return [(self._members[i], float(scores[i])) for i in order]
+
+    def scores(self) -> np.ndarray:
+        """Scores aligned with `iter_elites()` order."""
+        return self._fresh_scores().copy()
+
+    def score_summary(self) -> dict[str, float]:
+        scores = self._fresh_scores()
+        if not scores.size:
+            return {}
+        p50, p90 = np.percentile(scores, [50, 90])
+        return {
+            "mean_score": float(scores.mean()),
+            "p50_score": float(p50),
+            "p90_score": float(p90),
+            "min_score": float(scores.min()),
+            "max_score": float(scores.max()),
+            "std_score": float(scores.std()),
+        }
+
+    def invalidate_scores(self, elites: Iterable[Elite] | None = None) -> None:
+        """Mark members whose ratings changed; None marks every member."""
+        n = len(self._members)
+        if elites is None:
+            self._score_stale[:n] = True
+            return
+        for elite in elites:
+            slot = self._slots.get(elite.text)
+            if slot is not None and self._members[slot] is elite:
+                self._score_stale[slot] = True
 
     def random_elite(self) -> Elite:
         if not self._members:
@@ -93,17 +286,17 @@ class CrowdedPool:
     def farthest_from(
         self, reference: Elite, *, exclude_texts: set[str] | None = None
     ) -> Elite | None:
-        exclude_texts = exclude_texts or set()
-        best: Elite | None = None
-        best_dist: float | None = None
-        for elite in self._members:
-            if elite.text in exclude_texts:
-                continue
-            dist = cosine_distance(reference.embedding, elite.embedding)
-            if best is None or best_dist is None or dist > best_dist:
-                best = elite
-                best_dist = dist
-        return best
+        if not self._members:
+            return None
+        sims = self._vectors() @ self._as_row(reference.embedding)
+        for text in exclude_texts or ():
+            slot = self._slots.get(text)
+            if slot is not None:
+                sims[slot] = np.inf
+        idx = int(np.argmin(sims))
+        if not np.isfinite(sims[idx]):
+            return None
+        return self._members[idx]
 
     def add_many(self, elites: Sequence[Elite]) -> None:
         """Add a batch, pruning until within max_size."""
@@ -112,11 +305,18 @@ class CrowdedPool:
             for elite in elites:
                 if elite.text in self._text_index:
                     continue
-                self._members.append(elite)
-                self._text_index[elite.text] = elite
+                self._append(elite)
             self._eliminate_until_limit()
             return
 
+        if self.pruning_strategy == "pareto_front":
+            for elite in elites:
+                if elite.text in self._text_index:
+                    continue
+                self._append(elite)
+            self._prune_by_fronts()
+            return
+
         if self.pruning_strategy == "knn_local_competition":
             # Order-dependent by nature; shuffle to reduce systematic bias.
             incoming = list(elites)
@@ -130,43 +330,266 @@ class CrowdedPool:
     def add(self, elite: Elite) -> None:
         self.add_many([elite])
 
+    def restore(self, elites: Sequence[Elite]) -> None:
+        """Load checkpointed members as-is, without insertion-time pruning.
+
+        The pool must be empty. Members beyond `max_size` (a resume with a
+        smaller population) go through `add_many` and are pruned as usual.
+        """
+        if self._members:
+            raise ValueError("restore() requires an empty pool.")
+        if len(elites) > self.max_size:
+            self.add_many(elites)
+            return
+        if elites:
+            dim = self._as_row(elites[0].embedding).shape[0]
+            self._reserve(len(elites), dim=dim)
+        for elite in elites:
+            if elite.text not in self._text_index:
+                self._append(elite)
+
     def _eliminate_until_limit(self) -> None:
         while len(self._members) > self.max_size:
             i, j = self._closest_pair_indices()
             loser = self._pick_loser(self._members[i], self._members[j])
             self._remove_by_text(loser.text)
 
+    def _prune_by_fronts(self) -> None:
+        """NSGA-II truncation on LCB vectors: drop the worst fronts whole, then
+        the most crowded members of the front that straddles the limit."""
+        excess = len(self._members) - self.max_size
+        if excess <= 0:
+            return
+        values = self._lcb_matrix(self._members)
+        losers: list[int] = []
+        for front in reversed(nondominated_fronts(values)):
+            need = excess - len(losers)
+            if len(front) <= need:
+                losers.extend(front)
+            else:
+                crowding = crowding_distance(values[front])
+                scalarized = [self._scalarized_lcb(values[i].tolist()) for i in front]
+                order = np.lexsort((scalarized, crowding))
+                losers.extend(front[i] for i in order[:need])
+            if len(losers) >= excess:
+                break
+        for elite in [self._members[i] for i in losers]:
+            self._remove_by_text(elite.text)
+
+    def _append(self, elite: Elite) -> None:
+        row = self._as_row(elite.embedding)
+        n = len(self._members)
+        self._reserve(n + 1, dim=row.shape[0])
+        self._matrix[n] = row
+        self._members.append(elite)
+        self._text_index[elite.text] = elite
+        self._slots[elite.text] = n
+        elite.ratings = self._ratings.bind(n, elite.ratings)
+        self._score_stale[n] = True
+        self._knn.add(n, self._matrix[n])
+        if self._nn_valid:
+            self._nn_insert(n)
+
     def _remove_by_text(self, text: str) -> None:
         elite = self._text_index.pop(text, None)
         if elite is None:
             return
-        self._members = [e for e in self._members if e.text != text]
+        slot = self._slots.pop(text)
+        last = len(self._members) - 1
+        self._ratings.release(slot)
+        if slot != last:
+            self._ratings.move(last, slot)
+            moved = self._members[last]
+            self._members[slot] = moved
+            self._matrix[slot] = self._matrix[last]
+            self._scores[slot] = self._scores[last]
+            self._score_stale[slot] = self._score_stale[last]
+            self._slots[moved.text] = slot
+        self._members.pop()
+        self._knn.remove(slot, last)
+        if self._nn_valid:
+            self._nn_remove(slot, last)
+
+    def _reserve(self, rows: int, *, dim: int) -> None:
+        if self._matrix is None:
+            capacity = max(self.max_size, rows)
+            self._matrix = np.zeros((capacity, dim), dtype=np.float32)
+            self._nn_index = np.full(capacity, -1, dtype=np.int64)
+            self._nn_sim = np.full(capacity, -np.inf, dtype=np.float32)
+            self._scores = np.zeros(capacity, dtype=float)
+            self._score_stale = np.ones(capacity, dtype=bool)
+            self._ratings.reserve(capacity)
+            return
+        if self._matrix.shape[1] != dim:
+            raise ValueError(
+                f"Embedding dimension {dim} does not match pool dimension "
+                f"{self._matrix.shape[1]}."
+            )
+        capacity = self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        # Only closest-pair batches overshoot max_size, and only transiently.
+        n = len(self._members)
+        capacity = max(rows, capacity + max(16, capacity // 8))
+        grown = np.zeros((capacity, dim), dtype=np.float32)
+        grown[:n] = self._vectors()
+        self._matrix = grown
+        nn_index = np.full(capacity, -1, dtype=np.int64)
+        nn_index[:n] = self._nn_index[:n]
+        self._nn_index = nn_index
+        nn_sim = np.full(capacity, -np.inf, dtype=np.float32)
+        nn_sim[:n] = self._nn_sim[:n]
+        self._nn_sim = nn_sim
+        scores = np.zeros(capacity, dtype=float)
+        scores[:n] = self._scores[:n]
+        self._scores = scores
+        stale = np.ones(capacity, dtype=bool)
+        stale[:n] = self._score_stale[:n]
+        self._score_stale = stale
+        self._ratings.reserve(capacity)
+
+    def _fresh_scores(self) -> np.ndarray:
+        n = len(self._members)
+        stale = np.flatnonzero(self._score_stale[:n])
+        if stale.size and self._score_rows is not None:
+            values = np.asarray(self._score_rows(self._ratings, stale), dtype=float)
+            ok = ~np.isnan(values)
+            self._scores[stale[ok]] = values[ok]
+            self._score_stale[stale[ok]] = False
+            # Rows with missing metrics go through score_fn (and its errors).
+            stale = stale[~ok]
+        for slot in stale.tolist():
+            self._scores[slot] = float(self._score(self._members[slot].ratings))
+            self._score_stale[slot] = False
+        return self._scores[:n]
+
+    def embedding_matrix(self) -> np.ndarray:
+        """Float32 embeddings aligned with `iter_elites()` order (a copy)."""
+        return self._vectors().copy()
+
+    def rating_matrix(
+        self, metrics: Sequence[str] | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(mu, sigma) of shape (len(pool), len(metrics)); NaN where missing."""
+        metrics = self.metrics if metrics is None else list(metrics)
+        return self._ratings.gather(np.arange(len(self._members)), metrics)
+
+    def ucb_matrix(
+        self, elites: Sequence[Elite], *, metrics: Sequence[str], beta: float
+    ) -> np.ndarray:
+        """μ + β·σ per elite and metric; -inf where a rating is missing."""
+        return self._bound_matrix(elites, metrics=metrics, sigma_coef=float(beta))
+
+    def _bound_matrix(
+        self, elites: Sequence[Elite], *, metrics: Sequence[str], sigma_coef: float
+    ) -> np.ndarray:
+        owned = [self._ratings.owns(e.ratings) for e in elites]
+        out = np.full((len(elites), len(metrics)), np.nan)
+        positions = [idx for idx, own in enumerate(owned) if own]
+        if positions:
+            rows = [elites[idx].ratings._row for idx in positions]
+            mu, sigma = self._ratings.gather(rows, metrics)
+            out[positions] = mu + sigma_coef * sigma
+        for idx, own in enumerate(owned):
+            if own:
+                continue
+            for col, metric in enumerate(metrics):
+                r = elites[idx].ratings.get(metric)
+                out[idx, col] = (
+                    np.nan if r is None else float(r.mu) + sigma_coef * float(r.sigma)
+                )
+        out[np.isnan(out)] = -np.inf
+        return out
+
+    def _vectors(self) -> np.ndarray:
+        if self._matrix is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._matrix[: len(self._members)]
+
+    @staticmethod
+    def _as_row(embedding: np.ndarray) -> np.ndarray:
+        return np.asarray(embedding, dtype=np.float32).reshape(-1)
 
     def _closest_pair_indices(self) -> tuple[int, int]:
-        if len(self._members) < 2:
+        n = len(self._members)
+        if n < 2:
             raise ValueError("Need at least two elites to find a closest pair.")
-        best_i = 0
-        best_j = 1
-        best_dist = cosine_distance(
-            self._members[0].embedding, self._members[1].embedding
-        )
-        for i in range(len(self._members)):
-            emb_i = self._members[i].embedding
-            for j in range(i + 1, len(self._members)):
-                dist = cosine_distance(emb_i, self._members[j].embedding)
-                if dist < best_dist:
-                    best_dist = dist
-                    best_i, best_j = i, j
-        return best_i, best_j
-
-    def _pick_loser(self, a: Elite, b: Elite) -> Elite:
+        if not self._nn_valid:
+            self._nn_rebuild()
+        # Highest similarity == smallest distance. Ties resolve to the lowest
+        # row and, within it, the lowest neighbour, i.e. the first pair of a
+        # row-major scan.
+        i = int(np.argmax(self._nn_sim[:n]))
+        j = int(self._nn_index[i])
+        return min(i, j), max(i, j)
+
+    def _nn_rebuild(self) -> None:
+        n = len(self._members)
+        self._nn_recompute(np.arange(n))
+        self._nn_valid = True
+
+    def _nn_recompute(self, rows: np.ndarray) -> None:
+        """Recompute the nearest neighbour of each row in `rows` from scratch."""
+        vectors = self._vectors()
+        n = vectors.shape[0]
+        for start in range(0, len(rows), _PAIR_BLOCK_ROWS):
+            block = rows[start : start + _PAIR_BLOCK_ROWS]
+            sims = vectors[block] @ vectors.T
+            sims[np.arange(len(block)), block] = -np.inf
+            if n < 2:
+                self._nn_index[block] = -1
+                self._nn_sim[block] = -np.inf
+                continue
+            best = np.argmax(sims, axis=1)
+            self._nn_index[block] = best
+            self._nn_sim[block] = sims[np.arange(len(block)), best]
+
+    def _nn_insert(self, slot: int) -> None:
+        vectors = self._vectors()
+        sims = vectors @ vectors[slot]
+        sims[slot] = -np.inf
+        # Strictly closer only: on ties the older, lower-index neighbour stays.
+        closer = np.flatnonzero(sims[:slot] > self._nn_sim[:slot])
+        self._nn_index[closer] = slot
+        self._nn_sim[closer] = sims[closer]
+        if slot == 0:
+            self._nn_index[0] = -1
+            self._nn_sim[0] = -np.inf
+            return
+        best = int(np.argmax(sims))
+        self._nn_index[slot] = best
+        self._nn_sim[slot] = sims[best]
+
+    def _nn_remove(self, slot: int, last: int) -> None:
+        """Patch the cache after `slot` was freed and row `last` moved into it."""
+        n = len(self._members)
+        if slot != last:
+            self._nn_index[slot] = self._nn_index[last]
+            self._nn_sim[slot] = self._nn_sim[last]
+        self._nn_index[last] = -1
+        self._nn_sim[last] = -np.inf
+        index = self._nn_index[:n]
+        stale = np.flatnonzero(index == slot)
+        if slot != last:
+            index[index == last] = slot
+        if stale.size:
+            self._nn_recompute(stale)
+
+    def _use_multiobjective(self) -> bool:
+        return bool(self.metrics) and (self.pareto or self.scalarizer is not None)
+
+    def _pick_loser(
+        self,
+        a: Elite,
+        b: Elite,
+        *,
+        a_lcb: list[float] | None = None,
+        b_lcb: list[float] | None = None,
+    ) -> Elite:
         """Return the elite to remove (lower is worse)."""
-        use_multiobjective = bool(self.metrics) and (
-            self.pareto or self.scalarizer is not None
-        )
-        if use_multiobjective:
-            a_lcb = self._lcb_vector(a)
-            b_lcb = self._lcb_vector(b)
+        if self._use_multiobjective():
+            if a_lcb is None or b_lcb is None:
+                a_lcb, b_lcb = self._lcb_matrix([a, b]).tolist()
 
             if self.pareto:
                 if dominates(a_lcb, b_lcb):
@@ -196,15 +619,12 @@ class CrowdedPool:
         return a if a.text > b.text else b
 
     def _lcb_vector(self, elite: Elite) -> list[float]:
-        c = float(self.score_lcb_c)
-        out: list[float] = []
-        for metric in self.metrics:
-            r = elite.ratings.get(metric)
-            if r is None:
-                out.append(float("-inf"))
-            else:
-                out.append(float(r.mu) - c * float(r.sigma))
-        return out
+        return self._lcb_matrix([elite])[0].tolist()
+
+    def _lcb_matrix(self, elites: Sequence[Elite]) -> np.ndarray:
+        return self._bound_matrix(
+            elites, metrics=self.metrics, sigma_coef=-float(self.score_lcb_c)
+        )
 
     def _scalarized_lcb(self, values: Sequence[float]) -> float:
         if not values:
@@ -219,12 +639,7 @@ class CrowdedPool:
         if elite.text in self._text_index:
             return
         if len(self._members) < self.max_size:
-            self._members.append(elite)
-            self._text_index[elite.text] = elite
-            return
-        if not self._members:
-            self._members.append(elite)
-            self._text_index[elite.text] = elite
+            self._append(elite)
             return
 
         k = min(self.knn_k, len(self._members))
@@ -236,25 +651,33 @@ class CrowdedPool:
             return
 
         self._remove_by_text(loser.text)
-        self._members.append(elite)
-        self._text_index[elite.text] = elite
+        self._append(elite)
 
     def _knn_indices(self, embedding: np.ndarray, *, k: int) -> list[int]:
         if k <= 0 or not self._members:
             return []
-        scored: list[tuple[float, int]] = []
-        for idx, member in enumerate(self._members):
-            scored.append((cosine_distance(embedding, member.embedding), idx))
-        scored.sort(key=lambda x: (x[0], x[1]))
-        return [idx for _dist, idx in scored[:k]]
+        return self._knn.query(self._vectors(), self._as_row(embedding), k=k)
 
     def _worst_of(self, elites: Sequence[Elite]) -> Elite:
         if not elites:
             raise ValueError("Need at least one elite to pick a worst.")
-        worst = elites[0]
-        for other in elites[1:]:
-            worst = self._pick_loser(worst, other)
-        return worst
+        if not self._use_multiobjective():
+            worst = elites[0]
+            for other in elites[1:]:
+                worst = self._pick_loser(worst, other)
+            return worst
+        lcbs = self._lcb_matrix(elites).tolist()
+        worst_idx = 0
+        for idx in range(1, len(elites)):
+            loser = self._pick_loser(
+                elites[worst_idx],
+                elites[idx],
+                a_lcb=lcbs[worst_idx],
+                b_lcb=lcbs[idx],
+            )
+            if loser is elites[idx]:
+                worst_idx = idx
+        return elites[worst_idx]
 
 
 def _avg_mu(ratings: dict[str, ts.Rating]) -> float:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 from concurrent.futures import ThreadPoolExecutor
-from collections.abc import Mapping, Sequence
-from typing import Protocol
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, Protocol
 
 from fuzzyevolve.core.battle import Battle
 from fuzzyevolve.core.critique import Critique
@@ -18,6 +20,14 @@ class Critic(Protocol):
     ) -> Critique | None: ...
 
 
+class AsyncCritic(Protocol):
+    async def acritique(
+        self,
+        *,
+        parent: Elite,
+    ) -> Critique | None: ...
+
+
 class MutationOperator(Protocol):
     def propose(
         self,
@@ -29,6 +39,17 @@ class MutationOperator(Protocol):
     ) -> Sequence[str]: ...
 
 
+class AsyncMutationOperator(Protocol):
+    async def apropose(
+        self,
+        *,
+        parent: Elite,
+        partners: Sequence[Elite] | None = None,
+        critique: Critique | None,
+        focus: str | None = None,
+    ) -> Sequence[str]: ...
+
+
 class Mutator(Protocol):
     def propose(
         self,
@@ -37,6 +58,18 @@ class Mutator(Protocol):
         critique: Critique | None,
         max_candidates: int,
         mutation_executor: ThreadPoolExecutor | None = None,
+        on_candidates: Callable[[Sequence[MutationCandidate]], None] | None = None,
+    ) -> Sequence[MutationCandidate]: ...
+
+
+class AsyncMutator(Protocol):
+    async def apropose(
+        self,
+        *,
+        parent: Elite,
+        critique: Critique | None,
+        max_candidates: int,
+        on_candidates: Callable[[Sequence[MutationCandidate]], None] | None = None,
     ) -> Sequence[MutationCandidate]: ...
 
 
@@ -48,3 +81,38 @@ class Ranker(Protocol):
         battle: Battle,
         metric_descriptions: Mapping[str, str] | None = None,
     ) -> BattleRanking: ...
+
+
+class AsyncRanker(Protocol):
+    async def arank(
+        self,
+        *,
+        metrics: Sequence[str],
+        battle: Battle,
+        metric_descriptions: Mapping[str, str] | None = None,
+    ) -> BattleRanking: ...
+
+
+async def acall(obj: Any, async_name: str, sync_name: str, **kwargs: Any) -> Any:
+    """Await `obj.<async_name>` if it is a coroutine function.
+
+    Otherwise run the blocking `obj.<sync_name>` in a worker thread so sync-only
+    implementations can be mixed into an asyncio run.
+    """
+    method = getattr(obj, async_name, None)
+    if method is not None and inspect.iscoroutinefunction(method):
+        return await method(**kwargs)
+    return await asyncio.to_thread(getattr(obj, sync_name), **kwargs)
+
+
+def accepts_kwarg(fn: Callable[..., Any] | None, name: str) -> bool:
+    """Whether `fn` can be called with keyword `name` (optional port features)."""
+    if fn is None:
+        return False
+    try:
+        params = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return False
+    return name in params or any(
+        p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+    )
@@ -0,0 +1,192 @@
+"""Array-backed per-metric ratings for pool members.
+
+`RatingStore` keeps μ and σ as (rows, metrics) float matrices; NaN marks a
+metric the member has no rating for. Each member's `Elite.ratings` is a
+`RatingsView` onto its row, so existing code that reads and writes
+`elite.ratings[metric]` keeps working while pool-wide queries (LCB/UCB
+vectors, stats) slice the matrices directly.
+
+A view follows its row when the pool swap-removes another member, and is
+detached (copied into a private dict) when its own member leaves the pool.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, Sequence
+
+import numpy as np
+import trueskill as ts
+
+
+class RatingStore:
+    def __init__(self, metrics: Sequence[str] = ()) -> None:
+        self._columns: dict[str, int] = {}
+        self._mu = np.full((0, 0), np.nan)
+        self._sigma = np.full((0, 0), np.nan)
+        self._views: list[RatingsView | None] = []
+        for metric in metrics:
+            self._column(metric)
+
+    @property
+    def metrics(self) -> list[str]:
+        return list(self._columns)
+
+    @property
+    def capacity(self) -> int:
+        return self._mu.shape[0]
+
+    def reserve(self, rows: int) -> None:
+        if rows <= self.capacity:
+            return
+        self._resize(rows=rows, cols=self._mu.shape[1])
+
+    def bind(self, row: int, ratings: Mapping[str, ts.Rating]) -> RatingsView:
+        """Copy `ratings` into `row` and return a live view onto it."""
+        self.reserve(row + 1)
+        values = list(ratings.items())
+        self._mu[row] = np.nan
+        self._sigma[row] = np.nan
+        view = RatingsView(self, row)
+        self._views[row] = view
+        for metric, rating in values:
+            self.write(row, metric, rating)
+        return view
+
+    def move(self, src: int, dst: int) -> None:
+        self._mu[dst] = self._mu[src]
+        self._sigma[dst] = self._sigma[src]
+        view = self._views[src]
+        self._views[dst] = view
+        self._views[src] = None
+        if view is not None:
+            view._row = dst
+
+    def release(self, row: int) -> None:
+        view = self._views[row]
+        self._views[row] = None
+        if view is not None:
+            view._detach()
+        self._mu[row] = np.nan
+        self._sigma[row] = np.nan
+
+    def owns(self, ratings: object) -> bool:
+        return isinstance(ratings, RatingsView) and ratings._store is self
+
+    def write(self, row: int, metric: str, rating: ts.Rating) -> None:
+        col = self._column(metric)
+        self._mu[row, col] = float(rating.mu)
+        self._sigma[row, col] = float(rating.sigma)
+
+    def gather(
+        self, rows: Iterable[int] | np.ndarray, metrics: Sequence[str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(mu, sigma) for `rows` x `metrics`; NaN where a rating is missing."""
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1)
+        mu = np.full((rows.shape[0], len(metrics)), np.nan)
+        sigma = np.full((rows.shape[0], len(metrics)), np.nan)
+        for out_col, metric in enumerate(metrics):
+            col = self._columns.get(metric)
+            if col is None:
+                continue
+            mu[:, out_col] = self._mu[rows, col]
+            sigma[:, out_col] = self._sigma[rows, col]
+        return mu, sigma
+
+    def _column(self, metric: str) -> int:
+        col = self._columns.get(metric)
+        if col is None:
+            col = len(self._columns)
+            self._columns[metric] = col
+            if col >= self._mu.shape[1]:
+                self._resize(rows=self.capacity, cols=col + 1)
+        return col
+
+    def _resize(self, *, rows: int, cols: int) -> None:
+        old_rows, old_cols = self._mu.shape
+        mu = np.full((rows, cols), np.nan)
+        sigma = np.full((rows, cols), np.nan)
+        mu[:old_rows, :old_cols] = self._mu
+        sigma[:old_rows, :old_cols] = self._sigma
+        self._mu = mu
+        self._sigma = sigma
+        self._views.extend([None] * (rows - old_rows))
+
+
+class RatingsView(MutableMapping[str, ts.Rating]):
+    """`dict[str, ts.Rating]` look-alike backed by one `RatingStore` row."""
+
+    __slots__ = ("_store", "_row", "_local")
+
+    def __init__(self, store: RatingStore, row: int) -> None:
+        self._store: RatingStore | None = store
+        self._row = row
+        self._local: dict[str, ts.Rating] | None = None
+
+    def __getitem__(self, metric: str) -> ts.Rating:
+        store = self._store
+        if store is None:
+            return self._local[metric]
+        col = store._columns.get(metric)
+        if col is None:
+            raise KeyError(metric)
+        mu = store._mu[self._row, col]
+        if math.isnan(mu):
+            raise KeyError(metric)
+        return ts.Rating(mu=float(mu), sigma=float(store._sigma[self._row, col]))
+
+    def __setitem__(self, metric: str, rating: ts.Rating) -> None:
+        if self._store is None:
+            self._local[metric] = rating
+        else:
+            self._store.write(self._row, metric, rating)
+
+    def __delitem__(self, metric: str) -> None:
+        store = self._store
+        if store is None:
+            del self._local[metric]
+            return
+        col = store._columns.get(metric)
+        if col is None or math.isnan(store._mu[self._row, col]):
+            raise KeyError(metric)
+        store._mu[self._row, col] = np.nan
+        store._sigma[self._row, col] = np.nan
+
+    def __contains__(self, metric: object) -> bool:
+        store = self._store
+        if store is None:
+            return metric in self._local
+        col = store._columns.get(metric)  # type: ignore[arg-type]
+        return col is not None and not math.isnan(store._mu[self._row, col])
+
+    def __iter__(self) -> Iterator[str]:
+        store = self._store
+        if store is None:
+            return iter(list(self._local))
+        row = store._mu[self._row]
+        return iter(
+            [
+                metric
+                for metric, col in store._columns.items()
+                if not math.isnan(row[col])
+            ]
+        )
+
+    def __len__(self) -> int:
+        if self._store is None:
+            return len(self._local)
+        return int(np.count_nonzero(~np.isnan(self._store._mu[self._row])))
+
+    def __repr__(self) -> str:
+        return f"RatingsView({dict(self)!r})"
+
+    def __reduce__(self):
+        # Pickles (island results, deep copies) carry plain dicts, not the store.
+        return (dict, (dict(self),))
+
+    def copy(self) -> dict[str, ts.Rating]:
+        return dict(self)
+
+    def _detach(self) -> None:
+        self._local = dict(self)
+        self._store = None
@@ -4,9 +4,14 @@ import math
 from dataclasses import dataclass
 from typing import Mapping, Sequence
 
+import numpy as np
 import trueskill as ts
 
 from fuzzyevolve.core.models import RatedText, Ratings
+from fuzzyevolve.core.rating_store import RatingStore
+from fuzzyevolve.core.trueskill_numpy import rate_ffa
+
+RATING_BACKENDS = ("trueskill", "numpy")
 
 
 @dataclass(frozen=True, slots=True)
@@ -26,10 +31,16 @@ class RatingSystem:
         draw_probability: float = 0.2,
         score_lcb_c: float = 2.0,
         child_prior_tau: float = 4.0,
+        backend: str = "trueskill",
     ) -> None:
         self.metrics = list(metrics)
         if not self.metrics:
             raise ValueError("At least one metric is required.")
+        if backend not in RATING_BACKENDS:
+            raise ValueError(
+                f"Unknown rating backend '{backend}' (expected one of {RATING_BACKENDS})."
+            )
+        self.backend = backend
         self.score_lcb_c = score_lcb_c
         self.child_prior_tau = child_prior_tau
         self.envs = {
@@ -42,6 +53,8 @@ class RatingSystem:
             )
             for metric in self.metrics
         }
+        env = next(iter(self.envs.values()))
+        self._draw_margin = ts.calc_draw_margin(draw_probability, 2, env)
 
     def new_ratings(self) -> Ratings:
         return {metric: self.envs[metric].create_rating() for metric in self.metrics}
@@ -60,6 +73,12 @@ class RatingSystem:
             weight * (ratings[m].mu - c * ratings[m].sigma) for m in self.metrics
         )
 
+    def score_rows(self, store: RatingStore, rows: np.ndarray) -> np.ndarray:
+        """Vectorized `score` for rows of a pool's rating store (NaN if missing)."""
+        mu, sigma = store.gather(rows, self.metrics)
+        weight = 1.0 / len(self.metrics)
+        return (weight * (mu - self.score_lcb_c * sigma)).sum(axis=1)
+
     def metric_lcb(self, rating: ts.Rating) -> float:
         return rating.mu - self.score_lcb_c * rating.sigma
 
@@ -135,6 +154,10 @@ class RatingSystem:
         if not ok:
             raise ValueError(f"Invalid ranking: {err}")
 
+        if self.backend == "numpy" and len(players) >= 2:
+            self._apply_ranking_numpy(players, ranking, frozen_indices)
+            return
+
         for metric in self.metrics:
             tiers = ranking.tiers_by_metric[metric]
             ranked_players: list[RatedText] = []
@@ -155,6 +178,41 @@ class RatingSystem:
                     continue
                 player.ratings[metric] = new_rating[0]
 
+    def _apply_ranking_numpy(
+        self,
+        players: Sequence[RatedText],
+        ranking: BattleRanking,
+        frozen_indices: set[int],
+    ) -> None:
+        """One batched free-for-all update across every metric."""
+        shape = (len(self.metrics), len(players))
+        mu = np.empty(shape)
+        sigma = np.empty(shape)
+        ranks = np.empty(shape, dtype=np.int64)
+        for row, metric in enumerate(self.metrics):
+            for col, player in enumerate(players):
+                rating = player.ratings[metric]
+                mu[row, col] = rating.mu
+                sigma[row, col] = rating.sigma
+            for rank, tier in enumerate(ranking.tiers_by_metric[metric]):
+                ranks[row, tier] = rank
+        env = self.envs[self.metrics[0]]
+        new_mu, new_sigma = rate_ffa(
+            mu,
+            sigma,
+            ranks,
+            beta=env.beta,
+            tau=env.tau,
+            draw_margin=self._draw_margin,
+        )
+        for col, player in enumerate(players):
+            if col in frozen_indices:
+                continue
+            for row, metric in enumerate(self.metrics):
+                player.ratings[metric] = ts.Rating(
+                    mu=float(new_mu[row, col]), sigma=float(new_sigma[row, col])
+                )
+
     def match_quality(self, a: RatedText, b: RatedText) -> float:
         """Average per-metric TrueSkill match quality for a 1v1 comparison."""
         self.ensure_ratings(a)
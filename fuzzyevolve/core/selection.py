@@ -18,22 +18,6 @@ def optimistic_score(ratings: dict[str, ts.Rating], beta: float) -> float:
     return total / len(ratings)
 
 
-def ucb_vector(
-    ratings: dict[str, ts.Rating],
-    *,
-    metrics: list[str],
-    optimistic_beta: float,
-) -> list[float]:
-    vec: list[float] = []
-    for metric in metrics:
-        rating = ratings.get(metric)
-        if rating is None:
-            vec.append(float("-inf"))
-            continue
-        vec.append(float(rating.mu) + float(optimistic_beta) * float(rating.sigma))
-    return vec
-
-
 class MixedParentSelector:
     """Mixture selector: uniform sampling + optimistic tournament."""
 
@@ -89,17 +73,13 @@ class MixedParentSelector:
                 key=lambda elite: optimistic_score(elite.ratings, self.optimistic_beta),
             )
 
-        vectors = [
-            ucb_vector(
-                elite.ratings,
-                metrics=self.metrics,
-                optimistic_beta=self.optimistic_beta,
-            )
-            for elite in contenders
-        ]
+        matrix = pool.ucb_matrix(
+            contenders, metrics=self.metrics, beta=self.optimistic_beta
+        )
+        vectors = matrix.tolist()
 
         chosen = (
-            list(nondominated_indices(vectors))
+            nondominated_indices(matrix)
             if self.pareto
             else list(range(len(contenders)))
         )
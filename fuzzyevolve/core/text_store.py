@@ -0,0 +1,168 @@
+"""Packed, append-only store for run texts keyed by sha256 text id.
+
+All texts live in one data file with a parallel offset index, instead of
+one file per text:
+
+    texts/pack.dat    records back to back (UTF-8, optionally zlib-compressed)
+    texts/pack.idx    one "<text_id> <offset> <length> <codec>" line per record
+    texts/pack.json   {"compression": "none" | "zlib"}
+
+A record only counts once its index line is written, so a crash between the
+two appends leaves unreferenced bytes in pack.dat that are never read (a
+torn index line is cut off before the next append). The whole index is held
+in memory; a reader that misses (e.g. the TUI following a live run) re-reads
+whatever was appended to pack.idx since it last looked.
+Runs recorded before the pack keep `texts/<text_id>.txt` files, which are
+still read as a fallback until `migrate_files` folds them in.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import zlib
+from pathlib import Path
+from typing import BinaryIO
+
+from fuzzyevolve.core.embedding_store import text_id
+
+TEXT_COMPRESSION = ("none", "zlib")
+
+_RAW = "r"
+_ZLIB = "z"
+
+
+class TextStore:
+    def __init__(self, root: Path, *, compression: str | None = None) -> None:
+        self.root = root
+        self.data_path = root / "pack.dat"
+        self.index_path = root / "pack.idx"
+        self.meta_path = root / "pack.json"
+        self._index: dict[str, tuple[int, int, str]] = {}
+        self._index_pos = 0
+        self._lock = threading.Lock()
+        self._writer: BinaryIO | None = None
+        self._index_writer: BinaryIO | None = None
+        self._reader: BinaryIO | None = None
+        self.compression = self._resolve_compression(compression)
+        self._refresh()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def put(self, text: str) -> str:
+        key = text_id(text)
+        if key not in self._index:
+            self._append(key, text)
+        return key
+
+    def get(self, key: str) -> str:
+        entry = self._index.get(key)
+        if entry is None:
+            with self._lock:
+                self._refresh()
+            entry = self._index.get(key)
+        if entry is None:
+            legacy = self.root / f"{key}.txt"
+            if legacy.is_file():
+                return legacy.read_text(encoding="utf-8")
+            raise KeyError(f"Unknown text id {key!r}.")
+        offset, length, codec = entry
+        with self._lock:
+            reader = self._reader
+            if reader is None:
+                reader = self._reader = self.data_path.open("rb")
+            reader.seek(offset)
+            data = reader.read(length)
+        if codec == _ZLIB:
+            data = zlib.decompress(data)
+        return data.decode("utf-8")
+
+    def migrate_files(self, *, remove: bool = True) -> int:
+        """Fold legacy `<text_id>.txt` files into the pack; returns how many."""
+        moved = 0
+        for path in sorted(self.root.glob("*.txt")):
+            key = path.stem
+            if key not in self._index:
+                self._append(key, path.read_text(encoding="utf-8"))
+                moved += 1
+            if remove:
+                path.unlink()
+        return moved
+
+    def close(self) -> None:
+        with self._lock:
+            for handle in (self._writer, self._index_writer, self._reader):
+                if handle is not None:
+                    handle.close()
+            self._writer = self._index_writer = self._reader = None
+
+    def _append(self, key: str, text: str) -> None:
+        data = text.encode("utf-8")
+        codec = _RAW
+        if self.compression == "zlib":
+            packed = zlib.compress(data)
+            if len(packed) < len(data):
+                data, codec = packed, _ZLIB
+        with self._lock:
+            if key in self._index:
+                return
+            if self._writer is None:
+                self.root.mkdir(parents=True, exist_ok=True)
+                # Drop a torn final index line left by a crash, so the next
+                # record starts on a line of its own.
+                self._refresh()
+                if self.index_path.exists():
+                    with self.index_path.open("r+b") as f:
+                        f.truncate(self._index_pos)
+                self._writer = self.data_path.open("ab")
+                self._index_writer = self.index_path.open("ab")
+            writer, index_writer = self._writer, self._index_writer
+            writer.seek(0, 2)
+            offset = writer.tell()
+            writer.write(data)
+            writer.flush()
+            index_writer.write(f"{key} {offset} {len(data)} {codec}\n".encode("ascii"))
+            index_writer.flush()
+            self._index[key] = (offset, len(data), codec)
+
+    def _refresh(self) -> None:
+        """Index records appended since the last look (by us or another process)."""
+        if not self.index_path.exists():
+            return
+        with self.index_path.open("rb") as f:
+            f.seek(self._index_pos)
+            tail = f.read()
+        # A torn final line (no newline) was never committed.
+        end = tail.rfind(b"\n") + 1
+        for line in tail[:end].decode("ascii", errors="replace").splitlines():
+            parts = line.split()
+            # Skip anything malformed rather than make the run unopenable.
+            if len(parts) != 4 or not (parts[1].isdigit() and parts[2].isdigit()):
+                continue
+            key, offset, length, codec = parts
+            self._index[key] = (int(offset), int(length), codec)
+        self._index_pos += end
+
+    def _resolve_compression(self, requested: str | None) -> str:
+        # An explicit choice is recorded for later opens (e.g. a resume);
+        # otherwise the pack keeps whatever it was created with.
+        if requested is None:
+            if not self.meta_path.exists():
+                return "none"
+            meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+            requested = str(meta.get("compression", "none"))
+        elif requested in TEXT_COMPRESSION:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self.meta_path.write_text(
+                json.dumps({"compression": requested}) + "\n", encoding="utf-8"
+            )
+        if requested not in TEXT_COMPRESSION:
+            raise ValueError(
+                f"Unknown text compression {requested!r}; "
+                f"expected one of {', '.join(TEXT_COMPRESSION)}."
+            )
+        return requested
@@ -0,0 +1,194 @@
+"""Free-for-all TrueSkill updates for many metrics at once.
+
+Computes the same expectation-propagation fixed point as
+`trueskill.TrueSkill.rate` for one-player teams (the only shape battles use),
+with each metric as a row of the batch. Instead of walking the chain of
+pairwise performance differences one factor at a time, every truncation
+factor is refreshed in parallel from the exact Gaussian posterior of the
+performances (a small batched linear solve), so the per-iteration cost is a
+handful of array operations regardless of battle size. Ties use the draw
+truncation, and the normal cdf/pdf are the erfc approximation `trueskill`
+uses by default; results agree with it to well below its own convergence
+tolerance.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+_SQRT2 = math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _erfc(x: np.ndarray) -> np.ndarray:
+    z = np.abs(x)
+    t = 1.0 / (1.0 + z / 2.0)
+    r = t * np.exp(
+        -z * z
+        - 1.26551223
+        + t
+        * (
+            1.00002368
+            + t
+            * (
+                0.37409196
+                + t
+                * (
+                    0.09678418
+                    + t
+                    * (
+                        -0.18628806
+                        + t
+                        * (
+                            0.27886807
+                            + t
+                            * (
+                                -1.13520398
+                                + t * (1.48851587 + t * (-0.82215223 + t * 0.17087277))
+                            )
+                        )
+                    )
+                )
+            )
+        )
+    )
+    return np.where(x < 0, 2.0 - r, r)
+
+
+def _cdf(x: np.ndarray) -> np.ndarray:
+    return 0.5 * _erfc(-x / _SQRT2)
+
+
+def _pdf(x: np.ndarray) -> np.ndarray:
+    return _INV_SQRT_2PI * np.exp(-(x**2) / 2.0)
+
+
+def _v_w_win(diff: np.ndarray, margin: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    x = diff - margin
+    denom = _cdf(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v = np.where(denom != 0, _pdf(x) / denom, -x)
+    return v, v * (v + x)
+
+
+def _v_w_draw(diff: np.ndarray, margin: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    abs_diff = np.abs(diff)
+    a = margin - abs_diff
+    b = -margin - abs_diff
+    denom = _cdf(a) - _cdf(b)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v_abs = np.where(denom != 0, (_pdf(b) - _pdf(a)) / denom, a)
+        w = v_abs**2 + (a * _pdf(a) - b * _pdf(b)) / denom
+    w = np.where(denom != 0, w, np.nan)
+    return np.where(diff < 0, -v_abs, v_abs), w
+
+
+def rate_ffa(
+    mu: np.ndarray,
+    sigma: np.ndarray,
+    ranks: np.ndarray,
+    *,
+    beta: float,
+    tau: float,
+    draw_margin: float,
+    min_delta: float = 1e-4,
+    max_iterations: int = 20,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Rate a (rows, players) batch of free-for-all matches.
+
+    `ranks[r, i]` is player i's rank in row r (lower is better, equal ranks
+    are draws). Returns updated (mu, sigma) in the input player order.
+    Raises FloatingPointError where `trueskill` would.
+    """
+    mu = np.asarray(mu, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    ranks = np.asarray(ranks)
+    rows, n = mu.shape
+    if n < 2:
+        raise ValueError("A free-for-all match needs at least two players.")
+    if min_delta <= 0:
+        raise ValueError("min_delta must be greater than 0")
+
+    order = np.argsort(ranks, axis=1, kind="stable")
+    mu_s = np.take_along_axis(mu, order, axis=1)
+    sigma_s = np.take_along_axis(sigma, order, axis=1)
+    ranks_s = np.take_along_axis(ranks, order, axis=1)
+    draws = ranks_s[:, :-1] == ranks_s[:, 1:]
+
+    # Skill prior with dynamics, and the performance prior it implies.
+    skill_var = sigma_s**2 + tau**2
+    perf_pi = 1.0 / (skill_var + beta**2)
+    perf_tau = perf_pi * mu_s
+
+    links = n - 1
+    idx = np.arange(n)
+    lo, hi = idx[:-1], idx[1:]
+
+    # Gaussian approximations of the truncation factors on d_k = p_k - p_{k+1}.
+    msg_pi = np.zeros((rows, links))
+    msg_tau = np.zeros((rows, links))
+
+    def perf_posterior() -> tuple[np.ndarray, np.ndarray]:
+        # Every d_k touches two neighbours, so the precision is tridiagonal.
+        precision = np.zeros((rows, n, n))
+        precision[:, idx, idx] = perf_pi
+        precision[:, lo, lo] += msg_pi
+        precision[:, hi, hi] += msg_pi
+        precision[:, lo, hi] = -msg_pi
+        precision[:, hi, lo] = -msg_pi
+        shift = perf_tau.copy()
+        shift[:, :-1] += msg_tau
+        shift[:, 1:] -= msg_tau
+        cov = np.linalg.inv(precision)
+        return cov, np.matmul(cov, shift[:, :, None])[:, :, 0]
+
+    active = np.ones(rows, dtype=bool)
+    for _ in range(max_iterations):
+        cov, mean = perf_posterior()
+        d_var = cov[:, lo, lo] + cov[:, hi, hi] - 2.0 * cov[:, lo, hi]
+        d_mean = mean[:, :-1] - mean[:, 1:]
+        # Cavity: the marginal of d_k without its own truncation message.
+        div_pi = 1.0 / d_var - msg_pi
+        div_tau = d_mean / d_var - msg_tau
+
+        sqrt_pi = np.sqrt(div_pi)
+        x = div_tau / sqrt_pi
+        margin = draw_margin * sqrt_pi
+        v_win, w_win = _v_w_win(x, margin)
+        v_draw, w_draw = _v_w_draw(x, margin)
+        v = np.where(draws, v_draw, v_win)
+        w = np.where(draws, w_draw, w_win)
+        ok = ((w > 0) & (w < 1)) | (draws & np.isfinite(w))
+        if not ok[active].all():
+            raise FloatingPointError(
+                "Cannot calculate correctly, set the backend to 'trueskill' "
+                "(or use its mpmath backend)."
+            )
+        new_pi = np.where(active[:, None], div_pi * w / (1.0 - w), msg_pi)
+        new_tau = np.where(
+            active[:, None], (div_tau * w + sqrt_pi * v) / (1.0 - w), msg_tau
+        )
+        delta = np.maximum(
+            np.abs(new_tau - msg_tau), np.sqrt(np.abs(new_pi - msg_pi))
+        ).max(axis=1)
+        msg_pi, msg_tau = new_pi, new_tau
+        active &= delta > min_delta
+        if not active.any():
+            break
+
+    # Message from the match back to each performance, then to each skill.
+    cov, mean = perf_posterior()
+    post_var = np.diagonal(cov, axis1=1, axis2=2)
+    up_pi = 1.0 / post_var - perf_pi
+    up_tau = mean / post_var - perf_tau
+    scale = 1.0 / (1.0 + beta**2 * up_pi)
+    post_pi = 1.0 / skill_var + scale * up_pi
+    post_tau = mu_s / skill_var + scale * up_tau
+
+    new_mu = np.empty_like(mu)
+    new_sigma = np.empty_like(sigma)
+    np.put_along_axis(new_mu, order, post_tau / post_pi, axis=1)
+    np.put_along_axis(new_sigma, order, np.sqrt(1.0 / post_pi), axis=1)
+    return new_mu, new_sigma
@@ -0,0 +1,237 @@
+"""Shared embedding worker: one loaded model serving many runs.
+
+`fuzzyevolve embed-worker` listens on a Unix socket; runs configured with
+`[embeddings].worker_socket` embed through `WorkerEmbeddingProvider` instead of
+loading their own copy of the model. Requests from every connection go
+through one queue, and whatever arrives within `max_wait_ms` of the first
+waiting request (up to `max_batch` texts) is encoded in a single call.
+
+Messages use the framing in `fuzzyevolve.core.embeddings`:
+
+    {"op": "info"}                  -> {"model": ..., "dim": ...}
+    {"op": "embed", "texts": [...]} -> {"n": ..., "dim": ...} + float32 rows
+    anything that fails             -> {"error": "..."}
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import socket
+import socketserver
+import stat
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from pathlib import Path
+
+import numpy as np
+
+from fuzzyevolve.core.embeddings import read_frame, write_frame
+
+log_worker = logging.getLogger("embeddings.worker")
+
+
+class _Batcher:
+    def __init__(
+        self,
+        embed_many: Callable[[Sequence[str]], np.ndarray],
+        *,
+        max_batch: int,
+        max_wait_s: float,
+    ) -> None:
+        self._embed_many = embed_many
+        self.max_batch = max_batch
+        self.max_wait_s = max_wait_s
+        self.batches = 0
+        self.requests = 0
+        self.texts = 0
+        self._queue: queue.Queue[tuple[list[str], Future] | None] = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._loop, name="embedding-batcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, texts: list[str]) -> Future:
+        future: Future = Future()
+        self._queue.put((texts, future))
+        return future
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            size = len(item[0])
+            stop = False
+            deadline = time.monotonic() + self.max_wait_s
+            while size < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                size += len(item[0])
+            self._run(batch)
+            if stop:
+                return
+
+    def _run(self, batch: list[tuple[list[str], Future]]) -> None:
+        texts = [text for chunk, _ in batch for text in chunk]
+        try:
+            vectors = np.asarray(self._embed_many(texts), dtype=np.float32)
+        except Exception as exc:
+            log_worker.exception("Embedding batch of %d texts failed.", len(texts))
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        self.batches += 1
+        self.requests += len(batch)
+        self.texts += len(texts)
+        offset = 0
+        for chunk, future in batch:
+            future.set_result(vectors[offset : offset + len(chunk)])
+            offset += len(chunk)
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: _Server
+
+    def handle(self) -> None:
+        conn: socket.socket = self.request
+        while True:
+            try:
+                header = read_frame(conn)
+            except (OSError, ValueError):
+                return
+            if header is None:
+                return
+            try:
+                reply, body = self.server.worker.answer(header)
+            except Exception as exc:
+                reply, body = {"error": f"{type(exc).__name__}: {exc}"}, b""
+            try:
+                write_frame(conn, reply, body)
+            except OSError:
+                return
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    worker: EmbeddingWorker
+
+
+class EmbeddingWorker:
+    """Serve `embed_many` for `model` on a Unix socket, batching across clients."""
+
+    def __init__(
+        self,
+        socket_path: str | Path,
+        embed_many: Callable[[Sequence[str]], np.ndarray],
+        *,
+        model: str,
+        dim: int,
+        max_batch: int = 256,
+        max_wait_ms: float = 5.0,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1.")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must be >= 0.")
+        self.socket_path = Path(socket_path)
+        self.model = model
+        self.dim = int(dim)
+        _claim_socket_path(self.socket_path)
+        self._batcher = _Batcher(
+            embed_many, max_batch=max_batch, max_wait_s=max_wait_ms / 1000.0
+        )
+        self._server = _Server(str(self.socket_path), _Handler)
+        self._server.worker = self
+        self._serving = False
+        self._thread: threading.Thread | None = None
+
+    def answer(self, header: dict) -> tuple[dict, bytes]:
+        op = header.get("op")
+        if op == "info":
+            return {"model": self.model, "dim": self.dim}, b""
+        if op == "embed":
+            texts = [str(text) for text in header.get("texts", [])]
+            vectors = self._batcher.submit(texts).result()
+            if vectors.shape != (len(texts), self.dim):
+                raise ValueError(
+                    f"Embedder returned shape {vectors.shape}, "
+                    f"expected {(len(texts), self.dim)}."
+                )
+            body = np.ascontiguousarray(vectors, dtype="<f4").tobytes()
+            return {"n": len(texts), "dim": self.dim}, body
+        raise ValueError(f"Unknown op {op!r}.")
+
+    def serve_forever(self) -> None:
+        log_worker.info(
+            "Serving %s (%d-dim) embeddings on %s",
+            self.model,
+            self.dim,
+            self.socket_path,
+        )
+        self._serving = True
+        self._server.serve_forever()
+
+    def start(self) -> None:
+        """Serve on a background thread (for embedding the worker in-process)."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="embedding-worker", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._serving:
+            # Returns at once if serve_forever already exited (e.g. Ctrl-C).
+            self._server.shutdown()
+        self._server.server_close()
+        self._batcher.close()
+        if self._thread is not None:
+            self._thread.join()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "batches": self._batcher.batches,
+            "requests": self._batcher.requests,
+            "texts": self._batcher.texts,
+        }
+
+
+def _claim_socket_path(path: Path) -> None:
+    """Remove a stale socket left by a dead worker; refuse to steal a live one."""
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return
+    if not stat.S_ISSOCK(path.lstat().st_mode):
+        raise RuntimeError(
+            f"{path} exists and is not a socket; refusing to replace it."
+        )
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        os.unlink(path)
+    else:
+        raise RuntimeError(f"An embedding worker is already serving {path}.")
+    finally:
+        probe.close()
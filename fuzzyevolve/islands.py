@@ -0,0 +1,410 @@
+"""Island model: several engines in separate processes with periodic migration.
+
+Each island owns its pool, embedding model and RNG streams. Every
+`islands.migration_interval` iterations an island sends a few elites to the
+next island in a ring and waits for the ones sent by the previous island.
+Migrants carry their embeddings and ratings, so nothing is re-embedded or
+re-rated on arrival.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing as mp
+import queue
+import random
+import traceback
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+import trueskill as ts
+
+from fuzzyevolve.config import Config
+from fuzzyevolve.core.models import Elite, IterationSnapshot
+from fuzzyevolve.core.pool import CrowdedPool, cosine_distance
+
+log_islands = logging.getLogger("islands")
+
+
+class Recorder(Protocol):
+    def record_event(
+        self, kind: str, data: Mapping[str, Any], *, iteration: int | None = None
+    ) -> None: ...
+
+    def put_text(self, text: str) -> str: ...
+
+
+class MigrationQueue(Protocol):
+    def put(self, item: Any) -> None: ...
+
+    def get(self, block: bool = True, timeout: float | None = None) -> Any: ...
+
+
+@dataclass(frozen=True, slots=True)
+class Migrant:
+    """Picklable copy of an elite for transfer between processes."""
+
+    text: str
+    embedding: np.ndarray
+    ratings: dict[str, tuple[float, float]]
+    age: int
+
+    @classmethod
+    def from_elite(cls, elite: Elite) -> "Migrant":
+        return cls(
+            text=elite.text,
+            embedding=np.asarray(elite.embedding).copy(),
+            ratings={
+                metric: (float(rating.mu), float(rating.sigma))
+                for metric, rating in elite.ratings.items()
+            },
+            age=int(elite.age),
+        )
+
+    def to_elite(self) -> Elite:
+        return Elite(
+            text=self.text,
+            embedding=self.embedding.copy(),
+            ratings={
+                metric: ts.Rating(mu=mu, sigma=sigma)
+                for metric, (mu, sigma) in self.ratings.items()
+            },
+            age=self.age,
+        )
+
+
+def select_migrants(
+    pool: CrowdedPool,
+    *,
+    count: int,
+    selection: str,
+    score_fn: Callable[[dict[str, ts.Rating]], float],
+) -> list[Elite]:
+    elites = sorted(pool.iter_elites(), key=lambda e: score_fn(e.ratings), reverse=True)
+    count = min(int(count), len(elites))
+    if count <= 0:
+        return []
+    if selection == "best":
+        return elites[:count]
+    if selection == "diverse":
+        chosen = [elites[0]]
+        rest = elites[1:]
+        while len(chosen) < count and rest:
+            # Ties keep the better-scored elite (rest is sorted by score).
+            pick = max(
+                range(len(rest)),
+                key=lambda i: (
+                    min(
+                        cosine_distance(rest[i].embedding, c.embedding) for c in chosen
+                    ),
+                    -i,
+                ),
+            )
+            chosen.append(rest.pop(pick))
+        return chosen
+    raise ValueError(f"Unknown migrant selection '{selection}'.")
+
+
+class IslandMigrator:
+    """`on_iteration` hook that exchanges migrants with neighbouring islands.
+
+    Sends to `outbox` and then blocks on `inbox`, so all islands line up at the
+    same iteration. No migration happens after the final iteration.
+    """
+
+    def __init__(
+        self,
+        *,
+        island: int,
+        pool: CrowdedPool,
+        inbox: MigrationQueue,
+        outbox: MigrationQueue,
+        interval: int,
+        migrants: int,
+        selection: str,
+        end_iteration: int,
+        score_fn: Callable[[dict[str, ts.Rating]], float],
+        timeout_s: float = 600.0,
+        store: Recorder | None = None,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be a positive integer.")
+        self.island = int(island)
+        self.pool = pool
+        self.inbox = inbox
+        self.outbox = outbox
+        self.interval = int(interval)
+        self.migrants = int(migrants)
+        self.selection = str(selection)
+        self.end_iteration = int(end_iteration)
+        self.score_fn = score_fn
+        self.timeout_s = float(timeout_s)
+        self.store = store
+
+    def __call__(self, snapshot: IterationSnapshot) -> None:
+        iteration = int(snapshot.iteration)
+        if iteration % self.interval != 0 or iteration >= self.end_iteration:
+            return
+
+        outgoing = select_migrants(
+            self.pool,
+            count=self.migrants,
+            selection=self.selection,
+            score_fn=self.score_fn,
+        )
+        self.outbox.put(
+            (self.island, iteration, [Migrant.from_elite(e) for e in outgoing])
+        )
+        try:
+            source, sent_at, received = self.inbox.get(timeout=self.timeout_s)
+        except queue.Empty as exc:
+            raise RuntimeError(
+                f"Island {self.island} received no migrants within "
+                f"{self.timeout_s:.0f}s at iteration {iteration}."
+            ) from exc
+        if int(sent_at) != iteration:
+            raise RuntimeError(
+                f"Island {self.island} got migrants from iteration {sent_at} "
+                f"at iteration {iteration}."
+            )
+
+        incoming = [
+            migrant.to_elite()
+            for migrant in received
+            if not self.pool.contains_text(migrant.text)
+        ]
+        self.pool.add_many(incoming)
+        log_islands.info(
+            "Island %d: sent %d, received %d (%d new) from island %d.",
+            self.island,
+            len(outgoing),
+            len(received),
+            len(incoming),
+            source,
+        )
+        if self.store:
+            try:
+                self.store.record_event(
+                    "migration",
+                    {
+                        "island": self.island,
+                        "source": int(source),
+                        "sent_text_ids": [self._text_id(e) for e in outgoing],
+                        "received_text_ids": [
+                            self.store.put_text(m.text) for m in received
+                        ],
+                        "accepted_text_ids": [
+                            self._text_id(e)
+                            for e in incoming
+                            if self.pool.contains_text(e.text)
+                        ],
+                    },
+                    iteration=iteration,
+                )
+            except Exception:
+                log_islands.exception("Failed to record migration.")
+
+    def _text_id(self, elite: Elite) -> str:
+        text_id_of = getattr(self.store, "text_id_of", None)
+        if text_id_of is not None:
+            return text_id_of(elite)
+        return self.store.put_text(elite.text)
+
+
+def island_seeds(seed: int, count: int) -> list[int]:
+    rng = random.Random(seed)
+    return [rng.randrange(2**32) for _ in range(int(count))]
+
+
+@dataclass(frozen=True, slots=True)
+class IslandProgress:
+    island: int
+    iteration: int
+    best_score: float
+    pool_size: int
+
+
+@dataclass(frozen=True, slots=True)
+class _IslandTask:
+    island: int
+    count: int
+    cfg_data: dict[str, Any]
+    seed: int
+    seed_text: str
+    run_dir: str | None
+    log_level: int
+    log_file: str | None
+
+
+def _island_main(
+    task: _IslandTask,
+    inboxes: Sequence[MigrationQueue],
+    events: MigrationQueue,
+) -> None:
+    store = None
+    try:
+        from fuzzyevolve.builder import (
+            build_embedder,
+            build_embedding_provider,
+            build_engine,
+            build_response_cache,
+            run_engine,
+        )
+        from fuzzyevolve.console.logging import setup_logging
+        from fuzzyevolve.run_store import RunStore
+
+        setup_logging(
+            level=task.log_level,
+            quiet=True,
+            log_file=Path(task.log_file) if task.log_file else None,
+        )
+        cfg = Config.model_validate(task.cfg_data)
+        if task.run_dir:
+            store = RunStore.create_at(
+                run_dir=Path(task.run_dir),
+                cfg=cfg,
+                seed_text=task.seed_text,
+                config_path=None,
+            )
+
+        provider = build_embedding_provider(cfg)
+        embedder = build_embedder(cfg, provider, store)
+        built = build_engine(
+            cfg,
+            seed=task.seed,
+            embed=embedder.embed,
+            embed_many=embedder.embed_many,
+            embedding_stats=provider.cache_stats,
+            recorder=store,
+            response_cache=build_response_cache(
+                cfg, data_dir=RunStore.default_data_dir(cwd=Path.cwd())
+            ),
+        )
+        migrator = IslandMigrator(
+            island=task.island,
+            pool=built.pool,
+            inbox=inboxes[task.island],
+            outbox=inboxes[(task.island + 1) % task.count],
+            interval=cfg.islands.migration_interval,
+            migrants=cfg.islands.migrants,
+            selection=cfg.islands.selection,
+            end_iteration=cfg.run.iterations,
+            score_fn=built.rating.score,
+            timeout_s=cfg.islands.timeout_s,
+            store=store,
+        )
+
+        def on_iteration(snapshot: IterationSnapshot) -> None:
+            events.put(
+                (
+                    "progress",
+                    IslandProgress(
+                        island=task.island,
+                        iteration=snapshot.iteration,
+                        best_score=snapshot.best_score,
+                        pool_size=snapshot.pool_size,
+                    ),
+                )
+            )
+            migrator(snapshot)
+
+        run_engine(
+            built, seed_text=task.seed_text, resume=False, on_iteration=on_iteration
+        )
+        events.put(
+            (
+                "done",
+                task.island,
+                [Migrant.from_elite(e) for e in built.pool.iter_elites()],
+            )
+        )
+    except BaseException:
+        events.put(("error", task.island, traceback.format_exc()))
+        raise
+    finally:
+        # Worker processes skip atexit hooks; flush the recorded logs here.
+        if store is not None:
+            store.close()
+
+
+def run_islands(
+    cfg: Config,
+    *,
+    seed: int,
+    seed_text: str,
+    run_dir: Path | None = None,
+    log_level: int = logging.INFO,
+    log_file: Path | None = None,
+    on_progress: Callable[[IslandProgress], None] | None = None,
+    poll_interval_s: float = 1.0,
+) -> list[list[Elite]]:
+    """Run `cfg.islands.count` islands to completion; return each final pool.
+
+    Island `i` records to `run_dir/islands/island_<i>` when `run_dir` is set.
+    """
+    count = int(cfg.islands.count)
+    ctx = mp.get_context("spawn")
+    inboxes = [ctx.Queue() for _ in range(count)]
+    events = ctx.Queue()
+    cfg_data = cfg.model_dump(mode="json")
+
+    processes = []
+    for island, island_seed in enumerate(island_seeds(seed, count)):
+        task = _IslandTask(
+            island=island,
+            count=count,
+            cfg_data=cfg_data,
+            seed=island_seed,
+            seed_text=seed_text,
+            run_dir=(
+                str(run_dir / "islands" / f"island_{island:02d}") if run_dir else None
+            ),
+            log_level=int(log_level),
+            log_file=(
+                str(
+                    log_file.with_name(
+                        f"{log_file.stem}.island{island:02d}{log_file.suffix}"
+                    )
+                )
+                if log_file
+                else None
+            ),
+        )
+        proc = ctx.Process(
+            target=_island_main,
+            args=(task, inboxes, events),
+            name=f"fuzzyevolve-island-{island}",
+        )
+        proc.start()
+        processes.append(proc)
+
+    finals: dict[int, list[Elite]] = {}
+    try:
+        while len(finals) < count:
+            try:
+                message = events.get(timeout=poll_interval_s)
+            except queue.Empty:
+                for island, proc in enumerate(processes):
+                    if island not in finals and not proc.is_alive():
+                        raise RuntimeError(
+                            f"Island {island} exited with code {proc.exitcode}."
+                        )
+                continue
+            kind = message[0]
+            if kind == "progress":
+                if on_progress:
+                    on_progress(message[1])
+            elif kind == "done":
+                finals[int(message[1])] = [m.to_elite() for m in message[2]]
+            elif kind == "error":
+                raise RuntimeError(f"Island {message[1]} failed:\n{message[2]}")
+    finally:
+        for proc in processes:
+            if proc.is_alive() and len(finals) < count:
+                proc.terminate()
+        for proc in processes:
+            proc.join()
+    return [finals[island] for island in range(count)]
@@ -26,13 +26,10 @@ def top_by_fitness(
 ) -> list[RankedElite]:
     if top < 0:
         raise ValueError("top must be >= 0")
-    elites = list(pool.iter_elites())
-    elites.sort(key=lambda e: rating.score(e.ratings), reverse=True)
-    if top != 0:
-        elites = elites[: min(top, len(elites))]
+    ranked = pool.ranked(None if top == 0 else top)
     return [
-        RankedElite(rank=idx, elite=elite, score=rating.score(elite.ratings))
-        for idx, elite in enumerate(elites, start=1)
+        RankedElite(rank=idx, elite=elite, score=score)
+        for idx, (elite, score) in enumerate(ranked, start=1)
     ]
 
 
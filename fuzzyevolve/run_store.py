@@ -1,23 +1,28 @@
 from __future__ import annotations
 
-import hashlib
 import json
 import os
 import threading
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, Mapping, Sequence
 
 import numpy as np
 import trueskill as ts
 
-from fuzzyevolve.config import Config
+from fuzzyevolve.config import Config, RunConfig
 from fuzzyevolve.core.anchors import AnchorManager, AnchorPool
+from fuzzyevolve.core.embedding_store import EmbeddingStore, store_tag
+from fuzzyevolve.core.embeddings import embed_each
+from fuzzyevolve.core.jsonl_writer import JsonlWriter
 from fuzzyevolve.core.models import Anchor, Elite
 from fuzzyevolve.core.pool import CrowdedPool
+from fuzzyevolve.core.text_store import TextStore
 
 SCHEMA_VERSION = 2
+_TEXT_ID_MEMO_MAX = 16384
 
 
 def _utc_now_iso() -> str:
@@ -28,8 +33,10 @@ def _json_dump(obj: Any) -> str:
     return json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
 
 
-def _hash_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+def _replace_text(path: Path, text: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def _rating_to_dict(r: ts.Rating) -> dict[str, float]:
@@ -63,8 +70,26 @@ class LoadedState:
     anchors: AnchorManager | None
 
 
+@dataclass(frozen=True, slots=True)
+class _BinarySnapshot:
+    raw: dict[str, Any]
+    embeddings: np.ndarray
+    text_blob: bytes
+    text_offsets: np.ndarray
+
+    def text(self, row: int) -> str:
+        start, end = self.text_offsets[row], self.text_offsets[row + 1]
+        return self.text_blob[start:end].decode("utf-8")
+
+
 class RunStore:
-    def __init__(self, run_dir: Path) -> None:
+    def __init__(
+        self,
+        run_dir: Path,
+        *,
+        text_compression: str | None = None,
+        run_cfg: RunConfig | None = None,
+    ) -> None:
         self.run_dir = run_dir
         self.texts_dir = run_dir / "texts"
         self.checkpoints_dir = run_dir / "checkpoints"
@@ -72,14 +97,37 @@ class RunStore:
         self.events_path = run_dir / "events.jsonl"
         self.llm_index_path = run_dir / "llm.jsonl"
         self.stats_path = run_dir / "stats.jsonl"
+        self.critique_cache_path = run_dir / "critique_cache.jsonl"
+        self.embeddings_dir = run_dir / "embeddings"
+        self.journal_path = self.checkpoints_dir / "journal.jsonl"
+        self.binary_checkpoint_path = self.checkpoints_dir / "latest.npz"
 
         self._lock = threading.Lock()
+        # Events, stats and LLM calls (index, prompts, outputs) go through a
+        # background writer, started on the first record so read-only opens
+        # (TUI) spawn no thread.
+        self._run_cfg = run_cfg
+        self._writer: JsonlWriter | None = None
         self._llm_call_seq = 0
         self._current_iteration = 0
+        # What the last save_checkpoint recorded, so the next one can append
+        # only the difference. None until this process writes a snapshot.
+        self._saved_members: dict[str, dict[str, Any]] | None = None
+        self._saved_anchors: dict[str, Any] | None = None
+        self._snapshot_iteration = 0
+        # text -> id for recently stored texts, so repeated put_text calls on
+        # the same candidate/partner strings skip re-hashing.
+        self._text_ids: dict[str, str] = {}
+        # Pipelined asyncio runs keep several iterations in flight; each task
+        # tags its own LLM calls via a context-local iteration.
+        self._iteration_var: ContextVar[int | None] = ContextVar(
+            f"run_store_iteration_{id(self)}", default=None
+        )
 
         self.texts_dir.mkdir(parents=True, exist_ok=True)
         self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
         self.llm_dir.mkdir(parents=True, exist_ok=True)
+        self.text_store = TextStore(self.texts_dir, compression=text_compression)
 
         if self.llm_index_path.exists():
             try:
@@ -103,10 +151,26 @@ class RunStore:
 
         ts_part = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         rand_part = os.urandom(3).hex()
-        run_dir = runs_root / f"{ts_part}_{rand_part}"
+        return cls.create_at(
+            run_dir=runs_root / f"{ts_part}_{rand_part}",
+            cfg=cfg,
+            seed_text=seed_text,
+            config_path=config_path,
+        )
+
+    @classmethod
+    def create_at(
+        cls,
+        *,
+        run_dir: Path,
+        cfg: Config,
+        seed_text: str | None,
+        config_path: Path | None,
+    ) -> "RunStore":
+        """Create a new run in `run_dir` (which must not exist yet)."""
         run_dir.mkdir(parents=True, exist_ok=False)
 
-        store = cls(run_dir)
+        store = cls(run_dir, text_compression=cfg.run.text_compression, run_cfg=cfg.run)
         store._write_text(
             run_dir / "meta.json", _json_dump(store._build_meta(cfg, config_path))
         )
@@ -154,23 +218,77 @@ class RunStore:
     def latest_checkpoint_path(self) -> Path:
         return self.checkpoints_dir / "latest.json"
 
+    def checkpoint_mtime(self) -> float:
+        """Last time the latest checkpoint (snapshot or journal) changed."""
+        mtimes = [
+            path.stat().st_mtime
+            for path in (self.latest_checkpoint_path(), self.journal_path)
+            if path.exists()
+        ]
+        return max(mtimes, default=0.0)
+
     def set_iteration(self, iteration: int) -> None:
         self._current_iteration = max(0, int(iteration))
+        self._iteration_var.set(self._current_iteration)
+
+    def current_iteration(self) -> int:
+        iteration = self._iteration_var.get()
+        if iteration is None:
+            # Threads started by a plain executor do not inherit the context.
+            return self._current_iteration
+        return iteration
 
     def put_text(self, text: str) -> str:
-        text_id = _hash_text(text)
-        path = self.texts_dir / f"{text_id}.txt"
-        if path.exists():
-            return text_id
-        with self._lock:
-            if path.exists():
-                return text_id
-            path.write_text(text, encoding="utf-8")
+        text_id = self._text_ids.get(text)
+        if text_id is None:
+            text_id = self.text_store.put(text)
+            with self._lock:
+                if len(self._text_ids) >= _TEXT_ID_MEMO_MAX:
+                    # Drop the oldest entry; dicts keep insertion order.
+                    self._text_ids.pop(next(iter(self._text_ids)), None)
+                self._text_ids[text] = text_id
+        return text_id
+
+    def text_id_of(self, item: Elite | Anchor) -> str:
+        """Id of an elite's or anchor's text, persisted and cached on the item."""
+        text_id = item.text_id
+        if text_id is None or text_id not in self.text_store:
+            text_id = item.text_id = self.put_text(item.text)
         return text_id
 
     def get_text(self, text_id: str) -> str:
-        path = self.texts_dir / f"{text_id}.txt"
-        return path.read_text(encoding="utf-8")
+        return self.text_store.get(text_id)
+
+    def migrate_text_files(self, *, remove: bool = True) -> int:
+        """Move a pre-pack run's `texts/<id>.txt` files into the text pack."""
+        return self.text_store.migrate_files(remove=remove)
+
+    def embedding_store(
+        self, *, model: str, dim: int, read_only: bool = False
+    ) -> EmbeddingStore:
+        """Persisted vectors for `model`, keyed by the same ids as `texts/`."""
+        return EmbeddingStore(
+            self.embeddings_dir / store_tag(model, dim),
+            model=model,
+            dim=dim,
+            read_only=read_only,
+        )
+
+    def stored_embedding_dim(self, model: str) -> int | None:
+        """Dimension of an existing embedding store for `model`, if any.
+
+        Lets a resume open its saved vectors without loading the model.
+        """
+        if not self.embeddings_dir.is_dir():
+            return None
+        for meta_path in sorted(self.embeddings_dir.glob("*/meta.json")):
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if meta.get("model") == model and int(meta.get("dim", 0)) > 0:
+                return int(meta["dim"])
+        return None
 
     def record_event(
         self, kind: str, data: Mapping[str, Any], *, iteration: int | None = None
@@ -178,12 +296,12 @@ class RunStore:
         payload = {
             "ts": _utc_now_iso(),
             "iteration": int(
-                iteration if iteration is not None else self._current_iteration
+                iteration if iteration is not None else self.current_iteration()
             ),
             "type": kind,
             "data": _to_jsonable(dict(data)),
         }
-        self._append_jsonl(self.events_path, payload)
+        self._record(self.events_path, payload)
 
     def record_stats(
         self,
@@ -201,7 +319,7 @@ class RunStore:
         }
         if extra:
             payload.update(_to_jsonable(dict(extra)))
-        self._append_jsonl(self.stats_path, payload)
+        self._record(self.stats_path, payload)
 
     def record_llm_call(
         self,
@@ -215,20 +333,20 @@ class RunStore:
         iteration: int | None = None,
         extra: Mapping[str, Any] | None = None,
     ) -> None:
-        it = int(iteration if iteration is not None else self._current_iteration)
+        it = int(iteration if iteration is not None else self.current_iteration())
         with self._lock:
             self._llm_call_seq += 1
             call_id = self._llm_call_seq
 
+        writer = self._get_writer()
         stem = f"it{it:06d}_{call_id:05d}_{name}"
         prompt_path = self.llm_dir / f"{stem}.prompt.txt"
-        prompt_path.write_text(prompt, encoding="utf-8")
+        writer.write_file(prompt_path, prompt)
 
         output_path: Path | None = None
         if output is not None:
-            out_obj = _to_jsonable(output)
             output_path = self.llm_dir / f"{stem}.output.json"
-            output_path.write_text(_json_dump(out_obj), encoding="utf-8")
+            writer.write_file(output_path, _json_dump(_to_jsonable(output)))
 
         payload = {
             "ts": _utc_now_iso(),
@@ -243,7 +361,7 @@ class RunStore:
             "error": error,
             "extra": _to_jsonable(dict(extra or {})),
         }
-        self._append_jsonl(self.llm_index_path, payload)
+        writer.write(self.llm_index_path, payload)
 
     def save_checkpoint(
         self,
@@ -252,17 +370,86 @@ class RunStore:
         pool: CrowdedPool,
         anchor_manager: AnchorManager | None,
         keep: bool,
+        snapshot_interval: int = 1,
+        binary: bool = False,
     ) -> None:
-        data = self._serialize_checkpoint(
-            iteration=iteration,
-            pool=pool,
-            anchor_manager=anchor_manager,
+        """Record the pool and anchors as of `iteration`.
+
+        Usually appends only what changed since the previous call (members
+        added and removed, changed ratings, anchors) to `journal.jsonl`. A
+        full snapshot replaces `latest.json` and restarts the journal on this
+        process's first save, when `keep` is set (also kept as
+        `itNNNNNN.json`), and once `snapshot_interval` iterations have passed
+        since the last one. With `binary`, each snapshot also writes
+        `latest.npz` for fast resume.
+        """
+        members = self._checkpoint_members(pool)
+        anchors = self._checkpoint_anchors(anchor_manager)
+        snapshot_due = (
+            self._saved_members is None
+            or keep
+            or iteration - self._snapshot_iteration >= snapshot_interval
         )
-        latest = self.checkpoints_dir / "latest.json"
-        latest.write_text(_json_dump(data), encoding="utf-8")
-        if keep:
-            path = self.checkpoints_dir / f"it{int(iteration):06d}.json"
-            path.write_text(_json_dump(data), encoding="utf-8")
+        if snapshot_due:
+            if binary:
+                # Written before the JSON snapshot; see `_read_binary_snapshot`.
+                self._write_binary_snapshot(
+                    iteration=iteration, pool=pool, anchors=anchors
+                )
+            data = {
+                "schema": SCHEMA_VERSION,
+                "saved_at": _utc_now_iso(),
+                "next_iteration": int(iteration),
+                "population": {
+                    "max_size": int(pool.max_size),
+                    "members": list(members.values()),
+                },
+                "anchors": anchors,
+            }
+            text = json.dumps(data, ensure_ascii=False) + "\n"
+            _replace_text(self.latest_checkpoint_path(), text)
+            if keep:
+                path = self.checkpoints_dir / f"it{int(iteration):06d}.json"
+                path.write_text(text, encoding="utf-8")
+            # Entries up to this snapshot are now redundant (the loader skips
+            # them anyway if we crash before the truncate). The header names
+            # the snapshot the journal continues from.
+            with self._lock:
+                self.journal_path.write_text(
+                    json.dumps({"snapshot": int(iteration)}) + "\n", encoding="utf-8"
+                )
+            self._snapshot_iteration = int(iteration)
+        else:
+            saved = self._saved_members or {}
+            delta: dict[str, Any] = {
+                "next_iteration": int(iteration),
+                "max_size": int(pool.max_size),
+                "removed": [tid for tid in saved if tid not in members],
+                "added": [rec for tid, rec in members.items() if tid not in saved],
+                "ratings": {
+                    tid: rec["ratings"]
+                    for tid, rec in members.items()
+                    if tid in saved and saved[tid]["ratings"] != rec["ratings"]
+                },
+            }
+            if anchors != self._saved_anchors:
+                delta["anchors"] = anchors
+            self._append_jsonl(self.journal_path, delta)
+        self._saved_members = members
+        self._saved_anchors = anchors
+
+    def read_checkpoint(self, checkpoint_path: Path | None = None) -> dict[str, Any]:
+        """Raw checkpoint data: `checkpoint_path`, or the latest snapshot with
+        the journal replayed onto it. `latest.npz` names the same state, so it
+        reads as the latest snapshot too."""
+        latest = self.latest_checkpoint_path()
+        path = checkpoint_path or latest
+        if path.resolve() == self.binary_checkpoint_path.resolve():
+            path = latest
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        if path.resolve() == latest.resolve():
+            raw = self._replay_journal(raw)
+        return raw
 
     def load_checkpoint(
         self,
@@ -272,9 +459,13 @@ class RunStore:
         embed: Callable[[str], np.ndarray],
         pool_factory: Callable[[], CrowdedPool],
         anchor_factory: Callable[[Config], AnchorManager | None],
+        embed_many: Callable[[Sequence[str]], np.ndarray] | None = None,
     ) -> LoadedState:
-        checkpoint_path = checkpoint_path or (self.checkpoints_dir / "latest.json")
-        raw = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        binary = self._read_binary_snapshot(checkpoint_path)
+        if binary is not None:
+            raw = binary.raw
+        else:
+            raw = self.read_checkpoint(checkpoint_path)
 
         if int(raw.get("schema", 0)) != SCHEMA_VERSION:
             raise ValueError("Unsupported checkpoint schema.")
@@ -283,20 +474,36 @@ class RunStore:
 
         pool = pool_factory()
         members = raw.get("population", {}).get("members", [])
+        texts: list[str] = []
+        vectors: list[np.ndarray | None] = []
+        missing: list[int] = []
+        for i, member in enumerate(members):
+            row = member.get("row") if binary is not None else None
+            if row is None:
+                texts.append(self.get_text(str(member["text_id"])))
+                vectors.append(None)
+                missing.append(i)
+            else:
+                texts.append(binary.text(row))
+                vectors.append(binary.embeddings[row])
+        if missing:
+            embedded = (embed_many or embed_each(embed))([texts[i] for i in missing])
+            for i, vector in zip(missing, embedded):
+                vectors[i] = vector
         elites: list[Elite] = []
-        for elite_data in members:
-            text = self.get_text(str(elite_data["text_id"]))
+        for elite_data, text, vector in zip(members, texts, vectors):
             elite = Elite(
                 text=text,
-                embedding=embed(text),
+                embedding=vector,
                 ratings={
                     metric: _rating_from_dict(rdict)
                     for metric, rdict in elite_data["ratings"].items()
                 },
                 age=int(elite_data["age"]),
+                text_id=str(elite_data["text_id"]),
             )
             elites.append(elite)
-        pool.add_many(elites)
+        pool.restore(elites)
 
         anchors = None
         anchors_data = raw.get("anchors")
@@ -316,6 +523,7 @@ class RunStore:
                             },
                             age=int(a["age"]),
                             label=str(a.get("label", "")),
+                            text_id=str(a["text_id"]),
                         )
                     )
                 pool_obj.load(items)
@@ -334,68 +542,224 @@ class RunStore:
             "embeddings_model": cfg.embeddings.model,
         }
 
-    def _serialize_checkpoint(
+    def _checkpoint_members(self, pool: CrowdedPool) -> dict[str, dict[str, Any]]:
+        # Texts are only hashed and written the first time they are saved.
+        members: dict[str, dict[str, Any]] = {}
+        for elite in pool.iter_elites():
+            text_id = self.text_id_of(elite)
+            members[text_id] = {
+                "text_id": text_id,
+                "ratings": {
+                    metric: _rating_to_dict(rating)
+                    for metric, rating in elite.ratings.items()
+                },
+                "age": int(elite.age),
+            }
+        return members
+
+    def _checkpoint_anchors(
+        self, anchor_manager: AnchorManager | None
+    ) -> dict[str, Any] | None:
+        if anchor_manager is None:
+            return None
+        anchor_pool = anchor_manager.pool
+        items_out: list[dict[str, Any]] = []
+        for anchor in anchor_pool.iter_anchors():
+            items_out.append(
+                {
+                    "text_id": self.text_id_of(anchor),
+                    "ratings": {
+                        metric: _rating_to_dict(rating)
+                        for metric, rating in anchor.ratings.items()
+                    },
+                    "age": int(anchor.age),
+                    "label": anchor.label,
+                }
+            )
+        return {
+            "seed_text_id": (
+                self.text_id_of(anchor_pool.seed_anchor)
+                if anchor_pool.seed_anchor
+                else None
+            ),
+            "items": items_out,
+        }
+
+    def _write_binary_snapshot(
         self,
         *,
         iteration: int,
         pool: CrowdedPool,
-        anchor_manager: AnchorManager | None,
-    ) -> dict[str, Any]:
-        members_out: list[dict[str, Any]] = []
-        for elite in pool.iter_elites():
-            text_id = self.put_text(elite.text)
-            members_out.append(
+        anchors: dict[str, Any] | None,
+    ) -> None:
+        elites = list(pool.iter_elites())
+        metrics = list(dict.fromkeys(m for elite in elites for m in elite.ratings))
+        mu, sigma = pool.rating_matrix(metrics)
+        encoded = [elite.text.encode("utf-8") for elite in elites]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(b) for b in encoded], dtype=np.int64)
+        arrays = {
+            "schema": np.array(SCHEMA_VERSION),
+            "next_iteration": np.array(int(iteration)),
+            "max_size": np.array(int(pool.max_size)),
+            "text_ids": np.array(
+                [self.text_id_of(elite) for elite in elites],
+                dtype="U64",
+            ),
+            "embeddings": pool.embedding_matrix(),
+            "metrics": np.array(metrics, dtype=str),
+            "mu": mu,
+            "sigma": sigma,
+            "ages": np.array([int(elite.age) for elite in elites], dtype=np.int64),
+            "text_blob": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+            "text_offsets": offsets,
+            "anchors": np.array(json.dumps(anchors, ensure_ascii=False)),
+        }
+        path = self.binary_checkpoint_path
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, path)
+
+    def _read_binary_snapshot(
+        self, checkpoint_path: Path | None
+    ) -> _BinarySnapshot | None:
+        """The latest state from `latest.npz` plus the journal, if usable.
+
+        The .npz is written before `latest.json` at each snapshot, so it is
+        usable whenever it is at least as new as the snapshot the journal
+        continues from; otherwise (an older run, binary checkpoints turned
+        off, a crash mid-write) the JSON checkpoint is read instead.
+        """
+        path = self.binary_checkpoint_path
+        if checkpoint_path is not None and checkpoint_path.resolve() not in {
+            path.resolve(),
+            self.latest_checkpoint_path().resolve(),
+        }:
+            return None
+        if not path.exists():
+            return None
+        try:
+            with self.journal_path.open("r", encoding="utf-8") as f:
+                base = int(json.loads(f.readline())["snapshot"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        with np.load(path, allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files}
+        next_iteration = int(arrays["next_iteration"])
+        if next_iteration < base:
+            return None
+
+        metrics = [str(m) for m in arrays["metrics"]]
+        mu, sigma = arrays["mu"], arrays["sigma"]
+        present = ~np.isnan(mu)
+        members: list[dict[str, Any]] = []
+        for row, (text_id, age) in enumerate(
+            zip(arrays["text_ids"].tolist(), arrays["ages"].tolist())
+        ):
+            members.append(
                 {
                     "text_id": text_id,
                     "ratings": {
-                        metric: _rating_to_dict(rating)
-                        for metric, rating in elite.ratings.items()
+                        metric: {
+                            "mu": float(mu[row, col]),
+                            "sigma": float(sigma[row, col]),
+                        }
+                        for col, metric in enumerate(metrics)
+                        if present[row, col]
                     },
-                    "age": int(elite.age),
+                    "age": age,
+                    "row": row,
                 }
             )
-
-        anchors_out: dict[str, Any] | None = None
-        if anchor_manager is not None:
-            anchor_pool = anchor_manager.pool
-            items_out: list[dict[str, Any]] = []
-            for anchor in anchor_pool.iter_anchors():
-                text_id = self.put_text(anchor.text)
-                items_out.append(
-                    {
-                        "text_id": text_id,
-                        "ratings": {
-                            metric: _rating_to_dict(rating)
-                            for metric, rating in anchor.ratings.items()
-                        },
-                        "age": int(anchor.age),
-                        "label": anchor.label,
-                    }
-                )
-            anchors_out = {
-                "seed_text_id": (
-                    self.put_text(anchor_pool.seed_anchor.text)
-                    if anchor_pool.seed_anchor
-                    else None
-                ),
-                "items": items_out,
-            }
-
-        return {
-            "schema": SCHEMA_VERSION,
-            "saved_at": _utc_now_iso(),
-            "next_iteration": int(iteration),
-            "population": {
-                "max_size": int(pool.max_size),
-                "members": members_out,
-            },
-            "anchors": anchors_out,
+        raw = {
+            "schema": int(arrays["schema"]),
+            "next_iteration": next_iteration,
+            "population": {"max_size": int(arrays["max_size"]), "members": members},
+            "anchors": json.loads(str(arrays["anchors"])),
         }
+        return _BinarySnapshot(
+            raw=self._replay_journal(raw),
+            embeddings=arrays["embeddings"],
+            text_blob=arrays["text_blob"].tobytes(),
+            text_offsets=arrays["text_offsets"],
+        )
+
+    def _replay_journal(self, raw: dict[str, Any]) -> dict[str, Any]:
+        if not self.journal_path.exists():
+            return raw
+        next_iteration = int(raw.get("next_iteration", 0))
+        population = raw.setdefault("population", {})
+        members = {str(m["text_id"]): m for m in population.get("members", [])}
+        with self.journal_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    delta = json.loads(line)
+                except ValueError:
+                    break  # torn final append
+                if "snapshot" in delta:
+                    continue
+                if int(delta["next_iteration"]) <= next_iteration:
+                    continue
+                for text_id in delta.get("removed", []):
+                    members.pop(text_id, None)
+                for member in delta.get("added", []):
+                    members[str(member["text_id"])] = member
+                for text_id, ratings in delta.get("ratings", {}).items():
+                    if text_id in members:
+                        members[text_id] = {**members[text_id], "ratings": ratings}
+                if "anchors" in delta:
+                    raw["anchors"] = delta["anchors"]
+                if "max_size" in delta:
+                    population["max_size"] = delta["max_size"]
+                next_iteration = int(delta["next_iteration"])
+        population["members"] = list(members.values())
+        raw["next_iteration"] = next_iteration
+        return raw
 
     def _write_text(self, path: Path, text: str) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(text, encoding="utf-8")
 
+    def flush(self) -> None:
+        """Wait until every queued event, stats row and LLM call is written."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        """Flush and stop the background writer and release the text pack."""
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+        self.text_store.close()
+
+    def writer_stats(self) -> dict[str, int] | None:
+        return self._writer.stats() if self._writer is not None else None
+
+    def _record(self, path: Path, payload: dict[str, Any]) -> None:
+        self._get_writer().write(path, payload)
+
+    def _get_writer(self) -> JsonlWriter:
+        writer = self._writer
+        if writer is None:
+            with self._lock:
+                if self._writer is None:
+                    run_cfg = self._run_cfg
+                    if run_cfg is None:
+                        # Resumed via `open`: use the settings the run was made with.
+                        try:
+                            run_cfg = self.load_config().run
+                        except (OSError, ValueError):
+                            run_cfg = RunConfig()
+                    self._writer = JsonlWriter(
+                        max_queue=run_cfg.record_queue_size,
+                        flush_interval_s=run_cfg.record_flush_interval_s,
+                        fsync=run_cfg.record_fsync,
+                    )
+                writer = self._writer
+        return writer
+
     def _append_jsonl(self, path: Path, obj: Any) -> None:
         line = json.dumps(obj, ensure_ascii=False) + "\n"
         with self._lock:
@@ -472,11 +472,10 @@ class RunViewer(Screen[None]):
         if self.state is None:
             return
         store = self.state.store
-        cp_path = store.latest_checkpoint_path()
         stats_path = store.run_dir / "stats.jsonl"
         events_path = store.run_dir / "events.jsonl"
 
-        cp_mtime = cp_path.stat().st_mtime if cp_path.exists() else 0.0
+        cp_mtime = store.checkpoint_mtime()
         stats_mtime = stats_path.stat().st_mtime if stats_path.exists() else 0.0
         events_mtime = events_path.stat().st_mtime if events_path.exists() else 0.0
 
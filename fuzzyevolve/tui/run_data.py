@@ -228,8 +228,8 @@ def load_run_state(run_dir: Path) -> RunState:
     cfg = store.load_config()
 
     cp_path = store.latest_checkpoint_path()
-    checkpoint_mtime = cp_path.stat().st_mtime if cp_path.exists() else 0.0
-    checkpoint = _read_json(cp_path) if cp_path.exists() else {}
+    checkpoint_mtime = store.checkpoint_mtime()
+    checkpoint = store.read_checkpoint() if cp_path.exists() else {}
     iteration = int(checkpoint.get("next_iteration", 0))
 
     stats_path = store.run_dir / "stats.jsonl"
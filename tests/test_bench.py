@@ -0,0 +1,56 @@
+"""Smoke tests for the `fuzzyevolve bench` suite."""
+
+from __future__ import annotations
+
+import json
+
+from typer.testing import CliRunner
+
+import fuzzyevolve.cli as cli
+from fuzzyevolve.bench import _sweep, run_benchmarks
+
+
+def test_quick_micro_suite_reports_every_case():
+    results = run_benchmarks(micro=True, macro=False, quick=True, repeat=1)
+
+    names = {entry["name"] for entry in results["results"]}
+    assert names == {
+        "pool.add_many",
+        "nondominated_indices",
+        "nondominated_fronts",
+        "rating.apply_ranking",
+        "embeddings.embed",
+        "embeddings.embed_many",
+        "run_store.save_checkpoint",
+        "run_store.load_checkpoint",
+        "tui.load_run_state",
+    }
+    for entry in results["results"]:
+        if "skipped" in entry:
+            continue
+        assert entry["runs"] == 1
+        assert 0 <= entry["min_s"] <= entry["median_s"]
+    json.dumps(results)
+
+
+def test_sweep_skips_larger_cases_over_budget():
+    def bench(*, seed, n):
+        return lambda: None
+
+    out = _sweep("noop", [{"n": 1}, {"n": 2}], bench, repeat=1, budget_s=-1.0)
+    assert "median_s" in out[0]
+    assert out[1]["skipped"] == "over budget"
+
+
+def test_bench_command_writes_macro_json(tmp_path):
+    output = tmp_path / "bench.json"
+    result = CliRunner().invoke(
+        cli.app,
+        ["bench", "--suite", "macro", "--quick", "--repeat", "1", "-o", str(output)],
+    )
+    assert result.exit_code == 0, result.output
+
+    data = json.loads(output.read_text(encoding="utf-8"))
+    runs = [e for e in data["results"] if e["name"] == "engine.run"]
+    assert [e["params"]["concurrency"] for e in runs] == ["threads", "asyncio"]
+    assert all(e["iterations_per_s"] > 0 for e in runs)
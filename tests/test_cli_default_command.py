@@ -70,3 +70,33 @@ def test_tui_subcommand_not_rewritten(monkeypatch):
     assert result.exit_code == 0
     assert called.run is False
     assert called.tui is True
+
+
+def test_replay_command_not_rewritten(monkeypatch, tmp_path):
+    called = {}
+
+    def _fake_execute_run(**kwargs):
+        called.update(kwargs)
+
+    monkeypatch.setattr(cli, "_execute_run", _fake_execute_run)
+
+    runner = CliRunner()
+    result = runner.invoke(cli.app, ["replay", str(tmp_path)])
+    assert result.exit_code == 0
+    assert called["replay"] == tmp_path
+    assert called["store"] is False
+
+
+def test_cli_import_skips_llm_and_embedding_stacks():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, fuzzyevolve.cli; "
+        "heavy = {'pydantic_ai', 'sentence_transformers', 'textual', 'torch'}; "
+        "print(sorted(heavy & set(sys.modules)))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
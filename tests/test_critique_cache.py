@@ -0,0 +1,111 @@
+"""Tests for the critique cache and caching critic wrapper."""
+
+import asyncio
+
+import numpy as np
+import trueskill as ts
+
+from fuzzyevolve.core.critique import Critique
+from fuzzyevolve.core.critique_cache import (
+    CachedCritic,
+    CritiqueCache,
+    rating_signature,
+)
+from fuzzyevolve.core.models import Elite
+
+
+def _elite(text: str, mu: float = 25.0, sigma: float = 8.0) -> Elite:
+    return Elite(
+        text=text,
+        embedding=np.array([1.0, 0.0]),
+        ratings={"m": ts.Rating(mu=mu, sigma=sigma)},
+        age=0,
+    )
+
+
+class CountingCritic:
+    def __init__(self, result: Critique | None = Critique(summary="ok")) -> None:
+        self.calls = 0
+        self.result = result
+
+    def critique(self, *, parent):
+        self.calls += 1
+        return self.result
+
+
+def test_rating_signature_buckets_small_drift():
+    a = rating_signature(
+        {"m": ts.Rating(25.2, 8.1)}, metrics=["m"], mu_step=1.0, sigma_step=1.0
+    )
+    b = rating_signature(
+        {"m": ts.Rating(24.9, 7.9)}, metrics=["m"], mu_step=1.0, sigma_step=1.0
+    )
+    c = rating_signature(
+        {"m": ts.Rating(27.0, 8.0)}, metrics=["m"], mu_step=1.0, sigma_step=1.0
+    )
+    ignored = rating_signature(
+        {"m": ts.Rating(27.0, 8.0)}, metrics=["m"], mu_step=0.0, sigma_step=0.0
+    )
+    assert a == b
+    assert a != c
+    assert ignored == "m:*:*"
+
+
+def test_cache_lru_eviction_and_ttl():
+    now = [0.0]
+    cache = CritiqueCache(max_entries=2, ttl_s=10.0, clock=lambda: now[0])
+    cache.put("a", Critique(summary="a"))
+    cache.put("b", Critique(summary="b"))
+    assert cache.get("a").summary == "a"  # refreshes "a"
+    cache.put("c", Critique(summary="c"))  # evicts "b"
+
+    assert cache.get("b") is None
+    assert cache.get("c").summary == "c"
+
+    now[0] = 11.0
+    assert cache.get("a") is None
+    assert cache.stats() == {"entries": 1, "hits": 2, "misses": 2, "evictions": 1}
+
+
+def test_cache_persists_and_reloads(tmp_path):
+    path = tmp_path / "critique_cache.jsonl"
+    cache = CritiqueCache(max_entries=8, path=path)
+    cache.put("k", Critique(summary="s", routes=("r1", "r2")))
+
+    reloaded = CritiqueCache(max_entries=8, path=path)
+    assert reloaded.get("k") == Critique(summary="s", routes=("r1", "r2"))
+
+
+def test_cached_critic_reuses_critique_for_same_bucket():
+    inner = CountingCritic()
+    critic = CachedCritic(
+        inner,
+        cache=CritiqueCache(max_entries=8),
+        metrics=["m"],
+        mu_step=1.0,
+        sigma_step=1.0,
+    )
+
+    critic.critique(parent=_elite("p", mu=25.1))
+    critic.critique(parent=_elite("p", mu=24.9))
+    assert inner.calls == 1
+
+    critic.critique(parent=_elite("p", mu=30.0))
+    critic.critique(parent=_elite("q", mu=25.0))
+    assert inner.calls == 3
+    assert critic.cache_stats()["hits"] == 1
+
+
+def test_cached_critic_does_not_cache_failures():
+    inner = CountingCritic(result=None)
+    critic = CachedCritic(
+        inner,
+        cache=CritiqueCache(max_entries=8),
+        metrics=["m"],
+        mu_step=1.0,
+        sigma_step=1.0,
+    )
+
+    assert asyncio.run(critic.acritique(parent=_elite("p"))) is None
+    assert asyncio.run(critic.acritique(parent=_elite("p"))) is None
+    assert inner.calls == 2
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import random
+import threading
+import time
 from collections.abc import Sequence
 from unittest.mock import Mock
 
@@ -10,8 +13,10 @@ import numpy as np
 import pytest
 
 from fuzzyevolve.config import Config
+from fuzzyevolve.core.critique import Critique
 from fuzzyevolve.core.engine import EvolutionEngine
 from fuzzyevolve.core.models import Elite, MutationCandidate
+from fuzzyevolve.core.mutation import OperatorMutator, OperatorSpec
 from fuzzyevolve.core.pool import CrowdedPool
 from fuzzyevolve.core.ratings import BattleRanking, RatingSystem
 
@@ -209,3 +214,354 @@ class TestEvolutionEngine:
 
         battle = ranker.rank.call_args.kwargs["battle"]
         assert {p.text for p in battle.participants} == {"seed", "child", "other"}
+
+    def test_arun_awaits_async_ports(self):
+        cfg = Config()
+        cfg.run.iterations = 2
+        cfg.population.size = 10
+        cfg.metrics.names = ["m1"]
+        cfg.judging.opponent.kind = "none"
+
+        calls: list[str] = []
+
+        class AsyncCritic:
+            async def acritique(self, *, parent):
+                calls.append("critique")
+                return Critique(summary="ok")
+
+        class AsyncMutator:
+            def __init__(self) -> None:
+                self.count = 0
+
+            async def apropose(self, *, parent, critique, max_candidates):
+                calls.append("mutate")
+                assert critique is not None
+                self.count += 1
+                return [MutationCandidate(text=f"child{self.count}")]
+
+        class AsyncRanker:
+            async def arank(self, *, metrics, battle, metric_descriptions=None):
+                calls.append("rank")
+                return rank_parent_best(metrics, len(battle.participants))
+
+        engine = make_engine(
+            cfg,
+            mutator=AsyncMutator(),
+            ranker=AsyncRanker(),
+            selector=lambda p: p.random_elite(),
+        )
+        engine.critic = AsyncCritic()
+        result = asyncio.run(engine.arun("seed"))
+
+        assert calls == ["critique", "mutate", "rank"] * 2
+        assert {e.text for e in engine.pool.iter_elites()} == {
+            "seed",
+            "child1",
+            "child2",
+        }
+        assert result.best_elite in engine.pool.iter_elites()
+
+    def test_arun_falls_back_to_sync_ports(self):
+        cfg = Config()
+        cfg.run.iterations = 1
+        cfg.population.size = 10
+        cfg.metrics.names = ["m1"]
+        cfg.judging.opponent.kind = "none"
+
+        mutator = Mock(spec=["propose"])
+        mutator.propose = Mock(return_value=[MutationCandidate(text="child")])
+        ranker = Mock(spec=["rank"])
+        ranker.rank = Mock(
+            side_effect=lambda **kw: rank_parent_best(
+                kw["metrics"], len(kw["battle"].participants)
+            )
+        )
+
+        engine = make_engine(
+            cfg, mutator=mutator, ranker=ranker, selector=lambda p: p.random_elite()
+        )
+        asyncio.run(engine.arun("seed"))
+
+        assert ranker.rank.call_count == 1
+        assert len(engine.pool) == 2
+
+    def test_pipelined_arun_is_deterministic_and_overlaps(self):
+        def run_once(latency_seed: int) -> tuple[list[tuple[str, ...]], set[str], int]:
+            cfg = Config()
+            cfg.run.iterations = 8
+            cfg.run.concurrency = "asyncio"
+            cfg.run.pipeline_depth = 4
+            cfg.population.size = 4
+            cfg.metrics.names = ["m1"]
+            cfg.judging.opponent.kind = "none"
+
+            latency = random.Random(latency_seed)
+            battles: list[tuple[str, ...]] = []
+            active = 0
+            peak = 0
+
+            async def wait() -> None:
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(latency.random() * 0.01)
+                active -= 1
+
+            class AsyncCritic:
+                async def acritique(self, *, parent):
+                    await wait()
+                    return Critique(summary=parent.text)
+
+            class AsyncMutator:
+                def __init__(self) -> None:
+                    self.count = 0
+
+                async def apropose(self, *, parent, critique, max_candidates):
+                    self.count += 1
+                    text = f"{parent.text}>{self.count}"
+                    await wait()
+                    return [MutationCandidate(text=text)]
+
+            class AsyncRanker:
+                async def arank(self, *, metrics, battle, metric_descriptions=None):
+                    battles.append(tuple(p.text for p in battle.participants))
+                    await wait()
+                    return rank_parent_best(metrics, len(battle.participants))
+
+            engine = make_engine(
+                cfg,
+                mutator=AsyncMutator(),
+                ranker=AsyncRanker(),
+                selector=lambda p: p.random_elite(),
+            )
+            engine.critic = AsyncCritic()
+            asyncio.run(engine.arun("seed"))
+            return battles, {e.text for e in engine.pool.iter_elites()}, peak
+
+        battles_a, pool_a, peak_a = run_once(1)
+        battles_b, pool_b, _peak_b = run_once(2)
+
+        assert len(battles_a) == 8
+        assert battles_a == battles_b
+        assert pool_a == pool_b
+        assert peak_a > 1
+
+    def test_pipelined_early_embeddings_never_overlap(self):
+        cfg = Config()
+        cfg.run.iterations = 6
+        cfg.run.concurrency = "asyncio"
+        cfg.run.pipeline_depth = 3
+        cfg.population.size = 4
+        cfg.metrics.names = ["m1"]
+        cfg.judging.opponent.kind = "none"
+
+        inside = 0
+        overlaps = 0
+        guard = threading.Lock()
+
+        def embed_many(texts):
+            nonlocal inside, overlaps
+            with guard:
+                inside += 1
+                overlaps += inside > 1
+            time.sleep(0.002)  # widen the window a second caller would hit
+            with guard:
+                inside -= 1
+            return np.stack([embed(t) for t in texts])
+
+        class AsyncMutator:
+            def __init__(self) -> None:
+                self.count = 0
+
+            async def apropose(
+                self, *, parent, critique, max_candidates, on_candidates=None
+            ):
+                out = []
+                for _ in range(3):
+                    self.count += 1
+                    batch = [MutationCandidate(text=f"c{self.count}")]
+                    on_candidates(batch)
+                    out.extend(batch)
+                    await asyncio.sleep(0)
+                return out
+
+        class AsyncRanker:
+            async def arank(self, *, metrics, battle, metric_descriptions=None):
+                await asyncio.sleep(0.001)
+                return rank_parent_best(metrics, len(battle.participants))
+
+        engine = make_engine(
+            cfg,
+            mutator=AsyncMutator(),
+            ranker=AsyncRanker(),
+            selector=lambda p: p.random_elite(),
+        )
+        engine.embed_many = embed_many
+        asyncio.run(engine.arun("seed"))
+
+        assert overlaps == 0
+
+    def test_pipeline_depth_requires_asyncio(self):
+        with pytest.raises(ValueError, match="pipeline_depth"):
+            Config.model_validate({"run": {"pipeline_depth": 2}})
+
+    def test_critique_prefetch_overlaps_ranker(self):
+        cfg = Config()
+        cfg.run.iterations = 3
+        cfg.population.size = 10
+        cfg.metrics.names = ["m1"]
+        cfg.judging.opponent.kind = "none"
+        cfg.critic.prefetch = True
+
+        prefetch_started = threading.Event()
+        critiqued: list[str] = []
+
+        critic = Mock(spec=["critique"])
+
+        def critique(*, parent):
+            critiqued.append(parent.text)
+            if len(critiqued) > 1:
+                prefetch_started.set()
+            return Critique(summary=f"{parent.text}@{parent.ratings['m1'].mu}")
+
+        critic.critique = Mock(side_effect=critique)
+
+        used: list[tuple[str, str]] = []
+
+        def propose(*, parent, critique, **kw):
+            used.append((critique.summary, f"{parent.text}@{parent.ratings['m1'].mu}"))
+            return [MutationCandidate(text=f"child{len(used)}")]
+
+        mutator = Mock()
+        mutator.propose = Mock(side_effect=propose)
+
+        def rank(**kw):
+            if ranker.rank.call_count < cfg.run.iterations:
+                # The next parent's critique must start before this battle ends.
+                assert prefetch_started.wait(timeout=5.0)
+                prefetch_started.clear()
+            return rank_parent_best(kw["metrics"], len(kw["battle"].participants))
+
+        ranker = Mock()
+        ranker.rank = Mock(side_effect=rank)
+
+        engine = make_engine(
+            cfg, mutator=mutator, ranker=ranker, selector=lambda p: p.random_elite()
+        )
+        engine.critic = critic
+        engine.run("seed")
+
+        assert ranker.rank.call_count == 3
+        # Every step mutates with a critique of its parent's current ratings:
+        # prefetches of parents that were just judged are redone, not reused.
+        assert len(used) == 3
+        assert all(summary == current for summary, current in used)
+        assert critic.critique.call_count >= 3
+
+    def test_prefetched_parent_discarded_when_pruned(self):
+        cfg = Config()
+        cfg.run.iterations = 2
+        cfg.population.size = 1
+        cfg.metrics.names = ["m1"]
+        cfg.judging.opponent.kind = "none"
+        cfg.critic.prefetch = True
+
+        class AsyncCritic:
+            def __init__(self) -> None:
+                self.parents: list[str] = []
+
+            async def acritique(self, *, parent):
+                self.parents.append(parent.text)
+                return Critique(summary=parent.text)
+
+        class AsyncMutator:
+            async def apropose(self, *, parent, critique, max_candidates):
+                assert critique.summary == parent.text
+                return [MutationCandidate(text=f"{parent.text}+")]
+
+        class AsyncRanker:
+            async def arank(self, *, metrics, battle, metric_descriptions=None):
+                await asyncio.sleep(0)
+                # Child beats parent, so the parent picked for prefetch is pruned.
+                n = len(battle.participants)
+                tiers = [[i] for i in range(n - 1, -1, -1)]
+                return BattleRanking(tiers_by_metric={m: tiers for m in metrics})
+
+        critic = AsyncCritic()
+        engine = make_engine(
+            cfg,
+            mutator=AsyncMutator(),
+            ranker=AsyncRanker(),
+            selector=lambda p: p.random_elite(),
+        )
+        engine.critic = critic
+        asyncio.run(engine.arun("seed"))
+
+        assert critic.parents == ["seed", "seed", "seed+"]
+        assert {e.text for e in engine.pool.iter_elites()} == {"seed++"}
+
+    @pytest.mark.parametrize("concurrency", ["threads", "asyncio"])
+    def test_children_are_embedded_in_batches_as_jobs_finish(self, concurrency):
+        cfg = Config()
+        cfg.run.iterations = 1
+        cfg.population.size = 10
+        cfg.metrics.names = ["m1"]
+        cfg.judging.opponent.kind = "none"
+
+        class Operator:
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+            def propose(self, *, parent, partners=None, critique=None, focus=None):
+                return [f"{self.name}-a", f"{self.name}-b"]
+
+        calls: list[list[str]] = []
+
+        def embed_many(texts):
+            calls.append(list(texts))
+            return np.stack([embed(t) for t in texts])
+
+        ranker = Mock()
+        ranker.rank = Mock(
+            side_effect=lambda *, metrics, battle, metric_descriptions=None: (
+                rank_parent_best(metrics, len(battle.participants))
+            )
+        )
+        engine = make_engine(
+            cfg, mutator=Mock(), ranker=ranker, selector=lambda p: p.random_elite()
+        )
+        engine.embed = Mock(side_effect=AssertionError("embed() per text"))
+        engine.embed_many = embed_many
+        engine.mutator = OperatorMutator(
+            pool=engine.pool,
+            operators={"x": Operator("x"), "y": Operator("y")},
+            specs=[
+                OperatorSpec(
+                    name="x",
+                    role="exploit",
+                    min_jobs=1,
+                    weight=1.0,
+                    uncertainty_scale=1.0,
+                ),
+                OperatorSpec(
+                    name="y",
+                    role="explore",
+                    min_jobs=1,
+                    weight=1.0,
+                    uncertainty_scale=1.0,
+                ),
+            ],
+            jobs_per_iteration=2,
+            rng=random.Random(0),
+        )
+
+        if concurrency == "threads":
+            engine.run("seed")
+        else:
+            asyncio.run(engine.arun("seed"))
+
+        # Seed, then one batch per finished job; nothing left for battle time.
+        assert calls[0] == ["seed"]
+        assert sorted(map(sorted, calls[1:])) == [["x-a", "x-b"], ["y-a", "y-b"]]
+        battle = ranker.rank.call_args.kwargs["battle"]
+        assert len(battle.participants) == 5
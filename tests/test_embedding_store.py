@@ -0,0 +1,105 @@
+"""Tests for the persistent, memory-mapped embedding store."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from fuzzyevolve.core.embedding_store import (
+    EmbeddingStore,
+    StoredEmbedder,
+    text_id,
+)
+from fuzzyevolve.run_store import RunStore
+
+
+def _vec(seed: int, dim: int = 4) -> np.ndarray:
+    v = np.random.default_rng(seed).standard_normal(dim).astype(np.float32)
+    return v / np.linalg.norm(v)
+
+
+def test_vectors_survive_reopen(tmp_path):
+    store = EmbeddingStore(tmp_path / "e", model="m", dim=4)
+    store.put_many(["a", "b"], np.stack([_vec(0), _vec(1)]))
+    store.put_many(["b", "c"], np.stack([_vec(9), _vec(2)]))  # b is kept as-is
+
+    reopened = EmbeddingStore(tmp_path / "e", model="m", dim=4)
+    assert len(reopened) == 3
+    vectors, found = reopened.get_many(["c", "missing", "a", "b"])
+    assert found.tolist() == [True, False, True, True]
+    np.testing.assert_array_equal(vectors[0], _vec(2))
+    np.testing.assert_array_equal(vectors[1], np.zeros(4, dtype=np.float32))
+    np.testing.assert_array_equal(vectors[3], _vec(1))
+
+
+def test_torn_append_is_dropped_on_open(tmp_path):
+    store = EmbeddingStore(tmp_path, model="m", dim=4)
+    store.put_many(["a"], _vec(0)[None, :])
+    # Crash after the vector write but before its id line was committed.
+    with store.vectors_path.open("ab") as f:
+        f.write(_vec(1).tobytes())
+    with store.ids_path.open("a", encoding="utf-8") as f:
+        f.write("b-partial")
+
+    reopened = EmbeddingStore(tmp_path, model="m", dim=4)
+    assert len(reopened) == 1
+    reopened.put_many(["c"], _vec(2)[None, :])
+    vectors, found = EmbeddingStore(tmp_path, model="m", dim=4).get_many(["a", "c"])
+    assert found.all()
+    np.testing.assert_array_equal(vectors[1], _vec(2))
+
+
+def test_store_rejects_other_model(tmp_path):
+    EmbeddingStore(tmp_path, model="m", dim=4)
+    with pytest.raises(ValueError):
+        EmbeddingStore(tmp_path, model="other", dim=4)
+
+
+def test_stored_embedder_only_encodes_misses(tmp_path):
+    calls: list[list[str]] = []
+
+    def embed_many(texts):
+        calls.append(list(texts))
+        return np.stack([_vec(len(t)) for t in texts])
+
+    run = RunStore(tmp_path / "run")
+    embedder = StoredEmbedder(run.embedding_store(model="m/x", dim=4), embed_many)
+    first = embedder.embed_many(["aa", "bbb", "aa"])
+    assert calls == [["aa", "bbb"]]
+    np.testing.assert_array_equal(first[0], first[2])
+
+    # A fresh process (new store object) answers from disk.
+    again = StoredEmbedder(run.embedding_store(model="m/x", dim=4), embed_many)
+    np.testing.assert_array_equal(again.embed("bbb"), first[1])
+    assert calls == [["aa", "bbb"]]
+    assert text_id("aa") in again.store
+
+    # Read-only stores serve hits but never grow.
+    readonly = StoredEmbedder(
+        run.embedding_store(model="m/x", dim=4, read_only=True), embed_many
+    )
+    readonly.embed_many(["cccc"])
+    assert len(run.embedding_store(model="m/x", dim=4)) == 2
+
+
+def test_resume_reads_saved_vectors_without_the_model(tmp_path):
+    from fuzzyevolve.builder import build_embedder
+    from fuzzyevolve.config import Config
+
+    cfg = Config()
+    run = RunStore(tmp_path / "run")
+    model = cfg.embeddings.model
+    run.embedding_store(model=model, dim=4).put_many([text_id("seed")], _vec(3)[None])
+    assert run.stored_embedding_dim(model) == 4
+    assert run.stored_embedding_dim("other") is None
+
+    class StillLoading:
+        @property
+        def dim(self):
+            raise AssertionError("model should not be needed")
+
+        def embed_many(self, texts):
+            raise AssertionError("model should not be needed")
+
+    embedder = build_embedder(cfg, StillLoading(), run)
+    np.testing.assert_array_equal(embedder.embed("seed"), _vec(3))
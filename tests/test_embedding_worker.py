@@ -0,0 +1,134 @@
+"""Tests for the shared embedding worker and its socket client."""
+
+from __future__ import annotations
+
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from fuzzyevolve.core.embeddings import WorkerEmbeddingProvider
+from fuzzyevolve.embedding_worker import EmbeddingWorker
+
+
+class RecordingEmbedder:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed_many(self, texts):
+        self.calls.append(list(texts))
+        if "boom" in texts:
+            raise RuntimeError("model exploded")
+        return np.stack([np.array([len(t), 1.0, 0.0], dtype=np.float32) for t in texts])
+
+
+@pytest.fixture
+def worker_factory():
+    # AF_UNIX paths are length-limited, so keep them short rather than under tmp_path.
+    root = Path(tempfile.mkdtemp(prefix="fe-"))
+    workers: list[EmbeddingWorker] = []
+
+    def make(**kwargs):
+        embedder = RecordingEmbedder()
+        worker = EmbeddingWorker(
+            root / "embed.sock", embedder.embed_many, model="m", dim=3, **kwargs
+        )
+        worker.start()
+        workers.append(worker)
+        return worker, embedder
+
+    yield make
+    for worker in workers:
+        worker.close()
+
+
+def test_client_round_trips_vectors_and_caches(worker_factory):
+    worker, embedder = worker_factory(max_wait_ms=0)
+    client = WorkerEmbeddingProvider(worker.socket_path, model="m")
+
+    assert client.dim == 3
+    out = client.embed_many(["a", "bbb", "a"])
+    np.testing.assert_array_equal(out[:, 0], [1.0, 3.0, 1.0])
+    client.embed("bbb")
+    assert embedder.calls == [["a", "bbb"]]
+    assert client.cache_stats()["hits"] == 1
+
+    with pytest.raises(ValueError, match="serves 'm'"):
+        WorkerEmbeddingProvider(worker.socket_path, model="other").dim
+
+
+def test_requests_from_many_clients_share_batches(worker_factory):
+    worker, embedder = worker_factory(max_wait_ms=200, max_batch=8)
+    clients = [WorkerEmbeddingProvider(worker.socket_path) for _ in range(4)]
+    for client in clients:
+        client.dim  # connect up front so the embeds arrive together
+    barrier = threading.Barrier(len(clients))
+    results: dict[int, np.ndarray] = {}
+
+    def run(i: int) -> None:
+        barrier.wait()
+        results[i] = clients[i].embed_many(["x" * (i + 1), "y" * (i + 1)])
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(clients))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(embedder.calls) < len(clients)
+    assert worker.stats()["requests"] == len(clients)
+    for i, out in results.items():
+        assert out[:, 0].tolist() == [i + 1, i + 1]
+
+
+def test_worker_errors_reach_the_client(worker_factory):
+    worker, _ = worker_factory(max_wait_ms=0)
+    client = WorkerEmbeddingProvider(worker.socket_path)
+    with pytest.raises(RuntimeError, match="model exploded"):
+        client.embed("boom")
+    assert client.embed("fine").shape == (3,)
+
+
+def test_close_closes_every_thread_connection(worker_factory):
+    worker, _ = worker_factory(max_wait_ms=0)
+    client = WorkerEmbeddingProvider(worker.socket_path)
+    conns = []
+
+    def run(i: int) -> None:
+        client.embed_many([f"t{i}"])
+        conns.append(client._local.conn)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(c) for c in conns}) == 3
+
+    client.close()
+    assert all(conn.fileno() == -1 for conn in conns)
+    # A closed provider reconnects on next use.
+    assert client.embed("again").shape == (3,)
+    client.close()
+
+
+def test_second_worker_refuses_a_live_socket(worker_factory):
+    worker, embedder = worker_factory()
+    with pytest.raises(RuntimeError, match="already serving"):
+        EmbeddingWorker(worker.socket_path, embedder.embed_many, model="m", dim=3)
+
+
+def test_worker_refuses_to_replace_a_regular_file(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("keep me", encoding="utf-8")
+    with pytest.raises(RuntimeError, match="not a socket"):
+        EmbeddingWorker(path, RecordingEmbedder().embed_many, model="m", dim=3)
+    assert path.read_text(encoding="utf-8") == "keep me"
+
+
+def test_missing_worker_is_a_connection_error(tmp_path):
+    client = WorkerEmbeddingProvider(tmp_path / "nobody.sock")
+    with pytest.raises(ConnectionError, match="embed-worker"):
+        client.embed("x")
@@ -0,0 +1,116 @@
+"""Tests for the embedding provider's batching and bounded cache."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import types
+
+import numpy as np
+import pytest
+
+from fuzzyevolve.core.embeddings import EmbeddingCache, SentenceTransformerProvider
+
+
+class FakeSentenceTransformer:
+    def __init__(self, model_name, device=None):
+        self.calls: list[list[str]] = []
+
+    def get_sentence_embedding_dimension(self):
+        return 4
+
+    def encode(self, texts, *, convert_to_numpy, normalize_embeddings):
+        self.calls.append(list(texts))
+        return np.stack(
+            [np.array([len(t), 1.0, 0.0, 0.0], dtype=np.float32) for t in texts]
+        )
+
+
+@pytest.fixture
+def provider_factory(monkeypatch):
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = FakeSentenceTransformer
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    return SentenceTransformerProvider
+
+
+def test_embed_many_encodes_uncached_texts_in_one_call(provider_factory):
+    provider = provider_factory("fake")
+    provider.embed("a")
+    out = provider.embed_many(["a", "bb", "ccc", "bb"])
+
+    assert provider.model.calls == [["a"], ["bb", "ccc"]]
+    assert out.shape == (4, 4)
+    np.testing.assert_allclose(np.linalg.norm(out, axis=1), 1.0, rtol=1e-6)
+    np.testing.assert_array_equal(out[1], out[3])
+    assert provider.cache_stats()["hits"] == 1
+
+
+def test_cache_evicts_by_entry_count_and_bytes():
+    vec = np.zeros(4, dtype=np.float32)  # 16 bytes
+    by_count = EmbeddingCache(max_entries=2, max_bytes=1 << 20)
+    for text in ("a", "b", "c"):
+        by_count.put(text, vec.copy())
+    assert by_count.get("a") is None
+    assert by_count.get("c") is not None
+
+    by_bytes = EmbeddingCache(max_entries=100, max_bytes=40)
+    for text in ("a", "b", "c"):
+        by_bytes.put(text, vec.copy())
+    by_bytes.get("b")
+    assert by_bytes.stats() == {
+        "entries": 2,
+        "bytes": 32,
+        "hits": 1,
+        "misses": 0,
+        "evictions": 1,
+    }
+    assert by_bytes.get("a") is None
+
+
+def test_small_provider_cache_still_returns_every_vector(provider_factory):
+    provider = provider_factory("fake", cache_max_entries=1)
+    out = provider.embed_many(["x", "yy", "zzz"])
+    assert out.shape == (3, 4)
+    assert provider.cache_stats()["entries"] == 1
+    assert provider.cache_stats()["evictions"] == 2
+
+    disabled = provider_factory("fake", cache_max_entries=0)
+    disabled.embed_many(["x", "x"])
+    disabled.embed("x")
+    assert disabled.model.calls == [["x"], ["x"]]
+
+
+def test_background_load_defers_until_first_embed(monkeypatch):
+    release = threading.Event()
+
+    class SlowSentenceTransformer(FakeSentenceTransformer):
+        def __init__(self, model_name, device=None):
+            release.wait(5)
+            super().__init__(model_name, device)
+
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = SlowSentenceTransformer
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+
+    provider = SentenceTransformerProvider("fake", background=True)
+    assert not provider.loaded
+    release.set()
+    assert provider.embed("abc").shape == (4,)
+    assert provider.loaded and provider.dim == 4
+
+
+def test_background_load_error_surfaces_on_first_use(monkeypatch):
+    class Broken:
+        def __init__(self, model_name, device=None):
+            raise OSError("no such model")
+
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = Broken
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+
+    provider = SentenceTransformerProvider("missing", background=True)
+    with pytest.raises(OSError, match="no such model"):
+        provider.embed("x")
+    with pytest.raises(OSError):
+        provider.dim
@@ -0,0 +1,131 @@
+"""Tests for the offline `fake:*` model provider."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+
+import numpy as np
+import pytest
+
+from fuzzyevolve.adapters.llm import fake
+from fuzzyevolve.adapters.llm.critic import CritiqueOutput
+from fuzzyevolve.adapters.llm.operators import RewriteOutput
+from fuzzyevolve.adapters.llm.prompts import build_rank_prompt
+from fuzzyevolve.adapters.llm.ranker import RankerOutput
+from fuzzyevolve.builder import build_engine, run_engine
+from fuzzyevolve.config import Config, ModelSpec
+from fuzzyevolve.core.models import Elite
+
+
+def embed(text: str) -> np.ndarray:
+    seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:4], "big")
+    vec = np.random.default_rng(seed).normal(size=8)
+    return vec / np.linalg.norm(vec)
+
+
+def fake_config(**run) -> Config:
+    cfg = Config()
+    cfg.run.iterations = 6
+    cfg.run.random_seed = 1
+    for key, value in run.items():
+        setattr(cfg.run, key, value)
+    cfg.population.size = 5
+    cfg.metrics.names = ["m1", "m2"]
+    cfg.llm.judge_model = "fake:judge"
+    cfg.llm.ensemble = [ModelSpec(model="fake:writer", weight=1.0)]
+    for op in cfg.mutation.operators:
+        op.ensemble = None
+    cfg.llm.fake.output_chars = 120
+    return cfg
+
+
+def test_fake_outputs_are_schema_valid():
+    settings = fake.FakeLLMSettings()
+    rng = random.Random(0)
+    prompt = build_rank_prompt(
+        goal="g",
+        metrics=["clarity", "wit"],
+        items=[(0, "a"), (1, "b"), (2, "c")],
+        metric_descriptions=None,
+    )
+
+    ranking = RankerOutput.model_validate(
+        fake.fake_output_args("RankerOutput", prompt, rng=rng, settings=settings)
+    )
+    rewrite = RewriteOutput.model_validate(
+        fake.fake_output_args("RewriteOutput", "", rng=rng, settings=settings)
+    )
+    critique = CritiqueOutput.model_validate(
+        fake.fake_output_args(
+            "CritiqueOutput",
+            "- routes: 5 distinct rewrite routes.",
+            rng=rng,
+            settings=settings,
+        )
+    )
+
+    assert [r.metric for r in ranking.rankings] == ["clarity", "wit"]
+    for r in ranking.rankings:
+        assert sorted(i for tier in r.ranked_tiers for i in tier) == [0, 1, 2]
+    assert 0 < len(rewrite.text) <= settings.output_chars
+    assert len(critique.routes) == 5
+
+
+def test_sample_latency_distributions():
+    rng = random.Random(0)
+    fixed = fake.FakeLLMSettings(latency_ms=20.0)
+    uniform = fake.FakeLLMSettings(
+        latency_ms=20.0, latency_jitter_ms=5.0, latency_distribution="uniform"
+    )
+    assert fake.sample_latency_s(fixed, rng) == pytest.approx(0.02)
+    for _ in range(20):
+        assert 0.015 <= fake.sample_latency_s(uniform, rng) <= 0.025
+
+
+@pytest.mark.parametrize(
+    "run",
+    [
+        {"concurrency": "threads"},
+        {"concurrency": "asyncio", "pipeline_depth": 3},
+    ],
+)
+def test_engine_runs_end_to_end_on_fake_models(run):
+    def once() -> set[str]:
+        cfg = fake_config(**run)
+        built = build_engine(cfg, seed=cfg.run.random_seed, embed=embed)
+        run_engine(built, seed_text="seed text", resume=False)
+        return {e.text for e in built.pool.iter_elites()}
+
+    texts = once()
+    assert 1 < len(texts) <= 5
+    if run["concurrency"] == "asyncio":
+        assert once() == texts
+
+
+def test_fake_failures_surface_as_failed_calls():
+    cfg = fake_config()
+    cfg.llm.fake.failure_rate = 1.0
+    built = build_engine(cfg, seed=1, embed=embed)
+    parent = Elite(
+        text="seed",
+        embedding=embed("seed"),
+        ratings=built.rating.new_ratings(),
+        age=0,
+    )
+
+    assert built.engine.critic.critique(parent=parent) is None
+
+
+def test_engines_in_one_process_keep_their_own_fake_streams():
+    # asyncio runs are reproducible (see above), so any drift comes from sharing.
+    def texts(built) -> set[str]:
+        run_engine(built, seed_text="seed text", resume=False)
+        return {e.text for e in built.pool.iter_elites()}
+
+    alone = texts(build_engine(fake_config(concurrency="asyncio"), seed=1, embed=embed))
+
+    first = build_engine(fake_config(concurrency="asyncio"), seed=1, embed=embed)
+    second = build_engine(fake_config(concurrency="asyncio"), seed=2, embed=embed)
+    texts(second)  # must neither reseed nor advance `first`'s fake models
+    assert texts(first) == alone
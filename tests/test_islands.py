@@ -0,0 +1,144 @@
+"""Tests for island-model migration."""
+
+import json
+import queue
+import random
+import threading
+
+import numpy as np
+import trueskill as ts
+
+from fuzzyevolve.core.embedding_store import text_id
+from fuzzyevolve.core.models import Elite, IterationSnapshot
+from fuzzyevolve.core.pool import CrowdedPool
+from fuzzyevolve.islands import IslandMigrator, Migrant, island_seeds, select_migrants
+from fuzzyevolve.run_store import RunStore
+
+
+def _score(ratings: dict[str, ts.Rating]) -> float:
+    return float(ratings["m"].mu)
+
+
+def _elite(text: str, *, mu: float, embedding: list[float]) -> Elite:
+    return Elite(
+        text=text,
+        embedding=np.array(embedding, dtype=float),
+        ratings={"m": ts.Rating(mu=mu, sigma=2.0)},
+        age=3,
+    )
+
+
+def _pool(*elites: Elite) -> CrowdedPool:
+    pool = CrowdedPool(max_size=10, rng=random.Random(0), score_fn=_score)
+    pool.add_many(list(elites))
+    return pool
+
+
+def _snapshot(pool: CrowdedPool, iteration: int) -> IterationSnapshot:
+    return IterationSnapshot(
+        iteration=iteration,
+        best_score=_score(pool.best.ratings),
+        pool_size=len(pool),
+        best_elite=pool.best,
+    )
+
+
+def test_select_migrants_best_and_diverse():
+    pool = _pool(
+        _elite("a", mu=30.0, embedding=[1.0, 0.0]),
+        _elite("a2", mu=29.0, embedding=[0.99, 0.14]),
+        _elite("b", mu=10.0, embedding=[0.0, 1.0]),
+    )
+
+    best = select_migrants(pool, count=2, selection="best", score_fn=_score)
+    diverse = select_migrants(pool, count=2, selection="diverse", score_fn=_score)
+
+    assert [e.text for e in best] == ["a", "a2"]
+    assert [e.text for e in diverse] == ["a", "b"]
+
+
+def test_migrant_roundtrip_keeps_embedding_and_ratings():
+    elite = _elite("a", mu=31.5, embedding=[0.6, 0.8])
+    restored = Migrant.from_elite(elite).to_elite()
+
+    assert restored.text == "a"
+    assert restored.age == 3
+    assert np.array_equal(restored.embedding, elite.embedding)
+    assert restored.ratings["m"].mu == 31.5
+    assert restored.ratings["m"].sigma == 2.0
+
+
+def test_ring_migration_exchanges_elites(tmp_path):
+    pools = [
+        _pool(_elite("left", mu=20.0, embedding=[1.0, 0.0])),
+        _pool(_elite("right", mu=25.0, embedding=[0.0, 1.0])),
+    ]
+    inboxes = [queue.Queue(), queue.Queue()]
+    migrators = [
+        IslandMigrator(
+            island=i,
+            pool=pools[i],
+            inbox=inboxes[i],
+            outbox=inboxes[(i + 1) % 2],
+            interval=2,
+            migrants=1,
+            selection="best",
+            end_iteration=10,
+            score_fn=_score,
+            timeout_s=5.0,
+            store=RunStore(tmp_path / f"island{i}"),
+        )
+        for i in range(2)
+    ]
+
+    # Not a migration iteration: nothing is sent.
+    migrators[0](_snapshot(pools[0], 1))
+    assert inboxes[1].empty()
+
+    threads = [
+        threading.Thread(target=m, args=(_snapshot(p, 2),))
+        for m, p in zip(migrators, pools)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5.0)
+
+    assert {e.text for e in pools[0].iter_elites()} == {"left", "right"}
+    assert {e.text for e in pools[1].iter_elites()} == {"left", "right"}
+    migrated = next(e for e in pools[0].iter_elites() if e.text == "right")
+    assert migrated.ratings["m"].mu == 25.0
+
+    # Migration events carry text ids, not texts.
+    for migrator in migrators:
+        migrator.store.close()
+    store = migrators[0].store
+    events = store.events_path.read_text(encoding="utf-8").splitlines()
+    (event,) = [e for e in map(json.loads, events) if e["type"] == "migration"]
+    assert event["data"]["sent_text_ids"] == [text_id("left")]
+    assert event["data"]["received_text_ids"] == [text_id("right")]
+    assert event["data"]["accepted_text_ids"] == [text_id("right")]
+    assert store.get_text(text_id("right")) == "right"
+
+    # The final iteration never migrates.
+    migrators[0](_snapshot(pools[0], 10))
+    assert inboxes[1].empty()
+
+
+def test_island_seeds_are_stable_and_distinct():
+    assert island_seeds(7, 3) == island_seeds(7, 3)
+    assert len(set(island_seeds(7, 3))) == 3
+
+
+def test_merged_report_pool_uses_configured_metrics_and_pareto():
+    from fuzzyevolve.builder import build_pool, build_rating
+    from fuzzyevolve.config import Config
+
+    cfg = Config()
+    cfg.metrics.names = ["m", "n"]
+    cfg.multiobjective.enabled = True
+    cfg.multiobjective.pareto = True
+    pool = build_pool(cfg, rating=build_rating(cfg), max_size=3)
+    assert pool.max_size == 3
+    assert list(pool.metrics) == ["m", "n"]
+    assert pool.pareto
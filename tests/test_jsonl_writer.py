@@ -0,0 +1,79 @@
+"""Tests for the background JSONL writer behind RunStore's event logs."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from fuzzyevolve.config import RunConfig
+from fuzzyevolve.core.jsonl_writer import JsonlWriter
+from fuzzyevolve.run_store import RunStore
+
+
+def _lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_records_are_batched_per_file_in_order(tmp_path):
+    writer = JsonlWriter(flush_interval_s=60.0, fsync="batch")
+    a, b = tmp_path / "a.jsonl", tmp_path / "sub" / "b.jsonl"
+    for i in range(5):
+        writer.write(a, {"i": i})
+        writer.write(b, {"i": -i})
+    assert not a.exists()  # still waiting out the flush interval
+
+    writer.flush()
+    assert [r["i"] for r in _lines(a)] == [0, 1, 2, 3, 4]
+    assert [r["i"] for r in _lines(b)] == [0, -1, -2, -3, -4]
+    assert writer.stats()["batches"] == 1
+
+    writer.write(a, {"i": 5})
+    writer.write(a, {"bad": object()})  # logged and dropped, not fatal
+    writer.close()
+    assert [r["i"] for r in _lines(a)] == [0, 1, 2, 3, 4, 5]
+    assert writer.stats() == {"records": 11, "batches": 2, "errors": 1, "queued": 0}
+    with pytest.raises(RuntimeError):
+        writer.write(a, {"i": 6})
+
+
+def test_small_queue_applies_backpressure_without_losing_records(tmp_path):
+    writer = JsonlWriter(max_queue=2, flush_interval_s=0.0)
+    path = tmp_path / "events.jsonl"
+    for i in range(50):
+        writer.write(path, {"i": i})
+    writer.close()
+    assert [r["i"] for r in _lines(path)] == list(range(50))
+
+
+def test_run_store_records_in_background_and_flushes_on_close(tmp_path):
+    store = RunStore(tmp_path / "run")
+    store.record_event("step_start", {"parent_text_id": "x"}, iteration=1)
+    store.record_stats(iteration=1, best_score=0.5, pool_size=3)
+    store.close()
+
+    (event,) = _lines(store.events_path)
+    assert event["type"] == "step_start"
+    assert event["data"] == {"parent_text_id": "x"}
+    assert _lines(store.stats_path)[0]["best_score"] == 0.5
+
+
+def test_llm_prompt_and_output_files_are_written_in_background(tmp_path):
+    store = RunStore(tmp_path / "run", run_cfg=RunConfig(record_flush_interval_s=60.0))
+    store.record_llm_call(
+        name="rank",
+        model="m",
+        model_settings=None,
+        prompt="which is better?",
+        output={"ranking": [1, 0]},
+        iteration=1,
+    )
+    assert not list(store.llm_dir.iterdir())  # nothing written on the caller
+
+    store.flush()
+    (call,) = _lines(store.llm_index_path)
+    prompt = (store.run_dir / call["prompt_file"]).read_text(encoding="utf-8")
+    assert prompt == "which is better?"
+    output = json.loads((store.run_dir / call["output_file"]).read_text("utf-8"))
+    assert output == {"ranking": [1, 0]}
+    store.close()
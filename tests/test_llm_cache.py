@@ -0,0 +1,130 @@
+"""Tests for the LLM response cache and offline replay."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import trueskill as ts
+
+from fuzzyevolve.adapters.llm.cache import DiskResponseCache, ReplayResponseCache
+from fuzzyevolve.adapters.llm.calls import run_agent_sync
+from fuzzyevolve.adapters.llm.critic import CritiqueOutput, LLMCritic
+from fuzzyevolve.core.models import Elite
+from fuzzyevolve.run_store import RunStore
+
+
+class CountingAgent:
+    output_type = CritiqueOutput
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def run_sync(self, prompt, *, model, model_settings):
+        self.calls += 1
+        return SimpleNamespace(output=CritiqueOutput(summary=f"{prompt}#{self.calls}"))
+
+
+def _critic(**kwargs) -> LLMCritic:
+    return LLMCritic(
+        model="test-model",
+        goal="goal",
+        metrics=["m"],
+        metric_descriptions=None,
+        routes=2,
+        instructions="critique",
+        show_metric_stats=False,
+        score_lcb_c=2.0,
+        **kwargs,
+    )
+
+
+def _parent(text: str) -> Elite:
+    return Elite(
+        text=text,
+        embedding=np.array([1.0]),
+        ratings={"m": ts.Rating()},
+        age=0,
+    )
+
+
+def test_disk_cache_serves_each_occurrence_across_processes(tmp_path):
+    agent = CountingAgent()
+    first = DiskResponseCache(tmp_path)
+    outs = [
+        run_agent_sync(agent, "p", model="m", model_settings={}, cache=first)
+        for _ in range(2)
+    ]
+    assert [o.summary for o in outs] == ["p#1", "p#2"]
+
+    # A fresh cache (new run) replays both occurrences in order.
+    second = DiskResponseCache(tmp_path)
+    again = [
+        run_agent_sync(agent, "p", model="m", model_settings={}, cache=second)
+        for _ in range(2)
+    ]
+    assert [o.summary for o in again] == ["p#1", "p#2"]
+    assert agent.calls == 2
+    assert second.hits == 2
+
+    # Different settings are a different key.
+    run_agent_sync(agent, "p", model="m", model_settings={"t": 1}, cache=second)
+    assert agent.calls == 3
+
+
+def test_failed_calls_do_not_shift_later_occurrences(tmp_path):
+    agent = CountingAgent()
+    first = DiskResponseCache(tmp_path)
+    run_agent_sync(agent, "p", model="m", model_settings={}, cache=first)
+
+    real = agent.run_sync
+
+    def flaky(*a, **k):
+        agent.run_sync = real  # the retry succeeds
+        raise RuntimeError("transient")
+
+    agent.run_sync = flaky
+    with pytest.raises(RuntimeError):
+        run_agent_sync(agent, "p", model="m", model_settings={}, cache=first)
+    run_agent_sync(agent, "p", model="m", model_settings={}, cache=first)
+    assert agent.calls == 2
+
+    # A rerun without the failure hits both stored occurrences.
+    rerun = DiskResponseCache(tmp_path)
+    outs = [
+        run_agent_sync(agent, "p", model="m", model_settings={}, cache=rerun)
+        for _ in range(2)
+    ]
+    assert [o.summary for o in outs] == ["p#1", "p#2"]
+    assert rerun.hits == 2
+    assert agent.calls == 2
+
+
+def test_replay_answers_from_llm_jsonl_without_calling_out(tmp_path):
+    store = RunStore(tmp_path / "run")
+    recording = _critic(store=store)
+    recording.agent.run_sync = lambda *a, **k: SimpleNamespace(
+        output=CritiqueOutput(summary="recorded", routes=["r1"])
+    )
+    assert recording.critique(parent=_parent("a")).summary == "recorded"
+
+    def _fail(*a, **k):
+        raise RuntimeError("boom")
+
+    recording.agent.run_sync = _fail
+    assert recording.critique(parent=_parent("b")) is None
+
+    store.flush()
+    replay = ReplayResponseCache.from_run_dir(store.run_dir)
+    replaying = _critic(response_cache=replay)
+    replaying.agent.run_sync = _fail  # any real call would be a bug
+
+    critique = replaying.critique(parent=_parent("a"))
+    assert critique.summary == "recorded"
+    assert critique.routes == ("r1",)
+    # Recorded failures replay as failures; unseen prompts are misses.
+    assert replaying.critique(parent=_parent("b")) is None
+    assert replaying.critique(parent=_parent("c")) is None
+    assert replay.hits == 2
+    assert replay.misses == 1
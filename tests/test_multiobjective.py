@@ -3,10 +3,18 @@ from __future__ import annotations
 import random
 
 import numpy as np
+import pytest
 import trueskill as ts
 
 from fuzzyevolve.core.models import Elite
-from fuzzyevolve.core.multiobjective import Scalarizer
+from fuzzyevolve.core.multiobjective import (
+    Scalarizer,
+    crowding_distance,
+    dominance_matrix,
+    dominates,
+    nondominated_fronts,
+    nondominated_indices,
+)
 from fuzzyevolve.core.pool import CrowdedPool
 from fuzzyevolve.core.selection import MixedParentSelector
 
@@ -91,3 +99,66 @@ def test_pareto_weighted_selection_sweeps_tradeoffs():
 
     scalarizer.set_weights({"m1": 0.5, "m2": 0.5})
     assert selector.select_parent(pool).text == "c"
+
+
+def _brute_nondominated(vectors):
+    return [
+        i
+        for i, v in enumerate(vectors)
+        if not any(dominates(w, v) for j, w in enumerate(vectors) if j != i)
+    ]
+
+
+def test_vectorized_nondominated_matches_pairwise_dominates():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        n = int(rng.integers(0, 30))
+        m = int(rng.integers(1, 4))
+        # Small integer grid so ties and duplicates are common.
+        vectors = rng.integers(0, 4, size=(n, m)).astype(float).tolist()
+        expected = _brute_nondominated(vectors)
+        assert nondominated_indices(vectors) == expected
+        assert nondominated_indices(np.asarray(vectors)) == expected
+
+        fronts = nondominated_fronts(vectors)
+        assert (fronts[0] if fronts else []) == expected
+        assert sorted(i for front in fronts for i in front) == list(range(n))
+        for rank, front in enumerate(fronts[1:], start=1):
+            remaining = [i for f in fronts[rank:] for i in f]
+            sub = [vectors[i] for i in remaining]
+            assert [remaining[i] for i in _brute_nondominated(sub)] == front
+
+        dom = dominance_matrix(vectors)
+        for i in range(n):
+            for j in range(n):
+                assert dom[i, j] == (i != j and dominates(vectors[i], vectors[j]))
+
+
+def test_crowding_distance_marks_boundaries_infinite():
+    dist = crowding_distance([[0.0, 4.0], [1.0, 3.0], [3.0, 1.0], [4.0, 0.0]])
+    assert np.isinf(dist[0]) and np.isinf(dist[3])
+    assert dist[1] == pytest.approx(3 / 4 + 3 / 4)
+    assert dist[2] == pytest.approx(3 / 4 + 3 / 4)
+    assert np.isinf(crowding_distance([[1.0], [2.0]])).all()
+
+
+def test_pareto_front_pruning_keeps_best_front_and_spread():
+    front = [
+        _elite("f0", m1=10.0, m2=0.0),
+        _elite("f1", m1=7.0, m2=3.0),
+        _elite("f2", m1=6.0, m2=4.0),
+        _elite("f3", m1=0.0, m2=10.0),
+    ]
+    dominated = _elite("d", m1=5.0, m2=2.0)
+    pool = CrowdedPool(
+        max_size=3,
+        rng=random.Random(0),
+        score_fn=lambda r: float(r["m1"].mu + r["m2"].mu),
+        pruning_strategy="pareto_front",
+        metrics=["m1", "m2"],
+        score_lcb_c=0.0,
+    )
+    pool.add_many([dominated, *front])
+    # d is the whole second front; of the first front f1 has the smallest
+    # crowding distance (0.8 vs 1.4 for f2; f0/f3 are boundaries).
+    assert {e.text for e in pool.iter_elites()} == {"f0", "f2", "f3"}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import random
 
 import numpy as np
@@ -166,3 +167,55 @@ def test_crossover_operator_receives_partners():
     )
 
     assert crossover.partners_seen == [("farthest", "far")]
+
+
+class AsyncDummyOperator(DummyOperator):
+    async def apropose(
+        self,
+        *,
+        parent: Elite,
+        partners: list[Elite] | tuple[Elite, ...] | None = None,
+        critique: Critique | None,
+        focus: str | None = None,
+    ):
+        return self.propose(
+            parent=parent, partners=partners, critique=critique, focus=focus
+        )
+
+
+def test_operator_mutator_apropose_mixes_async_and_sync_operators():
+    parent = _make_parent()
+    exploit = AsyncDummyOperator("exploit")
+    explore = DummyOperator("explore")
+
+    pool = CrowdedPool(max_size=10, rng=random.Random(0), score_fn=lambda _r: 0.0)
+    mutator = OperatorMutator(
+        pool=pool,
+        operators={"exploit": exploit, "explore": explore},
+        specs=[
+            OperatorSpec(
+                name="exploit",
+                role="exploit",
+                min_jobs=2,
+                weight=1.0,
+                uncertainty_scale=0.5,
+            ),
+            OperatorSpec(
+                name="explore",
+                role="explore",
+                min_jobs=2,
+                weight=1.0,
+                uncertainty_scale=2.0,
+            ),
+        ],
+        jobs_per_iteration=4,
+        rng=random.Random(0),
+    )
+
+    candidates = asyncio.run(
+        mutator.apropose(parent=parent, critique=None, max_candidates=10)
+    )
+
+    assert len(exploit.calls) == 2
+    assert len(explore.calls) == 2
+    assert {c.operator for c in candidates} == {"exploit", "explore"}
@@ -3,6 +3,7 @@
 import random
 
 import numpy as np
+import pytest
 import trueskill as ts
 
 from fuzzyevolve.core.models import Elite
@@ -45,6 +46,25 @@ def test_pool_eliminates_weaker_of_closest_pair():
     assert pool.best.text == "e2"
 
 
+def test_restore_keeps_members_in_order_and_prunes_only_overflow():
+    def members(n: int) -> list[Elite]:
+        return [
+            _elite(f"e{i}", mu=float(i), embedding=np.array([1.0, 0.001 * i]))
+            for i in range(n)
+        ]
+
+    pool = CrowdedPool(max_size=3, score_fn=lambda r: float(r["m"].mu))
+    pool.restore(members(3))
+    assert [e.text for e in pool.iter_elites()] == ["e0", "e1", "e2"]
+    np.testing.assert_allclose(pool.embedding_matrix()[2], [1.0, 0.002], rtol=1e-6)
+    with pytest.raises(ValueError):
+        pool.restore(members(1))
+
+    smaller = CrowdedPool(max_size=2, score_fn=lambda r: float(r["m"].mu))
+    smaller.restore(members(3))
+    assert len(smaller) == 2
+
+
 def test_pool_knn_local_competition_replaces_worst_in_neighborhood():
     pool = CrowdedPool(
         max_size=3,
@@ -83,3 +103,153 @@ def test_pool_knn_local_competition_discards_worse_candidate():
 
     texts = {e.text for e in pool.iter_elites()}
     assert texts == {"e1", "e2", "e3"}
+
+
+def test_pool_matrix_tracks_members_through_swap_removal():
+    rng = np.random.default_rng(0)
+    pool = CrowdedPool(
+        max_size=6, rng=random.Random(0), score_fn=lambda r: float(r["m"].mu)
+    )
+    for batch in range(5):
+        elites = []
+        for i in range(4):
+            vec = rng.normal(size=5)
+            elites.append(
+                _elite(
+                    f"b{batch}-{i}", mu=float(i), embedding=vec / np.linalg.norm(vec)
+                )
+            )
+        pool.add_many(elites)
+
+        members = list(pool.iter_elites())
+        assert len(members) <= 6
+        expected = np.array([m.embedding for m in members], dtype=np.float32)
+        np.testing.assert_allclose(pool._vectors(), expected)
+        assert pool._slots == {m.text: idx for idx, m in enumerate(members)}
+
+
+def test_pool_vectorized_queries_match_pairwise_distances():
+    rng = np.random.default_rng(1)
+    pool = CrowdedPool(
+        max_size=40, rng=random.Random(0), score_fn=lambda r: float(r["m"].mu)
+    )
+    vecs = rng.normal(size=(40, 8))
+    vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+    pool.add_many([_elite(f"e{i}", mu=0.0, embedding=v) for i, v in enumerate(vecs)])
+    members = list(pool.iter_elites())
+
+    pairs = [
+        (1.0 - float(np.dot(a.embedding, b.embedding)), i, j)
+        for i, a in enumerate(members)
+        for j, b in enumerate(members)
+        if i < j
+    ]
+    _dist, i, j = min(pairs)
+    assert pool._closest_pair_indices() == (i, j)
+
+    query = members[3].embedding
+    by_dist = sorted(
+        range(len(members)),
+        key=lambda idx: (1.0 - float(np.dot(query, members[idx].embedding)), idx),
+    )
+    assert pool._knn_indices(query, k=5) == by_dist[:5]
+
+    far = pool.farthest_from(members[3], exclude_texts={members[by_dist[-1]].text})
+    assert far is members[by_dist[-2]]
+    assert (
+        pool.farthest_from(members[3], exclude_texts={m.text for m in members}) is None
+    )
+
+
+def test_pool_nearest_neighbour_cache_matches_brute_force():
+    rng = np.random.default_rng(2)
+    pool = CrowdedPool(
+        max_size=30, rng=random.Random(0), score_fn=lambda r: float(r["m"].mu)
+    )
+    for batch in range(12):
+        vecs = rng.normal(size=(8, 6))
+        vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+        pool.add_many(
+            [
+                _elite(f"b{batch}-{i}", mu=float(rng.normal()), embedding=v)
+                for i, v in enumerate(vecs)
+            ]
+        )
+        if len(pool) < 2:
+            continue
+
+        vectors = np.array([m.embedding for m in pool.iter_elites()])
+        sims = vectors @ vectors.T
+        np.fill_diagonal(sims, -np.inf)
+        i, j = pool._closest_pair_indices()
+        n = len(pool)
+        np.testing.assert_allclose(pool._nn_sim[:n], sims.max(axis=1), rtol=1e-5)
+        assert sims[i, j] == pytest.approx(sims.max(), rel=1e-5)
+
+
+def test_lsh_knn_index_tracks_swap_removal_and_finds_near_neighbours():
+    rng = np.random.default_rng(3)
+    pool = CrowdedPool(
+        max_size=200,
+        rng=random.Random(0),
+        score_fn=lambda r: float(r["m"].mu),
+        pruning_strategy="knn_local_competition",
+        knn_k=3,
+        knn_index="lsh",
+        lsh_tables=6,
+        lsh_bits=4,
+    )
+    vecs = rng.normal(size=(300, 16))
+    vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+    pool.add_many(
+        [
+            _elite(f"e{i}", mu=float(rng.normal()), embedding=v)
+            for i, v in enumerate(vecs)
+        ]
+    )
+    members = list(pool.iter_elites())
+    assert len(members) == 200
+
+    index = pool._knn
+    assert set(index._keys) == set(range(len(members)))
+    for slot, member in enumerate(members):
+        expected = index._hash(np.asarray(member.embedding, dtype=np.float32))
+        np.testing.assert_array_equal(index._keys[slot], expected)
+
+    # A member's own embedding always shares its buckets, so it ranks first.
+    for slot in (0, 57, 199):
+        assert pool._knn_indices(members[slot].embedding, k=3)[0] == slot
+
+
+def test_pool_rejects_unknown_knn_index():
+    with pytest.raises(ValueError, match="knn_index"):
+        CrowdedPool(max_size=2, score_fn=lambda r: 0.0, knn_index="hnsw")
+
+
+def test_pool_score_cache_refreshes_only_invalidated_members():
+    calls: list[float] = []
+
+    def score(ratings):
+        calls.append(ratings["m"].mu)
+        return float(ratings["m"].mu)
+
+    pool = CrowdedPool(max_size=10, rng=random.Random(0), score_fn=score)
+    elites = [
+        _elite(f"e{i}", mu=float(i), embedding=np.array([1.0, float(i)]))
+        for i in range(4)
+    ]
+    pool.add_many(elites)
+    assert pool.best.text == "e3"
+    assert len(calls) == 4
+
+    calls.clear()
+    assert [e.text for e, _s in pool.ranked(2)] == ["e3", "e2"]
+    assert calls == []
+
+    elites[0].ratings["m"] = ts.Rating(mu=10.0, sigma=1.0)
+    assert pool.best.text == "e3"  # not invalidated yet
+    pool.invalidate_scores([elites[0]])
+    assert pool.best.text == "e0"
+    assert calls == [10.0]
+    assert pool.score_summary()["max_score"] == 10.0
+    np.testing.assert_allclose(pool.scores(), [10.0, 1.0, 2.0, 3.0])
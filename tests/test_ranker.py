@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import random
 from types import SimpleNamespace
 
@@ -71,3 +72,16 @@ def test_ranker_invalid_after_retries():
     ranker.agent.run_sync = lambda *args, **kwargs: SimpleNamespace(output=invalid)
     with pytest.raises(RuntimeError):
         ranker.rank(metrics=["m1"], battle=battle)
+
+
+def test_ranker_arank_uses_async_agent():
+    ranker = LLMRanker(model="mock", rng=random.Random(0), max_attempts=1)
+    battle = make_battle([make_elite("a", "m1"), make_elite("b", "m1")])
+    valid = RankerOutput(rankings=[MetricRanking(metric="m1", ranked_tiers=[[0, 1]])])
+
+    async def _run(*args, **kwargs):
+        return SimpleNamespace(output=valid)
+
+    ranker.agent.run = _run
+    ranking = asyncio.run(ranker.arank(metrics=["m1"], battle=battle))
+    assert ranking.tiers_by_metric["m1"] == [[0, 1]]
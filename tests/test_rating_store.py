@@ -0,0 +1,108 @@
+"""Tests for array-backed ratings owned by the pool."""
+
+import pickle
+import random
+
+import numpy as np
+import pytest
+import trueskill as ts
+
+from fuzzyevolve.core.models import Elite
+from fuzzyevolve.core.pool import CrowdedPool
+from fuzzyevolve.core.rating_store import RatingStore, RatingsView
+from fuzzyevolve.core.ratings import RatingSystem
+
+
+def _elite(text: str, mu: float, *, x: float) -> Elite:
+    return Elite(
+        text=text,
+        embedding=np.array([1.0, x]) / np.hypot(1.0, x),
+        ratings={"a": ts.Rating(mu=mu, sigma=2.0), "b": ts.Rating(mu=mu, sigma=3.0)},
+        age=0,
+    )
+
+
+def test_view_reads_and_writes_through_to_the_store():
+    store = RatingStore(["a"])
+    view = store.bind(0, {"a": ts.Rating(25.0, 8.0)})
+
+    assert "a" in view and "b" not in view
+    view["b"] = ts.Rating(20.0, 4.0)
+    assert list(view) == ["a", "b"]
+    mu, sigma = store.gather([0], ["b", "a", "missing"])
+    assert mu[0, :2].tolist() == [20.0, 25.0]
+    assert np.isnan(mu[0, 2]) and sigma[0, 1] == 8.0
+
+    del view["a"]
+    assert dict(view) == {"b": view["b"]}
+    with pytest.raises(KeyError):
+        view["a"]
+
+
+def test_pool_binds_ratings_and_tracks_rows_through_removal():
+    rating = RatingSystem(["a", "b"])
+    pool = CrowdedPool(
+        max_size=3,
+        rng=random.Random(0),
+        score_fn=rating.score,
+        metrics=["a", "b"],
+        score_rows=rating.score_rows,
+    )
+    elites = [_elite(f"e{i}", 20.0 + i, x=float(i)) for i in range(3)]
+    pool.add_many(elites)
+    assert all(isinstance(e.ratings, RatingsView) for e in elites)
+
+    # The newcomer lands next to e0 and is the weaker of that closest pair.
+    loser = _elite("e3", 10.0, x=0.05)
+    pool.add(loser)
+    assert not pool.contains_text("e3")
+    assert not pool._ratings.owns(loser.ratings)
+    assert loser.ratings["a"].mu == 10.0
+
+    members = list(pool.iter_elites())
+    mu, _sigma = pool.rating_matrix()
+    assert mu[:, 0].tolist() == [e.ratings["a"].mu for e in members]
+
+    members[0].ratings["a"] = ts.Rating(99.0, 1.0)
+    pool.invalidate_scores([members[0]])
+    assert pool.best is members[0]
+    assert pool.scores()[0] == pytest.approx(rating.score(members[0].ratings))
+
+
+def test_removed_member_keeps_its_ratings():
+    pool = CrowdedPool(
+        max_size=1, rng=random.Random(0), score_fn=lambda r: float(r["a"].mu)
+    )
+    weak = _elite("weak", 1.0, x=0.0)
+    strong = _elite("strong", 5.0, x=0.1)
+    pool.add(weak)
+    view = weak.ratings
+    pool.add(strong)
+
+    assert [e.text for e in pool.iter_elites()] == ["strong"]
+    assert view["a"].mu == 1.0
+    view["a"] = ts.Rating(7.0, 1.0)
+    assert strong.ratings["a"].mu == 5.0
+
+
+def test_views_pickle_as_plain_dicts():
+    pool = CrowdedPool(max_size=2, score_fn=lambda r: 0.0)
+    elite = _elite("e", 3.0, x=0.0)
+    pool.add(elite)
+
+    restored = pickle.loads(pickle.dumps(elite))
+    assert type(restored.ratings) is dict
+    assert restored.ratings["b"].sigma == 3.0
+
+
+def test_ucb_matrix_covers_members_and_outsiders():
+    pool = CrowdedPool(max_size=4, score_fn=lambda r: 0.0, metrics=["a", "b"])
+    inside = _elite("in", 3.0, x=0.0)
+    outside = _elite("out", 4.0, x=1.0)
+    del outside.ratings["b"]
+    pool.add(inside)
+
+    got = pool.ucb_matrix([inside, outside], metrics=["a", "b"], beta=0.5).tolist()
+    # Pool members are gathered from the store; outsiders read their own
+    # ratings, with -inf for a missing metric.
+    assert got == [[3.0 + 0.5 * 2.0, 3.0 + 0.5 * 3.0], [4.0 + 0.5 * 2.0, float("-inf")]]
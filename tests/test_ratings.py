@@ -8,6 +8,7 @@ import trueskill as ts
 
 from fuzzyevolve.core.models import Anchor, Elite
 from fuzzyevolve.core.ratings import BattleRanking, RatingSystem
+from fuzzyevolve.core.trueskill_numpy import rate_ffa
 
 
 def test_apply_ranking_skips_frozen_indices():
@@ -31,3 +32,68 @@ def test_score_uses_lcb():
     rating = RatingSystem(["m1"], score_lcb_c=2.0)
     score = rating.score({"m1": ts.Rating(mu=10.0, sigma=1.5)})
     assert score == pytest.approx(10.0 - 2.0 * 1.5)
+
+
+def _rate_with_trueskill(env, mu, sigma, ranks):
+    groups = [[ts.Rating(mu=m, sigma=s)] for m, s in zip(mu, sigma)]
+    out = env.rate(groups, ranks=list(ranks))
+    return [g[0].mu for g in out], [g[0].sigma for g in out]
+
+
+def test_numpy_ffa_matches_trueskill_package():
+    env = ts.TrueSkill(draw_probability=0.2)
+    margin = ts.calc_draw_margin(0.2, 2, env)
+    rng = np.random.default_rng(0)
+    for n in (2, 3, 7, 18, 30):
+        rows = 6
+        mu = rng.uniform(10.0, 40.0, size=(rows, n))
+        sigma = rng.uniform(0.5, 9.0, size=(rows, n))
+        # Coarse ranks so most battles contain ties.
+        ranks = rng.integers(0, max(2, n // 3), size=(rows, n))
+        got_mu, got_sigma = rate_ffa(
+            mu, sigma, ranks, beta=env.beta, tau=env.tau, draw_margin=margin
+        )
+        for row in range(rows):
+            exp_mu, exp_sigma = _rate_with_trueskill(
+                env, mu[row], sigma[row], ranks[row]
+            )
+            np.testing.assert_allclose(got_mu[row], exp_mu, rtol=1e-6, atol=1e-5)
+            np.testing.assert_allclose(got_sigma[row], exp_sigma, rtol=1e-6, atol=1e-5)
+
+
+def test_numpy_backend_apply_ranking_matches_trueskill_backend():
+    metrics = ["m1", "m2", "m3"]
+    players = {}
+    for backend in ("trueskill", "numpy"):
+        rating = RatingSystem(metrics, backend=backend)
+        players[backend] = [
+            Elite(
+                text=str(i),
+                embedding=np.array([1.0]),
+                ratings={
+                    m: ts.Rating(mu=25.0 + i - j, sigma=8.0 - 0.3 * i)
+                    for j, m in enumerate(metrics)
+                },
+                age=0,
+            )
+            for i in range(12)
+        ]
+        ranking = BattleRanking(
+            tiers_by_metric={
+                "m1": [[0, 1, 2], [3], [4, 5, 6, 7, 8], [9, 10, 11]],
+                "m2": [[i] for i in range(11, -1, -1)],
+                "m3": [list(range(12))],
+            }
+        )
+        rating.apply_ranking(players[backend], ranking, frozen_indices={4})
+
+    for ref, got in zip(players["trueskill"], players["numpy"]):
+        for m in metrics:
+            assert got.ratings[m].mu == pytest.approx(ref.ratings[m].mu, abs=1e-5)
+            assert got.ratings[m].sigma == pytest.approx(ref.ratings[m].sigma, abs=1e-5)
+    assert players["numpy"][4].ratings["m1"].mu == pytest.approx(25.0 + 4)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        RatingSystem(["m1"], backend="scipy")
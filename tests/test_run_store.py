@@ -79,7 +79,7 @@ def test_run_store_checkpoint_and_resume(tmp_path: Path):
     assert store.latest_checkpoint_path().is_file()
     assert (store.checkpoints_dir / "it000001.json").is_file()
     assert (store.checkpoints_dir / "it000002.json").is_file()
-    assert len(list(store.texts_dir.glob("*.txt"))) >= 3
+    assert len(store.text_store) >= 3
 
     cfg2 = Config.model_validate(cfg.model_dump())
     cfg2.run.iterations = 1
@@ -128,3 +128,170 @@ def test_run_store_checkpoint_and_resume(tmp_path: Path):
     engine2.resume(start_iteration=loaded.next_iteration)
 
     assert (store2.checkpoints_dir / "it000003.json").is_file()
+
+
+def _ratings_by_id(data: dict) -> dict:
+    return {m["text_id"]: m["ratings"] for m in data["population"]["members"]}
+
+
+def test_journal_replays_deltas_onto_the_snapshot(tmp_path: Path):
+    import trueskill as ts
+
+    from fuzzyevolve.core.models import Elite
+
+    def elite(text: str, mu: float, x: float) -> Elite:
+        return Elite(
+            text=text,
+            embedding=np.array([1.0, x]) / np.hypot(1.0, x),
+            ratings={"m": ts.Rating(mu, 5.0)},
+            age=0,
+        )
+
+    pool = CrowdedPool(max_size=3, score_fn=lambda r: float(r["m"].mu))
+    pool.add_many([elite("a", 1.0, 0.0), elite("b", 2.0, 1.0), elite("c", 3.0, 3.0)])
+    store = RunStore(tmp_path / "run")
+    store.save_checkpoint(
+        iteration=1, pool=pool, anchor_manager=None, keep=False, snapshot_interval=10
+    )
+
+    for it, (text, mu, x) in enumerate([("d", 9.0, 0.05), ("e", 8.0, 3.05)], start=2):
+        pool.add(elite(text, mu, x))  # evicts its weaker near neighbour
+        members = list(pool.iter_elites())
+        members[0].ratings["m"] = ts.Rating(members[0].ratings["m"].mu + 1, 4.0)
+        store.save_checkpoint(
+            iteration=it,
+            pool=pool,
+            anchor_manager=None,
+            keep=False,
+            snapshot_interval=10,
+        )
+
+    header, *deltas = store.journal_path.read_text(encoding="utf-8").splitlines()
+    assert header == '{"snapshot": 1}'
+    assert len(deltas) == 2
+    assert all('"removed": ["' in line for line in deltas)
+    # A torn append from a crash is ignored.
+    with store.journal_path.open("a", encoding="utf-8") as f:
+        f.write('{"next_iteration": 4, "add')
+
+    reference = RunStore(tmp_path / "ref")
+    reference.save_checkpoint(iteration=3, pool=pool, anchor_manager=None, keep=True)
+    expected = reference.read_checkpoint(reference.checkpoints_dir / "it000003.json")
+
+    replayed = RunStore.open(store.run_dir).read_checkpoint()
+    assert replayed["next_iteration"] == 3
+    assert _ratings_by_id(replayed) == _ratings_by_id(expected)
+
+    # The next snapshot compacts the journal away.
+    store.save_checkpoint(
+        iteration=11, pool=pool, anchor_manager=None, keep=False, snapshot_interval=10
+    )
+    assert store.journal_path.read_text(encoding="utf-8") == '{"snapshot": 11}\n'
+    assert _ratings_by_id(store.read_checkpoint()) == _ratings_by_id(expected)
+
+
+def test_binary_snapshot_resumes_without_reading_or_embedding_texts(tmp_path: Path):
+    import trueskill as ts
+
+    from fuzzyevolve.core.models import Elite
+
+    rng = np.random.default_rng(0)
+
+    def elite(text: str, mu: float) -> Elite:
+        vec = rng.standard_normal(4)
+        return Elite(
+            text=text,
+            embedding=vec / np.linalg.norm(vec),
+            ratings={"m": ts.Rating(mu, 5.0)},
+            age=int(mu),
+        )
+
+    pool = CrowdedPool(max_size=8, score_fn=lambda r: float(r["m"].mu))
+    pool.add_many([elite(f"e{i} ✓", float(i)) for i in range(6)])
+    store = RunStore(tmp_path / "run")
+    save = dict(anchor_manager=None, keep=False, snapshot_interval=10, binary=True)
+    store.save_checkpoint(iteration=1, pool=pool, **save)
+    pool.add(elite("late", 7.0))
+    first = next(iter(pool.iter_elites()))
+    first.ratings["m"] = ts.Rating(42.0, 1.0)
+    store.save_checkpoint(iteration=2, pool=pool, **save)
+
+    embedded: list[str] = []
+
+    def embed_many(texts):
+        embedded.extend(texts)
+        return np.stack([np.array([1.0, 0.0, 0.0, 0.0]) for _ in texts])
+
+    def load(run: RunStore, checkpoint_path: Path | None = None):
+        return run.load_checkpoint(
+            cfg=Config(),
+            checkpoint_path=checkpoint_path,
+            embed=lambda t: embed_many([t])[0],
+            embed_many=embed_many,
+            pool_factory=lambda: CrowdedPool(
+                max_size=8, score_fn=lambda r: float(r["m"].mu)
+            ),
+            anchor_factory=lambda _cfg: None,
+        )
+
+    loaded = load(RunStore.open(store.run_dir))
+    assert embedded == ["late"]  # only the journaled newcomer
+    assert loaded.next_iteration == 2
+    restored = {e.text: e for e in loaded.pool.iter_elites()}
+    assert set(restored) == {e.text for e in pool.iter_elites()}
+    assert restored[first.text].ratings["m"].mu == 42.0
+    np.testing.assert_allclose(
+        restored["e3 ✓"].embedding, _member_embedding(pool, "e3 ✓")
+    )
+
+    # A snapshot written without the binary file makes the .npz stale.
+    store.save_checkpoint(
+        iteration=3, pool=pool, **{**save, "keep": True, "binary": False}
+    )
+    embedded.clear()
+    load(RunStore.open(store.run_dir))
+    assert len(embedded) == len(pool)
+
+    # Naming the stale .npz explicitly falls back to the JSON snapshot too,
+    # as does a missing journal.
+    for _ in range(2):
+        embedded.clear()
+        resumed = load(RunStore.open(store.run_dir), store.binary_checkpoint_path)
+        assert resumed.next_iteration == 3
+        assert len(embedded) == len(pool)
+        store.journal_path.unlink(missing_ok=True)
+
+
+def test_text_ids_are_hashed_once_and_carried_on_elites(tmp_path: Path, monkeypatch):
+    import trueskill as ts
+
+    from fuzzyevolve.core import text_store
+    from fuzzyevolve.core.models import Elite
+
+    hashed: list[str] = []
+    real_text_id = text_store.text_id
+
+    def counting_text_id(text: str) -> str:
+        hashed.append(text)
+        return real_text_id(text)
+
+    monkeypatch.setattr(text_store, "text_id", counting_text_id)
+    store = RunStore(tmp_path / "run")
+    elite = Elite(
+        text="parent", embedding=np.ones(2), ratings={"m": ts.Rating()}, age=0
+    )
+    for _ in range(3):
+        assert store.text_id_of(elite) == real_text_id("parent")
+        assert store.put_text("child") == real_text_id("child")
+    assert hashed == ["parent", "child"]
+    assert elite.text_id == real_text_id("parent")
+    assert elite.clone().text_id == elite.text_id
+
+    pool = CrowdedPool(max_size=2, score_fn=lambda r: float(r["m"].mu))
+    pool.add(elite)
+    store.save_checkpoint(iteration=1, pool=pool, anchor_manager=None, keep=False)
+    assert hashed == ["parent", "child"]
+
+
+def _member_embedding(pool: CrowdedPool, text: str) -> np.ndarray:
+    return next(e.embedding for e in pool.iter_elites() if e.text == text)
@@ -0,0 +1,84 @@
+"""Tests for the packed, append-only run text store."""
+
+from __future__ import annotations
+
+import pytest
+
+from fuzzyevolve.core.embedding_store import text_id
+from fuzzyevolve.core.text_store import TextStore
+from fuzzyevolve.run_store import RunStore
+
+
+def test_texts_round_trip_and_survive_reopen(tmp_path):
+    store = TextStore(tmp_path / "texts", compression="zlib")
+    long_text = "The sky shattered. " * 200
+    ids = [store.put("short"), store.put(long_text), store.put("short")]
+    assert ids[0] == ids[2] == text_id("short")
+    assert len(store) == 2
+    store.close()
+
+    # Compression is remembered; only texts zlib actually shrinks are stored packed.
+    reopened = TextStore(tmp_path / "texts")
+    assert reopened.compression == "zlib"
+    assert reopened.get(ids[0]) == "short"
+    assert reopened.get(ids[1]) == long_text
+    assert reopened.data_path.stat().st_size < len(long_text)
+    with pytest.raises(KeyError):
+        reopened.get(text_id("never stored"))
+
+
+def test_torn_index_line_is_ignored(tmp_path):
+    store = TextStore(tmp_path / "texts")
+    kept = store.put("kept")
+    store.close()
+    with store.index_path.open("ab") as f:
+        f.write(b"deadbeef 4 1")  # crash mid-append: no newline
+
+    reopened = TextStore(tmp_path / "texts")
+    assert len(reopened) == 1
+    assert reopened.get(kept) == "kept"
+
+    # Appending after the crash must not glue onto the torn bytes.
+    added = reopened.put("added")
+    reopened.close()
+    again = TextStore(tmp_path / "texts")
+    assert again.get(kept) == "kept"
+    assert again.get(added) == "added"
+    assert len(again) == 2
+
+
+def test_malformed_index_lines_are_skipped(tmp_path):
+    store = TextStore(tmp_path / "texts")
+    kept = store.put("kept")
+    store.close()
+    with store.index_path.open("ab") as f:
+        f.write(b"deadbeef 4 1deadbeef 9 9 r\n")
+
+    reopened = TextStore(tmp_path / "texts")
+    assert len(reopened) == 1
+    assert reopened.get(kept) == "kept"
+
+
+def test_reader_sees_texts_appended_after_it_opened(tmp_path):
+    writer = TextStore(tmp_path / "texts")
+    first = writer.put("first")
+    reader = TextStore(tmp_path / "texts")
+    second = writer.put("second")
+
+    assert second not in reader
+    assert reader.get(second) == "second"
+    assert reader.get(first) == "first"
+
+
+def test_legacy_text_files_are_read_and_migrated(tmp_path):
+    run_dir = tmp_path / "run"
+    texts = run_dir / "texts"
+    texts.mkdir(parents=True)
+    legacy_id = text_id("old text")
+    (texts / f"{legacy_id}.txt").write_text("old text", encoding="utf-8")
+
+    store = RunStore(run_dir)
+    assert store.get_text(legacy_id) == "old text"
+    assert store.migrate_text_files() == 1
+    assert not list(texts.glob("*.txt"))
+    assert RunStore.open(run_dir).get_text(legacy_id) == "old text"